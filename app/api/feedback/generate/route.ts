@@ -1,9 +1,6 @@
-import { exec } from "child_process";
-import { promisify } from "util";
 import { db, auth } from "@/firebase/admin";
 import { calculateProfileCompletion } from "@/lib/utils/profile";
-
-const execAsync = promisify(exec);
+import { runPythonScript } from "@/lib/utils/python.mjs";
 
 export async function POST(request: Request) {
   try {
@@ -35,6 +32,9 @@ export async function POST(request: Request) {
       .join(' ')
       .trim() || '';
 
+    // Candidate answers grouped per asked question, scored against the reference answers
+    const answerPairs = buildAnswerPairs(transcript, interviewData);
+
     if (!transcriptText) {
       return Response.json({ 
         success: false, 
@@ -177,7 +177,7 @@ export async function POST(request: Request) {
     if (!isProfileComplete) {
       console.warn('⚠️ Profile incomplete, skipping prediction');
       // Still generate feedback but without prediction
-      const speechAnalysis = await analyzeSpeechWithML(transcriptText);
+      const speechAnalysis = await analyzeSpeechWithML(transcriptText, answerPairs);
       const feedback = await generateComprehensiveFeedback({
         transcriptText,
         speechAnalysis,
@@ -197,7 +197,7 @@ export async function POST(request: Request) {
     }
 
     // Call ML models for comprehensive analysis
-    const speechAnalysis = await analyzeSpeechWithML(transcriptText);
+    const speechAnalysis = await analyzeSpeechWithML(transcriptText, answerPairs);
     
     // Get interview prediction (required - no fallback)
     let interviewPrediction: any = null;
@@ -246,20 +246,39 @@ export async function POST(request: Request) {
   }
 }
 
-async function analyzeSpeechWithML(transcriptText: string) {
+function buildAnswerPairs(transcript: any[], interviewData: any) {
+  const questions: string[] = interviewData?.questions || [];
+  const answersByQuestion = new Map<string, string[]>();
+  let currentQuestion: string | undefined;
+
+  for (const msg of transcript || []) {
+    if (msg?.role === 'interviewer' || msg?.role === 'assistant') {
+      currentQuestion = msg.content;
+      continue;
+    }
+    const question = typeof msg?.questionIndex === 'number' && questions[msg.questionIndex]
+      ? questions[msg.questionIndex]
+      : currentQuestion;
+    if (!question || !msg?.content) continue;
+    answersByQuestion.set(question, [...(answersByQuestion.get(question) || []), msg.content]);
+  }
+
+  return Array.from(answersByQuestion, ([question, parts]) => ({
+    question,
+    transcript: parts.join(' ').trim()
+  }));
+}
+
+async function analyzeSpeechWithML(transcriptText: string, answerPairs: { question: string; transcript: string }[] = []) {
   try {
     console.log('🎤 Analyzing speech patterns...');
     
-    // Prefer piping JSON to the Python script's stdin (matches analyze_speech.py interface)
-    const payload = JSON.stringify({ text: transcriptText, duration: 30.0 })
-      .replace(/"/g, '\\"');
-    const { stdout, stderr } = await execAsync(
-      `echo "${payload}" | ml_models/venv_mac/bin/python ml_models/analyze_speech.py`,
-      {
-        cwd: process.cwd(),
-        timeout: 30000
-      }
-    );
+    // The payload is written to the script's stdin, never through a shell
+    const payload = { text: transcriptText, duration: 30.0, answers: answerPairs };
+    const { stdout, stderr } = await runPythonScript('ml_models/analyze_speech.py', [], payload, {
+      cwd: process.cwd(),
+      timeout: 30000
+    });
 
     if (stderr) {
       console.error('Speech analysis stderr:', stderr);
@@ -301,6 +320,10 @@ async function analyzeSpeechWithML(transcriptText: string) {
     if (!parsed?.success || !parsed?.analysis) {
       throw new Error(`Speech analyzer returned invalid result: ${trimmed.slice(0, 200)}`);
     }
+    // Reference-answer scores travel with the speech analysis
+    if (parsed.answer_scoring?.success) {
+      return { ...parsed.analysis, answer_scoring: parsed.answer_scoring };
+    }
     return parsed.analysis;
   } catch (error) {
     console.error('❌ Speech analysis error:', error);
@@ -317,21 +340,20 @@ async function predictInterviewSuccess(
   try {
     console.log('🔮 Predicting interview success with ML model...');
     
-    // Prepare payload for Python script
-    const payload = JSON.stringify({
+    // Payload for the Python script, written to its stdin
+    const payload = {
       text: transcriptText,
       profileData: profileData,
       speechAnalysis: speechAnalysis,
-      interviewData: interviewData
-    }).replace(/"/g, '\\"');
+      interviewData: interviewData,
+      // Per-feature contributions behind the score
+      explain: true
+    };
     
-    const { stdout, stderr } = await execAsync(
-      `echo "${payload}" | ml_models/venv_mac/bin/python ml_models/interview_predictor.py`,
-      {
-        cwd: process.cwd(),
-        timeout: 30000
-      }
-    );
+    const { stdout, stderr } = await runPythonScript('ml_models/interview_predictor.py', [], payload, {
+      cwd: process.cwd(),
+      timeout: 30000
+    });
 
     if (stderr) {
       console.error('Interview prediction stderr:', stderr);
@@ -385,6 +407,7 @@ async function predictInterviewSuccess(
       overall_score: pred.overall_score || 50,
       predicted_success: pred.predicted_success || false,
       model_used: pred.model_used || 'unknown',
+      explanation: pred.explanation || null,
     };
   } catch (error) {
     console.error('❌ Interview prediction error:', error);
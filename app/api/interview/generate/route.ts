@@ -3,6 +3,7 @@ import { promisify } from "util";
 
 import { db } from "@/firebase/admin";
 import { getRandomInterviewCover } from "@/lib/utils";
+import { runPythonScript } from "@/lib/utils/python.mjs";
 
 const execAsync = promisify(exec);
 
@@ -28,13 +29,12 @@ export async function POST(request: Request) {
     console.log('🐍 Executing Python ML script...');
     const startTime = Date.now();
     
-    const { stdout, stderr } = await execAsync(
-      `ml_models/venv_mac/bin/python ml_models/generate_questions.py "${role}" "${level}" "${techstack}" "${type}" "${amount}"`,
-      {
-        cwd: process.cwd(),
-        timeout: 30000 // 30 second timeout
-      }
-    );
+    // Arguments go straight to the spawned process, never through a shell
+    const args = [role, level, techstack, type, amount, userid ?? ""].map((value) => String(value ?? ""));
+    const { stdout, stderr } = await runPythonScript("ml_models/generate_questions.py", args, undefined, {
+      cwd: process.cwd(),
+      timeout: 30000 // 30 second timeout
+    });
 
     const executionTime = Date.now() - startTime;
     console.log(`✅ Python script executed in ${executionTime}ms`);
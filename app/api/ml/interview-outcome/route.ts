@@ -0,0 +1,11 @@
+import { recordInterviewOutcome } from "@/lib/utils/interviewOutcome.mjs";
+
+export async function POST(request: Request) {
+  try {
+    const { status, body } = await recordInterviewOutcome(await request.json(), { cwd: process.cwd() });
+    return Response.json(body, { status });
+  } catch (error) {
+    console.error("Interview Outcome Error:", error);
+    return Response.json({ success: false, error: (error as Error).message }, { status: 500 });
+  }
+}
@@ -1,32 +1,30 @@
-import { exec } from "child_process";
-import { promisify } from "util";
-
-const execAsync = promisify(exec);
+import { runPythonScript } from "@/lib/utils/python.mjs";
 
 export async function POST(request: Request) {
   try {
     const body = await request.json();
-    const { mode, query, n, category, difficulty, preferred_category, skill_level, profile } = body || {};
-
-    const payload = {
-      mode,
-      query,
-      n: n ?? 5,
-      category,
-      difficulty,
-      preferred_category,
-      skill_level,
-      profile,
-    };
-
-    const { stdout, stderr } = await execAsync(
-      `ml_models/venv_mac/bin/python ml_models/recommend_questions.py`,
-      {
-        input: JSON.stringify(payload),
-        cwd: process.cwd(),
-        timeout: 30000,
-      }
-    );
+    const { mode, query, n, category, difficulty, preferred_category, skill_level, profile, company, requests } = body || {};
+
+    // A list of requests is served in one call against the same loaded index
+    const payload = Array.isArray(requests)
+      ? { requests }
+      : {
+          mode,
+          query,
+          n: n ?? 5,
+          category,
+          difficulty,
+          preferred_category,
+          skill_level,
+          profile,
+          company,
+        };
+
+    // The payload is written to the script's stdin
+    const { stdout, stderr } = await runPythonScript("ml_models/recommend_questions.py", [], payload, {
+      cwd: process.cwd(),
+      timeout: 30000,
+    });
 
     if (stderr) {
       console.error("recommender stderr:", stderr);
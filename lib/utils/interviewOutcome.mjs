@@ -0,0 +1,38 @@
+import { runPythonScript } from "./python.mjs";
+
+/**
+ * Append a completed interview to the outcome log.
+ *
+ * The payload is written to `interview_outcomes.py record` on stdin; rows
+ * are folded into the predictor by `interview_outcomes.py retrain`.
+ *
+ * @param {{ interviewId?: string, outcome?: unknown, profileData?: object, speechAnalysis?: object, interviewData?: object }} body
+ * @param {{ cwd?: string, timeout?: number, env?: NodeJS.ProcessEnv }} [options] Passed on to runPythonScript
+ * @returns {Promise<{ status: number, body: object }>}
+ */
+export async function recordInterviewOutcome(body, options = {}) {
+  const { interviewId, outcome, profileData, speechAnalysis, interviewData } = body || {};
+
+  if (typeof outcome !== "boolean") {
+    return { status: 400, body: { success: false, error: "outcome (boolean) is required" } };
+  }
+
+  const payload = { interviewId, outcome, profileData, speechAnalysis, interviewData };
+
+  const { stdout, stderr } = await runPythonScript("ml_models/interview_outcomes.py", ["record"], payload, {
+    timeout: 30000,
+    ...options,
+  });
+
+  if (stderr) {
+    console.error("outcome log stderr:", stderr);
+  }
+
+  const result = JSON.parse(stdout);
+
+  if (!result.success) {
+    return { status: 400, body: { success: false, error: result.error || "Unknown error" } };
+  }
+
+  return { status: 200, body: { success: true, outcomeId: result.outcome_id } };
+}
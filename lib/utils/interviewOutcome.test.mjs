@@ -0,0 +1,61 @@
+import assert from "node:assert/strict";
+import { mkdtempSync, rmSync } from "node:fs";
+import { tmpdir } from "node:os";
+import { dirname, join, resolve } from "node:path";
+import { after, before, test } from "node:test";
+import { fileURLToPath } from "node:url";
+
+import { recordInterviewOutcome } from "./interviewOutcome.mjs";
+import { runPythonScript } from "./python.mjs";
+
+const repoRoot = resolve(dirname(fileURLToPath(import.meta.url)), "..", "..");
+let tmpDir;
+let options;
+
+before(() => {
+  tmpDir = mkdtempSync(join(tmpdir(), "interview-outcome-"));
+  options = {
+    cwd: repoRoot,
+    env: {
+      ...process.env,
+      ML_PYTHON: process.env.ML_PYTHON || "python3",
+      INTERVIEW_OUTCOMES_DB: join(tmpDir, "interview_outcomes.sqlite"),
+    },
+  };
+});
+
+after(() => rmSync(tmpDir, { recursive: true, force: true }));
+
+const outcomeStats = async () => {
+  const { stdout } = await runPythonScript("ml_models/interview_outcomes.py", ["stats"], undefined, options);
+  return JSON.parse(stdout).stats;
+};
+
+test("a recorded outcome is persisted to the outcome log", async () => {
+  const { status, body } = await recordInterviewOutcome(
+    {
+      interviewId: "interview-1",
+      outcome: true,
+      profileData: { age: 27, experienceMonths: 18 },
+      speechAnalysis: { confidence_score: 0.8 },
+    },
+    options
+  );
+
+  assert.equal(status, 200);
+  assert.equal(body.success, true);
+  const stats = await outcomeStats();
+  assert.equal(stats.outcomes, 1);
+  assert.equal(stats.positive, 1);
+  assert.equal(stats.last_id, body.outcomeId);
+});
+
+test("an outcome that is not a boolean is rejected without writing", async () => {
+  const before = await outcomeStats();
+
+  const { status, body } = await recordInterviewOutcome({ interviewId: "interview-2", outcome: "yes" }, options);
+
+  assert.equal(status, 400);
+  assert.equal(body.success, false);
+  assert.equal((await outcomeStats()).outcomes, before.outcomes);
+});
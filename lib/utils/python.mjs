@@ -0,0 +1,56 @@
+import { spawn } from "child_process";
+
+const DEFAULT_PYTHON = "ml_models/venv_mac/bin/python";
+
+/**
+ * Run a Python script with a JSON payload written to its stdin.
+ *
+ * `exec` has no stdin input option, so the payload is piped into a spawned
+ * process instead. Resolves with the collected stdout/stderr once the
+ * process exits with code 0; rejects on a spawn error, a non-zero exit or
+ * the timeout. ML_PYTHON overrides the interpreter (e.g. in tests).
+ *
+ * @param {string} script Script path, relative to cwd
+ * @param {string[]} [args] Extra command-line arguments
+ * @param {unknown} [payload] Value sent as JSON on stdin (nothing is sent when undefined)
+ * @param {{ cwd?: string, timeout?: number, env?: NodeJS.ProcessEnv }} [options]
+ * @returns {Promise<{ stdout: string, stderr: string }>}
+ */
+export function runPythonScript(script, args = [], payload = undefined, options = {}) {
+  const { cwd = process.cwd(), timeout = 30000, env = process.env } = options;
+  const python = env.ML_PYTHON || DEFAULT_PYTHON;
+
+  return new Promise((resolve, reject) => {
+    const child = spawn(python, [script, ...args], { cwd, env });
+    let stdout = "";
+    let stderr = "";
+    let settled = false;
+
+    const finish = (error, result) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(timer);
+      if (error) reject(error);
+      else resolve(result);
+    };
+
+    const timer = setTimeout(() => {
+      child.kill();
+      finish(new Error(`${script} timed out after ${timeout}ms`));
+    }, timeout);
+
+    child.stdout.setEncoding("utf8");
+    child.stderr.setEncoding("utf8");
+    child.stdout.on("data", (chunk) => (stdout += chunk));
+    child.stderr.on("data", (chunk) => (stderr += chunk));
+    child.on("error", (error) => finish(error));
+    child.on("close", (code) => {
+      if (code === 0) finish(null, { stdout, stderr });
+      else finish(new Error(`${script} exited with code ${code}: ${stderr.trim()}`));
+    });
+
+    // A script that exits before reading stdin is reported by "close" instead
+    child.stdin.on("error", () => {});
+    child.stdin.end(payload === undefined ? "" : JSON.stringify(payload));
+  });
+}
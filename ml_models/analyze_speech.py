@@ -12,6 +12,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from speech_analyzer import SimpleSpeechAnalyzer
+from question_recommender import SimpleQuestionRecommender
 
 def analyze_speech_with_ml(speech_text, duration=30.0):
     """Analyze speech using ML models"""
@@ -90,6 +91,40 @@ def analyze_speech_with_ml(speech_text, duration=30.0):
             'analysis': {}
         }
 
+def score_answers_with_ml(answers):
+    """Score each answer against the reference answer of its question
+    
+    answers: list of {"question_id" or "question", "transcript"} dicts
+    """
+    try:
+        recommender = SimpleQuestionRecommender()
+        
+        model_path = os.path.join(os.path.dirname(__file__), 'trained_models', 'question_recommender.pkl')
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        
+        recommender.load_model(model_path)
+        
+        pairs = [
+            (answer.get('question_id', answer.get('question')), answer.get('transcript', ''))
+            for answer in answers
+        ]
+        scores = recommender.score_answers(pairs)
+        
+        return {
+            'success': True,
+            'scores': scores,
+            'average_similarity': round(sum(s['similarity_score'] for s in scores) / len(scores), 4) if scores else 0,
+            'average_keyword_coverage': round(sum(s['keyword_coverage'] for s in scores) / len(scores), 4) if scores else 0
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'scores': []
+        }
+
 def main():
     """Main function - reads input from stdin and outputs to stdout"""
     try:
@@ -110,6 +145,10 @@ def main():
         else:
             # Analyze speech using ML
             result = analyze_speech_with_ml(speech_text, duration)
+            
+            # Optional per-question answers are scored against the reference answers
+            if data.get('answers'):
+                result['answer_scoring'] = score_answers_with_ml(data['answers'])
         
         # Output to stdout (Next.js will read this)
         print(json.dumps(result))
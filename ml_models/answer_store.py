@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Answer Store for ML Pipeline
+Block-compressed, lazily decompressed storage for reference answers
+"""
+
+import os
+import struct
+import threading
+import zlib
+import numpy as np
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+MAGIC = b'ANSB'
+FORMAT_VERSION = 1
+CODEC_ZLIB = 0
+CODEC_ZSTD = 1
+CODEC_NAMES = {CODEC_ZLIB: 'zlib', CODEC_ZSTD: 'zstd'}
+
+# magic, version, codec, block size, answer count, block count
+HEADER = struct.Struct('<4sBBIQQ')
+
+
+class AnswerStore:
+    """Read-only answer file split into independently compressed blocks
+
+    Layout: header, offset table (n_blocks + 1 uint64 file offsets), then the
+    blocks. Each block holds block_size answers as a uint32 length array
+    followed by the concatenated UTF-8 bytes, compressed with zstd or zlib.
+    Only the header and the offset table are read on open; blocks are
+    decompressed on first access and kept in a small LRU.
+    """
+
+    def __init__(self, file_path: str, cache_blocks: int = 32):
+        self.file_path = file_path
+        self.cache_blocks = cache_blocks
+        self._file = open(file_path, 'rb')
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.blocks_decompressed = 0
+        self.cache_hits = 0
+
+        magic, version, codec, block_size, n_answers, n_blocks = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not an answer store file: {file_path}")
+        if codec == CODEC_ZSTD and zstandard is None:
+            raise ImportError("zstandard is required to read this answer store (pip install zstandard)")
+
+        self.codec = codec
+        self.block_size = block_size
+        self.n_answers = n_answers
+        self.offsets = np.frombuffer(self._file.read(8 * (n_blocks + 1)), dtype='<u8')
+
+    def __len__(self) -> int:
+        return self.n_answers
+
+    @staticmethod
+    def write(file_path: str, answers: Iterable[str], block_size: int = 256, codec: Optional[str] = None):
+        """Write answers to a block-compressed file (zstd if installed, else zlib)"""
+        if codec is None:
+            codec = 'zstd' if zstandard is not None else 'zlib'
+        if codec == 'zstd':
+            if zstandard is None:
+                raise ImportError("zstandard is required for zstd compression (pip install zstandard)")
+            codec_id = CODEC_ZSTD
+            compress = zstandard.ZstdCompressor(level=9).compress
+        elif codec == 'zlib':
+            codec_id = CODEC_ZLIB
+            compress = lambda data: zlib.compress(data, 9)
+        else:
+            raise ValueError(f"Unknown codec '{codec}'. Expected 'zstd' or 'zlib'")
+
+        encoded = ['' if answer is None else str(answer) for answer in answers]
+        encoded = [answer.encode('utf-8') for answer in encoded]
+        n_blocks = (len(encoded) + block_size - 1) // block_size
+        table_start = HEADER.size
+        data_start = table_start + 8 * (n_blocks + 1)
+
+        # Write to a temporary file so an open store on the same path stays readable
+        tmp_path = file_path + '.tmp'
+        offsets = np.zeros(n_blocks + 1, dtype='<u8')
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, codec_id, block_size, len(encoded), n_blocks))
+            f.seek(data_start)
+            offsets[0] = data_start
+            for b in range(n_blocks):
+                chunk = encoded[b * block_size:(b + 1) * block_size]
+                lengths = np.fromiter((len(answer) for answer in chunk), dtype='<u4', count=len(chunk))
+                f.write(compress(lengths.tobytes() + b''.join(chunk)))
+                offsets[b + 1] = f.tell()
+            f.seek(table_start)
+            f.write(offsets.tobytes())
+        os.replace(tmp_path, file_path)
+
+    def _decompress(self, data: bytes) -> bytes:
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def _get_block(self, block: int) -> List[str]:
+        """Decoded answers of one block, from the LRU or from disk"""
+        with self._lock:
+            answers = self._cache.get(block)
+            if answers is not None:
+                self._cache.move_to_end(block)
+                self.cache_hits += 1
+                return answers
+
+            start, end = int(self.offsets[block]), int(self.offsets[block + 1])
+            self._file.seek(start)
+            raw = self._decompress(self._file.read(end - start))
+
+            count = min(self.block_size, self.n_answers - block * self.block_size)
+            lengths = np.frombuffer(raw, dtype='<u4', count=count)
+            bounds = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]) + 4 * count
+            answers = [raw[s:e].decode('utf-8') for s, e in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+            self._cache[block] = answers
+            self.blocks_decompressed += 1
+            if len(self._cache) > self.cache_blocks:
+                self._cache.popitem(last=False)
+            return answers
+
+    def get(self, row: int) -> str:
+        """Answer for one row"""
+        return self.get_many([row])[0]
+
+    def get_many(self, rows) -> List[str]:
+        """Answers for the given rows, decompressing each touched block once"""
+        rows = np.asarray(rows, dtype=np.int64)
+        if len(rows) and (rows.min() < 0 or rows.max() >= self.n_answers):
+            raise IndexError("Answer row out of range")
+
+        blocks = rows // self.block_size
+        answers = [None] * len(rows)
+        for block in np.unique(blocks).tolist():
+            block_answers = self._get_block(block)
+            for i in np.flatnonzero(blocks == block).tolist():
+                answers[i] = block_answers[int(rows[i]) - block * self.block_size]
+        return answers
+
+    def get_stats(self):
+        """Block cache statistics"""
+        return {
+            'codec': CODEC_NAMES[self.codec],
+            'answers': self.n_answers,
+            'blocks': len(self.offsets) - 1,
+            'cached_blocks': len(self._cache),
+            'blocks_decompressed': self.blocks_decompressed,
+            'cache_hits': self.cache_hits
+        }
+
+    def close(self):
+        self._file.close()
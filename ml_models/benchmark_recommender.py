@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Question Recommender Benchmarks
+Compares retrieval quality and latency of the recommender's search modes
+"""
+
+import os
+import sys
+import time
+import random
+import numpy as np
+import scipy.sparse as sp
+
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from question_recommender import SimpleQuestionRecommender
+
+
+def make_paraphrase_queries(recommender, n_queries=200, drop_rate=0.4, seed=42):
+    """Build paraphrase-like queries by dropping words from question texts
+
+    Returns (query, set of relevant question texts) pairs. Every row that
+    shares the source question text counts as a hit.
+    """
+    rng = random.Random(seed)
+    questions = recommender.questions_df['Question'].tolist()
+    sample_rows = rng.sample(range(len(questions)), min(n_queries, len(questions)))
+
+    queries = []
+    for row in sample_rows:
+        words = questions[row].split()
+        kept = [w for w in words if rng.random() > drop_rate] or words[:1]
+        queries.append((' '.join(kept), questions[row]))
+    return queries
+
+
+def benchmark_search(name, search_fn, queries, k):
+    """Measure recall@k and per-query latency for a search function"""
+    hits = 0
+    latencies = []
+    for query, expected_question in queries:
+        start = time.perf_counter()
+        results = search_fn(query, k)
+        latencies.append(time.perf_counter() - start)
+        if any(r['question'] == expected_question for r in results):
+            hits += 1
+
+    latencies_ms = np.array(latencies) * 1000
+    result = {
+        'recall': hits / max(len(queries), 1),
+        'p50_ms': float(np.percentile(latencies_ms, 50)),
+        'p95_ms': float(np.percentile(latencies_ms, 95))
+    }
+    print(f"   {name:<22} recall@{k}={result['recall']:.1%}  "
+          f"p50={result['p50_ms']:.2f}ms  p95={result['p95_ms']:.2f}ms")
+    return result
+
+
+def benchmark_semantic_vs_tfidf(recommender, n_queries=200, k=5):
+    """Compare the LSA index against TF-IDF cosine similarity"""
+    print("\nSemantic (LSA) vs TF-IDF Similarity")
+    print("-" * 40)
+
+    if recommender.lsa_svd is None or recommender.semantic_embeddings is None:
+        print("Semantic index not available - train it with train_semantic_index()")
+        return {}
+
+    results = {}
+    for drop_rate in (0.0, 0.4):
+        queries = make_paraphrase_queries(recommender, n_queries, drop_rate)
+        print(f"Queries: {len(queries)} (word drop rate {drop_rate:.0%})")
+        results[drop_rate] = {
+            'tfidf': benchmark_search('TF-IDF similarity', recommender.recommend_questions_by_similarity, queries, k),
+            'lsa': benchmark_search('LSA semantic', recommender.recommend_questions_semantic, queries, k)
+        }
+    return results
+
+
+def benchmark_topic_clustering(recommender, sizes=(10000, 50000, 200000), seed=42):
+    """Measure topic clustering build time on synthetic banks of growing size
+
+    Banks are built by resampling rows of the trained TF-IDF matrix, so the
+    vocabulary and sparsity match the real bank.
+    """
+    print("\nTopic Clustering Build Time")
+    print("-" * 40)
+
+    rng = np.random.default_rng(seed)
+    results = {}
+    for size in sizes:
+        bank = SimpleQuestionRecommender()
+        bank.tfidf_vectorizer = recommender.tfidf_vectorizer
+        bank.question_vectors = recommender.question_vectors[rng.integers(0, recommender.question_vectors.shape[0], size)]
+
+        start = time.perf_counter()
+        bank.build_topic_clusters()
+        elapsed = time.perf_counter() - start
+
+        # Round-robin selection cost for a typical interview-sized pool
+        pool = rng.choice(size, 30, replace=False)
+        select_start = time.perf_counter()
+        for _ in range(1000):
+            bank.select_topic_balanced_rows(pool, 10)
+        select_us = (time.perf_counter() - select_start) * 1000
+
+        results[size] = {'build_s': elapsed, 'rows_per_s': size / elapsed, 'select_us': select_us}
+        print(f"   {size:>8} rows  build={elapsed:.2f}s  ({size / elapsed:,.0f} rows/s)  "
+              f"select={select_us:.1f}us")
+    return results
+
+
+def main():
+    """Run all recommender benchmarks against the trained model"""
+    model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trained_models', 'question_recommender.pkl')
+    if not os.path.exists(model_path):
+        print(f"Model file not found: {model_path}")
+        print("Run train_simple_pipeline.py first")
+        return
+
+    recommender = SimpleQuestionRecommender()
+    recommender.load_model(model_path)
+    print(f"Loaded {len(recommender.questions_df)} questions")
+
+    benchmark_semantic_vs_tfidf(recommender)
+    benchmark_topic_clustering(recommender)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,681 @@
+#!/usr/bin/env python3
+"""
+Compiled Interview Predictor for ML Pipeline
+Flat NumPy export of the trained interview models, evaluated without sklearn
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+# Rows scored per traversal step; bounds the (rows x trees) node index matrix
+BATCH_ROWS = 4096
+
+# Leaves per explanation step; keeps the (path features x leaves) work arrays in cache
+EXPLAIN_BLOCK_LEAVES = 4096
+
+
+def compiled_model_path(model_path: str) -> str:
+    """Path of the compiled export that sits next to a pickled predictor"""
+    return os.path.splitext(model_path)[0] + '_compiled.npz'
+
+
+def compiled_paths_path(compiled_path: str) -> str:
+    """Path of the TreeSHAP path tables that sit next to a compiled export"""
+    return os.path.splitext(compiled_path)[0] + '_paths.npz'
+
+
+def _model_key(model_name: str) -> str:
+    """Array-name prefix for a model ('Random Forest' -> 'random_forest')"""
+    return re.sub(r'[^a-z0-9]+', '_', model_name.lower()).strip('_')
+
+
+def is_compilable(model) -> bool:
+    """Whether a fitted model has a compiled form (sklearn forests, linear classifiers)"""
+    return (hasattr(model, 'estimators_') and hasattr(model.estimators_[0], 'tree_')) or hasattr(model, 'coef_')
+
+
+def _smallest_uint(max_value: int):
+    """Narrowest unsigned integer dtype that holds max_value"""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if max_value <= np.iinfo(dtype).max:
+            return dtype
+    return np.uint64
+
+
+def _float32_at_most(values: np.ndarray) -> np.ndarray:
+    """float32 thresholds rounded down, so `x <= t` is unchanged for every float32 x
+
+    Trees compare float32 features; no float32 lies between the rounded
+    value and the float64 threshold, so no comparison changes outcome.
+    """
+    rounded = values.astype(np.float32)
+    too_high = rounded.astype(np.float64) > values
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+
+def _merge_redundant_splits(tree, value: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Turn splits whose two subtrees predict the same distribution into leaves
+
+    Returns the kept node ids (in original order) and the left/right child
+    arrays with merged splits as leaves (-1). Predictions and path-dependent
+    contributions are unchanged: both sides of a merged split lead to the
+    same value.
+    """
+    left, right = tree.children_left.copy(), tree.children_right.copy()
+    # Children always have larger ids than their parent, so one reverse pass merges bottom-up
+    for node in range(tree.node_count - 1, -1, -1):
+        l, r = left[node], right[node]
+        if l != -1 and left[l] == -1 and left[r] == -1 and np.array_equal(value[l], value[r]):
+            left[node] = right[node] = -1
+
+    reachable = np.zeros(tree.node_count, dtype=bool)
+    reachable[0] = True
+    for node in range(tree.node_count):
+        if reachable[node] and left[node] != -1:
+            reachable[left[node]] = reachable[right[node]] = True
+    return np.flatnonzero(reachable), left, right
+
+
+def compile_forest(forest, compact: bool = True) -> Dict[str, np.ndarray]:
+    """Flatten a fitted random forest into node arrays
+
+    All trees are concatenated into one node table. children[node] holds
+    the (left, right) node ids and leaves point to themselves, so every row
+    can take the same number of steps (the deepest tree's depth) without
+    checking for leaves. Leaf values are the per-tree class distributions
+    that predict_proba averages; cover (weighted training samples per node)
+    is kept for path-dependent contributions.
+
+    With compact=True redundant splits are merged, thresholds are stored as
+    float32 (rounded down, see _float32_at_most), cover as float32 and node
+    and feature indices in the narrowest unsigned type. Predictions are
+    identical to the uncompacted arrays.
+    """
+    features, thresholds, children, values, covers, roots = [], [], [], [], [], []
+    offset = 0
+    max_depth = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        value = tree.value[:, 0, :].astype(np.float64)
+        normalizer = value.sum(axis=1, keepdims=True)
+        normalizer[normalizer == 0] = 1.0
+        value = value / normalizer
+
+        if compact:
+            kept, left, right = _merge_redundant_splits(tree, value)
+        else:
+            kept, left, right = np.arange(tree.node_count), tree.children_left, tree.children_right
+        new_ids = np.full(tree.node_count, -1, dtype=np.int64)
+        new_ids[kept] = np.arange(len(kept))
+        is_leaf = left[kept] == -1
+        local_ids = np.arange(len(kept))
+
+        features.append(np.where(is_leaf, 0, tree.feature[kept]))
+        thresholds.append(tree.threshold[kept].astype(np.float64))
+        children.append(np.column_stack([
+            np.where(is_leaf, local_ids, new_ids[left[kept]]),
+            np.where(is_leaf, local_ids, new_ids[right[kept]])
+        ]) + offset)
+        values.append(value[kept])
+        covers.append(tree.weighted_n_node_samples[kept].astype(np.float64))
+
+        # Depth after merging: level of the deepest kept node
+        depth = np.zeros(len(kept), dtype=np.int64)
+        for node in range(len(kept)):
+            if not is_leaf[node]:
+                depth[children[-1][node] - offset] = depth[node] + 1
+        roots.append(offset)
+        offset += len(kept)
+        max_depth = max(max_depth, int(depth.max()))
+
+    compiled = {
+        'feature': np.concatenate(features),
+        'threshold': np.concatenate(thresholds),
+        'children': np.concatenate(children),
+        'value': np.concatenate(values),
+        'cover': np.concatenate(covers),
+        'roots': np.asarray(roots),
+        'depth': np.asarray(max_depth, dtype=np.int32)
+    }
+    if compact:
+        node_dtype = _smallest_uint(offset)
+        compiled['feature'] = compiled['feature'].astype(_smallest_uint(forest.n_features_in_))
+        compiled['threshold'] = _float32_at_most(compiled['threshold'])
+        compiled['children'] = compiled['children'].astype(node_dtype)
+        compiled['cover'] = compiled['cover'].astype(np.float32)
+        compiled['roots'] = compiled['roots'].astype(node_dtype)
+    else:
+        compiled['feature'] = compiled['feature'].astype(np.int32)
+        compiled['children'] = compiled['children'].astype(np.int32)
+        compiled['roots'] = compiled['roots'].astype(np.int32)
+    return compiled
+
+
+def compile_leaf_paths(forest: Dict[str, np.ndarray], n_features: int) -> Dict[str, np.ndarray]:
+    """Root-to-leaf path tables of a compiled forest, for TreeSHAP explanations
+
+    For every leaf and every distinct feature split on its path: the
+    interval (lo, hi] a row's value must fall in to follow the path, and
+    the zero fraction (product of child/parent cover over those splits).
+    Leaves are sorted by path length (path_length) and a leaf's features
+    fill its first slots, so the tables are stored as their used entries
+    only, in slot-major (path feature slot x leaf) order; see
+    CompiledInterviewPredictor._forest_leaf_paths for the unpacking.
+    Bounds keep the dtype of the thresholds they come from.
+    """
+    feature, threshold = forest['feature'].astype(np.intp), forest['threshold'].astype(np.float64)
+    children, cover = forest['children'].astype(np.intp), forest['cover'].astype(np.float64)
+    n_nodes = len(feature)
+
+    # Propagate per-feature path state from the roots, one tree level at a time
+    lo = np.full((n_nodes, n_features), -np.inf)
+    hi = np.full((n_nodes, n_features), np.inf)
+    zero_fraction = np.ones((n_nodes, n_features))
+    used = np.zeros((n_nodes, n_features), dtype=bool)
+    is_leaf = children[:, 0] == np.arange(n_nodes)
+    frontier = forest['roots'][~is_leaf[forest['roots']]]
+    while len(frontier):
+        split_feature, split_threshold = feature[frontier], threshold[frontier]
+        for side, child in enumerate((children[frontier, 0], children[frontier, 1])):
+            lo[child], hi[child] = lo[frontier], hi[frontier]
+            zero_fraction[child], used[child] = zero_fraction[frontier], used[frontier]
+            if side == 0:
+                hi[child, split_feature] = np.minimum(hi[child, split_feature], split_threshold)
+            else:
+                lo[child, split_feature] = np.maximum(lo[child, split_feature], split_threshold)
+            zero_fraction[child, split_feature] *= cover[child] / cover[frontier]
+            used[child, split_feature] = True
+        frontier = children[frontier].ravel()
+        frontier = frontier[~is_leaf[frontier]]
+
+    leaves = np.flatnonzero(is_leaf)
+    used = used[leaves]
+    n_path_features = used.sum(axis=1)
+    # Leaves sorted by path length, so each length is one contiguous group
+    order = np.argsort(n_path_features, kind='stable')
+    leaves, used, n_path_features = leaves[order], used[order], n_path_features[order]
+    slots = max(int(n_path_features.max()), 1)
+    # Used features first, in feature order
+    slot_features = np.argsort(~used, axis=1, kind='stable')[:, :slots]
+    valid = np.take_along_axis(used, slot_features, axis=1)
+    take = lambda table: np.take_along_axis(table[leaves], slot_features, axis=1)
+
+    # Leaf values of the positive class, averaged over trees like predict_proba
+    leaf_value = forest['value'][leaves, -1] / len(forest['roots'])
+
+    valid = valid.T
+    return {
+        'path_features': slot_features.T[valid].astype(_smallest_uint(n_features - 1)),
+        'path_lo': take(lo).T[valid].astype(forest['threshold'].dtype),
+        'path_hi': take(hi).T[valid].astype(forest['threshold'].dtype),
+        'path_zero_fraction': take(zero_fraction).T[valid],
+        'path_leaf_value': leaf_value,
+        'path_length': n_path_features.astype(_smallest_uint(n_features))
+    }
+
+
+def forest_digest(forest: Dict[str, np.ndarray]) -> str:
+    """Fingerprint of a compiled forest's structure, ties path tables to their export"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in ('feature', 'threshold', 'children', 'cover'):
+        digest.update(np.ascontiguousarray(forest[name]).tobytes())
+    return digest.hexdigest()
+
+
+def compile_linear(model) -> Dict[str, np.ndarray]:
+    """Coefficients and intercept of a fitted linear classifier"""
+    return {
+        'coef': np.asarray(model.coef_, dtype=np.float64),
+        'intercept': np.asarray(model.intercept_, dtype=np.float64)
+    }
+
+
+def compile_predictor(predictor, compact: bool = True) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Arrays and metadata of a trained SimpleInterviewPredictor
+
+    The scaler becomes mean/scale vectors, forests become node arrays and
+    logistic regressions their coefficients. Models of other kinds are
+    left out (they keep being served from the pickle). compact is passed on
+    to compile_forest.
+    """
+    arrays = {
+        'scaler_mean': np.asarray(predictor.scaler.mean_, dtype=np.float64),
+        'scaler_scale': np.asarray(predictor.scaler.scale_, dtype=np.float64)
+    }
+    models = {}
+    for name, model in predictor.models.items():
+        if not is_compilable(model):
+            print(f"⚠️ Skipping {name}: no compiled form for {type(model).__name__}")
+            continue
+        if hasattr(model, 'estimators_'):
+            kind, compiled = 'forest', compile_forest(model, compact=compact)
+        else:
+            kind, compiled = 'linear', compile_linear(model)
+
+        key = _model_key(name)
+        for array_name, array in compiled.items():
+            arrays[f"{key}__{array_name}"] = array
+        arrays[f"{key}__classes"] = np.asarray(model.classes_)
+        # Importances precomputed at train time, in feature order
+        for array_name, importance_kind in (('importance', 'model'), ('permutation_importance', 'permutation')):
+            importance = predictor.get_feature_importance(name, kind=importance_kind)
+            if importance:
+                arrays[f"{key}__{array_name}"] = np.asarray(
+                    [importance.get(feature, 0.0) for feature in predictor.feature_names], dtype=np.float64
+                )
+        models[name] = {'key': key, 'kind': kind}
+
+    meta = {
+        'feature_names': predictor.feature_names,
+        'best_model_name': predictor.best_model_name if predictor.best_model_name in models else next(iter(models), None),
+        'models': models
+    }
+    return arrays, meta
+
+
+def export_compiled_predictor(predictor, file_path: str, compact: bool = True) -> str:
+    """Export a trained SimpleInterviewPredictor to a .npz file
+
+    The forests' TreeSHAP path tables are several times the size of the
+    forests themselves and only explanations need them, so they go to a
+    separate file (compiled_paths_path) that predictions never read.
+    """
+    arrays, meta = compile_predictor(predictor, compact=compact)
+    paths = {}
+    for name, info in meta['models'].items():
+        if info['kind'] == 'forest':
+            prefix = info['key'] + '__'
+            forest = {array_name[len(prefix):]: array for array_name, array in arrays.items()
+                      if array_name.startswith(prefix)}
+            for array_name, array in compile_leaf_paths(forest, len(meta['feature_names'])).items():
+                paths[prefix + array_name] = array
+            paths[prefix + 'digest'] = np.asarray(forest_digest(forest))
+    arrays['meta'] = np.asarray(json.dumps(meta))
+
+    np.savez(file_path, **arrays)
+    paths_path = compiled_paths_path(file_path)
+    if paths:
+        np.savez(paths_path, **paths)
+    elif os.path.exists(paths_path):
+        os.remove(paths_path)
+    print(f"💾 Saved compiled interview predictor to {file_path}")
+    return file_path
+
+
+class CompiledInterviewPredictor:
+    """Batch evaluator over the exported arrays (NumPy only)
+
+    Mirrors SimpleInterviewPredictor.predict: rows are standardized with
+    the exported scaler, then scored by the requested or best model.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict[str, Any], paths_path: Optional[str] = None):
+        self.arrays = arrays
+        self.feature_names = meta['feature_names']
+        self.best_model_name = meta['best_model_name']
+        self.model_info = meta['models']
+        # Exported TreeSHAP path tables, read on the first explanation
+        self.paths_path = paths_path
+        self._leaf_paths = {}
+
+    @classmethod
+    def from_predictor(cls, predictor) -> 'CompiledInterviewPredictor':
+        """Compile a trained SimpleInterviewPredictor in memory"""
+        arrays, meta = compile_predictor(predictor)
+        return cls(arrays, meta)
+
+    @classmethod
+    def load(cls, file_path: str) -> 'CompiledInterviewPredictor':
+        """Load an export written by export_compiled_predictor (without its path tables)"""
+        with np.load(file_path, allow_pickle=False) as data:
+            arrays = {name: data[name] for name in data.files}
+        meta = json.loads(str(arrays.pop('meta')))
+        return cls(arrays, meta, paths_path=compiled_paths_path(file_path))
+
+    def _model_arrays(self, model_name: str) -> Tuple[str, Dict[str, np.ndarray]]:
+        if model_name not in self.model_info:
+            raise ValueError(f"Model '{model_name}' not found")
+        info = self.model_info[model_name]
+        prefix = info['key'] + '__'
+        return info['kind'], {
+            name[len(prefix):]: array for name, array in self.arrays.items() if name.startswith(prefix)
+        }
+
+    def _scale(self, X) -> np.ndarray:
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[None, :]
+        return (X - self.arrays['scaler_mean']) / self.arrays['scaler_scale']
+
+    @staticmethod
+    def _forest_proba(forest: Dict[str, np.ndarray], X: np.ndarray) -> np.ndarray:
+        """Average leaf distributions over all trees for every row"""
+        # Trees compare float32 features against float64 thresholds, as sklearn does
+        X = X.astype(np.float32).astype(np.float64)
+        feature, threshold, value = forest['feature'], forest['threshold'], forest['value']
+        # Compact exports store node ids in narrow unsigned types; walk them as intp
+        children = forest['children'].ravel().astype(np.intp)
+        roots, depth = forest['roots'].astype(np.intp), int(forest['depth'])
+        n_features = X.shape[1]
+
+        proba = np.empty((len(X), value.shape[1]), dtype=np.float64)
+        for start in range(0, len(X), BATCH_ROWS):
+            X_chunk = X[start:start + BATCH_ROWS]
+            # One (row, tree) walker per entry, over the flattened chunk
+            row_offsets = np.repeat(np.arange(len(X_chunk)) * n_features, len(roots))
+            nodes = np.tile(roots, len(X_chunk))
+            X_flat = X_chunk.ravel()
+            for _ in range(depth):
+                go_right = ~(X_flat[row_offsets + feature[nodes]] <= threshold[nodes])
+                nodes = children[2 * nodes + go_right]
+            proba[start:start + len(X_chunk)] = value[nodes].reshape(len(X_chunk), len(roots), -1).mean(axis=1)
+        return proba
+
+    @staticmethod
+    def _linear_proba(linear: Dict[str, np.ndarray], X: np.ndarray) -> np.ndarray:
+        """Logistic (binary) or softmax (multiclass) probabilities"""
+        scores = X @ linear['coef'].T + linear['intercept']
+        if scores.shape[1] == 1:
+            positive = 1.0 / (1.0 + np.exp(-scores[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        scores = scores - scores.max(axis=1, keepdims=True)
+        exp_scores = np.exp(scores)
+        return exp_scores / exp_scores.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, X, model_name: Optional[str] = None) -> np.ndarray:
+        """Class probabilities for a batch of raw (unscaled) feature rows"""
+        kind, model = self._model_arrays(model_name or self.best_model_name)
+        X_scaled = self._scale(X)
+        if kind == 'forest':
+            return self._forest_proba(model, X_scaled)
+        return self._linear_proba(model, X_scaled)
+
+    def predict(self, X, model_name: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Predicted classes and positive-class probabilities"""
+        model_name = model_name or self.best_model_name
+        proba = self.predict_proba(X, model_name)
+        classes = self._model_arrays(model_name)[1]['classes']
+        return classes[proba.argmax(axis=1)], proba[:, 1]
+
+    def _exported_leaf_paths(self, model_name: str, forest: Dict[str, np.ndarray]) -> Optional[Dict[str, np.ndarray]]:
+        """This forest's tables from the exported path file, if it has them and was written for this forest"""
+        if not self.paths_path or not os.path.exists(self.paths_path):
+            return None
+        prefix = self.model_info[model_name]['key'] + '__'
+        with np.load(self.paths_path, allow_pickle=False) as data:
+            if prefix + 'digest' not in data.files or str(data[prefix + 'digest']) != forest_digest(forest):
+                return None
+            return {
+                name[len(prefix):]: data[name] for name in data.files
+                if name.startswith(prefix + 'path_')
+            }
+
+    def _forest_leaf_paths(self, model_name: str) -> Dict[str, Any]:
+        """Root-to-leaf path tables of a forest (see compile_leaf_paths), loaded once per model
+
+        Read from the export's path file; exports without one (or with a
+        stale one) have them built here.
+        """
+        if model_name in self._leaf_paths:
+            return self._leaf_paths[model_name]
+
+        forest = self._model_arrays(model_name)[1]
+        if 'path_features' not in forest:
+            if 'cover' not in forest:
+                raise ValueError("Compiled export has no node cover - re-export it with compiled_predictor.py")
+            forest.update(self._exported_leaf_paths(model_name, forest) or compile_leaf_paths(forest, len(self.feature_names)))
+        n_path_features, leaf_value = forest['path_length'].astype(np.intp), forest['path_leaf_value']
+
+        # Unpack the used entries into slot-major tables padded with neutral slots
+        valid = np.arange(max(int(n_path_features.max()), 1))[:, None] < n_path_features
+        def table(entries, neutral, dtype):
+            full = np.full(valid.shape, neutral, dtype=dtype)
+            full[valid] = entries
+            return full
+        zero = table(forest['path_zero_fraction'], 1.0, np.float64)
+
+        groups = []
+        for length in np.unique(n_path_features).tolist():
+            start, end = np.searchsorted(n_path_features, [length, length + 1])
+            # Gauss-Legendre on [0, 1], exact for the degree (length - 1) path integrands
+            nodes, node_weights = np.polynomial.legendre.leggauss(max((length + 1) // 2, 1))
+            groups.append((max(length, 1), int(start), int(end), (nodes + 1) / 2, node_weights / 2))
+
+        paths = {
+            'features': table(forest['path_features'], 0, np.intp),
+            'valid': valid,
+            'lo': table(forest['path_lo'], -np.inf, np.float64),
+            'hi': table(forest['path_hi'], np.inf, np.float64),
+            'zero_fraction': zero,
+            'leaf_value': leaf_value,
+            'groups': groups,
+            'base_value': float(np.sum(leaf_value * zero.prod(axis=0)))
+        }
+        self._leaf_paths[model_name] = paths
+        return paths
+
+    def _forest_contributions(self, model_name: str, X: np.ndarray) -> Tuple[float, np.ndarray]:
+        """Exact path-dependent (TreeSHAP) contributions to the positive-class probability
+
+        Per leaf, E[f | x_S] is v * prod_{j in S} o_j * prod_{j not in S} z_j
+        (o_j: the row follows the path's splits on feature j, z_j: the
+        path's zero fraction), so the Shapley value of path feature i is
+        v * (o_i - z_i) * sum_S |S|! (d - |S| - 1)! / d! * prod_S o_j * prod_rest z_j.
+        The Shapley weights are Beta integrals, which turns the sum into
+        v * (o_i - z_i) * integral_0^1 prod_{j != i} (z_j + (o_j - z_j) t) dt,
+        a polynomial of degree < d integrated exactly by Gauss-Legendre
+        quadrature. Rows are explained one at a time, over cache-sized
+        blocks of leaves with the same path length.
+        """
+        paths = self._forest_leaf_paths(model_name)
+        features, valid, zero, leaf_value = paths['features'], paths['valid'], paths['zero_fraction'], paths['leaf_value']
+        n_features = len(self.feature_names)
+        # Same float32 comparison as the traversal
+        X = X.astype(np.float32).astype(np.float64)
+
+        contributions = np.zeros((len(X), n_features))
+        for row, x in enumerate(X):
+            for length, start, end, nodes, node_weights in paths['groups']:
+                for block in range(start, end, EXPLAIN_BLOCK_LEAVES):
+                    leaves = slice(block, min(block + EXPLAIN_BLOCK_LEAVES, end))
+                    block_features = features[:length, leaves]
+                    values = x[block_features]
+                    follows = (values > paths['lo'][:length, leaves]) & (values <= paths['hi'][:length, leaves])
+                    z = zero[:length, leaves]
+                    slope = (follows | ~valid[:length, leaves]) - z
+
+                    factors = np.empty_like(slope)
+                    products = np.empty(slope.shape[1])
+                    integral = np.zeros_like(slope)
+                    quotient = np.empty_like(slope)
+                    for t, weight in zip(nodes, node_weights):
+                        # Path factors at t, their product, and the product without each factor
+                        np.multiply(slope, t, out=factors)
+                        factors += z
+                        np.prod(factors, axis=0, out=products)
+                        products *= weight
+                        np.divide(products, factors, out=quotient)
+                        integral += quotient
+
+                    integral *= slope
+                    integral *= leaf_value[leaves]
+                    contributions[row] += np.bincount(block_features.ravel(), weights=integral.ravel(), minlength=n_features)
+        return paths['base_value'], contributions
+
+    def explain(self, X, model_name: Optional[str] = None) -> Dict[str, Any]:
+        """Per-feature contributions for a batch of raw (unscaled) feature rows
+
+        Forests: exact path-dependent TreeSHAP values in probability space;
+        base_value + contributions.sum(axis=1) equals the positive-class
+        probability. Logistic regression: coef * scaled value (the scaled
+        training mean is 0) in log-odds space; base_value + sum equals the
+        decision function.
+        """
+        model_name = model_name or self.best_model_name
+        kind, model = self._model_arrays(model_name)
+        X_scaled = self._scale(X)
+        if kind == 'forest':
+            base_value, contributions = self._forest_contributions(model_name, X_scaled)
+            output = 'probability'
+        else:
+            base_value = float(model['intercept'][-1])
+            contributions = X_scaled * model['coef'][-1]
+            output = 'log_odds'
+        return {
+            'model': model_name,
+            'output': output,
+            'base_value': base_value,
+            'contributions': contributions
+        }
+
+    def get_feature_importance(self, model_name: Optional[str] = None, kind: str = 'model') -> Dict[str, float]:
+        """Exported feature importance, highest first (same values as the pickled predictor)"""
+        model_name = model_name or self.best_model_name
+        if kind not in ('model', 'permutation'):
+            raise ValueError(f"Unknown importance kind '{kind}'. Expected 'model' or 'permutation'")
+        if model_name not in self.model_info:
+            return {}
+        importance = self._model_arrays(model_name)[1].get('importance' if kind == 'model' else 'permutation_importance')
+        if importance is None:
+            return {}
+        order = np.argsort(-importance, kind='stable')
+        return {self.feature_names[i]: float(importance[i]) for i in order}
+
+
+def check_parity(predictor, compiled: CompiledInterviewPredictor, X, atol: float = 1e-9) -> Dict[str, Dict[str, Any]]:
+    """Compare compiled probabilities with sklearn's predict_proba for every model"""
+    X_scaled = predictor.scaler.transform(X)
+    report = {}
+    for name in compiled.model_info:
+        expected = predictor.models[name].predict_proba(X_scaled)
+        actual = compiled.predict_proba(X, name)
+        max_diff = float(np.abs(expected - actual).max()) if len(expected) else 0.0
+        report[name] = {'max_abs_diff': max_diff, 'passed': max_diff <= atol}
+    return report
+
+
+def sample_feature_rows(compiled: CompiledInterviewPredictor, n_rows: int = 10000, seed: int = 42) -> np.ndarray:
+    """Rows spread around the training distribution (scaler mean +- 3 std), rounded like the survey features"""
+    rng = np.random.default_rng(seed)
+    mean, scale = compiled.arrays['scaler_mean'], compiled.arrays['scaler_scale']
+    return np.round(mean + scale * rng.uniform(-3, 3, size=(n_rows, len(mean))))
+
+
+def main():
+    """Export the trained predictor, compare its size and load time with the
+    unpacked export, check parity with sklearn and time both paths, then
+    check and time the per-feature explanations
+
+    The export goes to a temporary file, so the shipped compiled model is
+    left alone; --write replaces it with the fresh export.
+
+    Usage: python compiled_predictor.py [interview_predictor.pkl] [--write]
+    """
+    from interview_predictor import SimpleInterviewPredictor
+
+    args = [arg for arg in sys.argv[1:] if arg != '--write']
+    write = '--write' in sys.argv[1:]
+    model_path = args[0] if args else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), 'trained_models', 'interview_predictor.pkl'
+    )
+
+    start = time.perf_counter()
+    predictor = SimpleInterviewPredictor()
+    predictor.load_model(model_path)
+    pickle_load_ms = (time.perf_counter() - start) * 1000
+    if not predictor.models:
+        print("No trained models in the predictor - run train_simple_pipeline.py first")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        export_path = compiled_model_path(model_path) if write else os.path.join(tmp_dir, 'compiled.npz')
+        export_compiled_predictor(predictor, export_path)
+        start = time.perf_counter()
+        compiled = CompiledInterviewPredictor.load(export_path)
+        compiled_load_ms = (time.perf_counter() - start) * 1000
+        compiled_bytes = os.path.getsize(export_path)
+        paths_path = compiled_paths_path(export_path)
+        paths_bytes = os.path.getsize(paths_path) if os.path.exists(paths_path) else 0
+        # The path tables are read on the first explanation, while the export still exists
+        first_explain_ms = {}
+        for name in compiled.model_info:
+            start = time.perf_counter()
+            compiled.explain(sample_feature_rows(compiled, n_rows=1), name)
+            first_explain_ms[name] = (time.perf_counter() - start) * 1000
+
+        # Same export without packing, for the size/load comparison
+        raw_path = os.path.join(tmp_dir, 'raw.npz')
+        with contextlib.redirect_stdout(io.StringIO()):
+            export_compiled_predictor(predictor, raw_path, compact=False)
+        start = time.perf_counter()
+        raw = CompiledInterviewPredictor.load(raw_path)
+        raw_load_ms = (time.perf_counter() - start) * 1000
+        raw_bytes = os.path.getsize(raw_path)
+
+    print("\nSize")
+    print("-" * 40)
+    print(f"   pickle={os.path.getsize(model_path) / 1024:.0f}KB  compiled raw={raw_bytes / 1024:.0f}KB "
+          f"({raw_load_ms:.1f}ms load)  compiled compact={compiled_bytes / 1024:.0f}KB "
+          f"({compiled_load_ms:.1f}ms load)  explain path tables={paths_bytes / 1024:.0f}KB")
+    for name, pruned in predictor.compaction.items():
+        print(f"   {name:<22} pruned at train time: {pruned['trees_before']} -> {pruned['trees_after']} trees, "
+              f"validation accuracy {pruned['accuracy_before']:.2%} -> {pruned['accuracy_after']:.2%}, "
+              f"{pruned['pickle_bytes_before'] / 1024:.0f}KB -> {pruned['pickle_bytes_after'] / 1024:.0f}KB")
+
+    X = sample_feature_rows(compiled)
+    raw_diff = max(float(np.abs(raw.predict_proba(X, name) - compiled.predict_proba(X, name)).max())
+                   for name in compiled.model_info)
+    print(f"   compact vs raw max |diff|={raw_diff:.2e}")
+
+    print("\nParity with sklearn predict_proba")
+    print("-" * 40)
+    report = check_parity(predictor, compiled, X)
+    for name, result in report.items():
+        print(f"   {name:<22} max |diff|={result['max_abs_diff']:.2e}  {'OK' if result['passed'] else 'MISMATCH'}")
+
+    print("\nLatency")
+    print("-" * 40)
+    print(f"   load: pickle={pickle_load_ms:.1f}ms  compiled={compiled_load_ms:.1f}ms")
+    for name in compiled.model_info:
+        model = predictor.models[name]
+        for n_rows in (1, len(X)):
+            batch = X[:n_rows]
+            start = time.perf_counter()
+            model.predict_proba(predictor.scaler.transform(batch))
+            sklearn_ms = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+            compiled.predict_proba(batch, name)
+            compiled_ms = (time.perf_counter() - start) * 1000
+            print(f"   {name:<22} {n_rows:>6} rows  sklearn={sklearn_ms:.2f}ms  compiled={compiled_ms:.2f}ms")
+
+    print("\nExplanations (base value + contributions vs. model output)")
+    print("-" * 40)
+    for name in compiled.model_info:
+        batch = X[:100]
+        start = time.perf_counter()
+        explanation = compiled.explain(batch, name)
+        per_row_ms = (time.perf_counter() - start) * 1000 / len(batch)
+        if explanation['output'] == 'probability':
+            expected = compiled.predict_proba(batch, name)[:, 1]
+        else:
+            expected = predictor.models[name].decision_function(predictor.scaler.transform(batch))
+        total = explanation['base_value'] + explanation['contributions'].sum(axis=1)
+        print(f"   {name:<22} max |diff|={np.abs(total - expected).max():.2e}  {per_row_ms:.2f}ms/row  "
+              f"first row={first_explain_ms[name]:.1f}ms")
+
+    if raw_diff > 0 or not all(result['passed'] for result in report.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
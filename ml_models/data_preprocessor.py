@@ -8,13 +8,18 @@ import pandas as pd
 import numpy as np
 import pickle
 import os
-from typing import Tuple, Dict, Any
+import csv
+import time
+from typing import Tuple, Dict, Any, Iterator, List
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.impute import SimpleImputer
 
 class EnhancedDataPreprocessor:
     """Advanced data preprocessing for interview datasets"""
     
+    QUESTION_COLUMNS = ['Question Number', 'Question', 'Answer', 'Category', 'Difficulty']
+    CLEANED_TEXT_COLUMNS = ['cleaned_question', 'cleaned_answer', 'combined_text']
+    
     def __init__(self):
         self.scalers = {}
         self.label_encoders = {}
@@ -84,47 +89,12 @@ class EnhancedDataPreprocessor:
         print("📚 Loading and preprocessing questions data...")
         
         try:
-            # Robust CSV load that tolerates unquoted commas in the Answer field
-            import csv
-            rows = []
-            with open(file_path, 'r', encoding='latin-1', newline='') as f:
-                reader = csv.reader(f)
-                header = next(reader, None)
-                for fields in reader:
-                    if not fields:
-                        continue
-                    # Expect at least 5 columns: [Question Number, Question, Answer, Category, Difficulty]
-                    if len(fields) < 5:
-                        continue
-                    question_number = fields[0].strip()
-                    category = fields[-2].strip()
-                    difficulty = fields[-1].strip()
-                    question = fields[1].strip()
-                    # Join middle fields back into Answer to handle commas inside answers
-                    answer_parts = fields[2:-2]
-                    answer = ",".join(part.strip() for part in answer_parts)
-                    rows.append({
-                        'Question Number': question_number,
-                        'Question': question,
-                        'Answer': answer,
-                        'Category': category,
-                        'Difficulty': difficulty,
-                    })
+            rows = [row for chunk in self._iter_question_row_chunks(file_path) for row in chunk]
 
-            df = pd.DataFrame(rows)
+            df = pd.DataFrame(rows, columns=self.QUESTION_COLUMNS)
             print(f"✅ Loaded {len(df)} questions")
 
-            # Clean and validate data
-            df = df.dropna(subset=['Question', 'Answer', 'Category', 'Difficulty'])
-            df['Question'] = df['Question'].astype(str)
-            df['Answer'] = df['Answer'].astype(str)
-
-            # Clean text data
-            df['cleaned_question'] = df['Question'].apply(self._clean_text)
-            df['cleaned_answer'] = df['Answer'].apply(self._clean_text)
-
-            # Create combined text for vectorization
-            df['combined_text'] = df['cleaned_question'] + ' ' + df['cleaned_answer']
+            df = self._preprocess_questions_frame(df)
 
             print(f"✅ Preprocessed {len(df)} questions")
 
@@ -140,6 +110,110 @@ class EnhancedDataPreprocessor:
             print(f"❌ Error processing questions: {e}")
             raise
     
+    def stream_questions_data(self, file_path: str, output_path: str, chunk_size: int = 50000) -> Dict[str, Any]:
+        """Preprocess a large questions CSV chunk by chunk into a Parquet file
+
+        Only one chunk is held in memory at a time, so peak memory stays
+        bounded regardless of the size of the question bank. Requires pyarrow.
+
+        Args:
+            file_path: Questions CSV (same layout as load_and_preprocess_questions_data)
+            output_path: Destination Parquet file
+            chunk_size: Number of rows processed per chunk
+
+        Returns:
+            Summary with row count, elapsed seconds and throughput
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for streaming preprocessing (pip install pyarrow)")
+
+        print(f"📚 Streaming questions data in chunks of {chunk_size}...")
+
+        start_time = time.time()
+        total_rows = 0
+        categories = set()
+        difficulties = set()
+        schema = pa.schema([(col, pa.string()) for col in self.QUESTION_COLUMNS + self.CLEANED_TEXT_COLUMNS])
+        writer = pq.ParquetWriter(output_path, schema)
+
+        try:
+            for chunk_rows in self._iter_question_row_chunks(file_path, chunk_size):
+                df = pd.DataFrame(chunk_rows, columns=self.QUESTION_COLUMNS)
+                df = self._preprocess_questions_frame(df)
+
+                writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+
+                total_rows += len(df)
+                categories.update(df['Category'].unique().tolist())
+                difficulties.update(df['Difficulty'].unique().tolist())
+
+                elapsed = time.time() - start_time
+                print(f"   ⏳ {total_rows:,} questions processed ({total_rows / max(elapsed, 1e-9):,.0f} rows/s)")
+        finally:
+            writer.close()
+
+        elapsed = time.time() - start_time
+        print(f"✅ Streamed {total_rows:,} questions to {output_path} in {elapsed:.2f}s")
+
+        self.preprocessing_info['questions_data'] = {
+            'total_questions': total_rows,
+            'categories': sorted(categories),
+            'difficulties': sorted(difficulties)
+        }
+
+        return {
+            'total_questions': total_rows,
+            'elapsed_seconds': elapsed,
+            'rows_per_second': total_rows / max(elapsed, 1e-9),
+            'output_path': output_path
+        }
+
+    def _iter_question_row_chunks(self, file_path: str, chunk_size: int = 50000) -> Iterator[List[list]]:
+        """Yield lists of parsed question rows from the questions CSV"""
+        # Robust CSV load that tolerates unquoted commas in the Answer field
+        chunk = []
+        with open(file_path, 'r', encoding='latin-1', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            for fields in reader:
+                if not fields:
+                    continue
+                # Expect at least 5 columns: [Question Number, Question, Answer, Category, Difficulty]
+                if len(fields) < 5:
+                    continue
+                question_number = fields[0].strip()
+                category = fields[-2].strip()
+                difficulty = fields[-1].strip()
+                question = fields[1].strip()
+                # Join middle fields back into Answer to handle commas inside answers
+                answer_parts = fields[2:-2]
+                answer = ",".join(part.strip() for part in answer_parts)
+                chunk.append([question_number, question, answer, category, difficulty])
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+        if chunk:
+            yield chunk
+
+    def _preprocess_questions_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Validate questions and add cleaned text columns"""
+        # Clean and validate data
+        df = df.dropna(subset=['Question', 'Answer', 'Category', 'Difficulty'])
+        df['Question'] = df['Question'].astype(str)
+        df['Answer'] = df['Answer'].astype(str)
+
+        # Clean text data (the recommender trains on these columns as they are)
+        df['cleaned_question'] = self._clean_question_text_series(df['Question'])
+        df['cleaned_answer'] = self._clean_question_text_series(df['Answer'])
+
+        # Create combined text for vectorization
+        df['combined_text'] = df['cleaned_question'] + ' ' + df['cleaned_answer']
+
+        return df
+
     def _clean_features(self, df: pd.DataFrame, feature_columns: list) -> pd.DataFrame:
         """Clean and preprocess feature columns"""
         for col in feature_columns:
@@ -224,6 +298,21 @@ class EnhancedDataPreprocessor:
         
         return text
     
+    def _clean_question_text_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized SimpleQuestionRecommender._simple_text_cleaning for a whole column
+
+        Unlike _clean_text, digits are kept and other characters become
+        spaces, so the vocabulary matches questions the recommender adds
+        later with its own cleaning.
+        """
+        return (
+            series.fillna('')
+            .str.lower()
+            .str.replace(r'[^a-zA-Z0-9\s]', ' ', regex=True)
+            .str.replace(r'\s+', ' ', regex=True)
+            .str.strip()
+        )
+    
     def prepare_ml_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """Prepare data for ML training"""
         print("🔧 Preparing data for ML training...")
@@ -8,12 +8,37 @@ import sys
 import json
 import os
 import re
-import random
+import numpy as np
 
 # Add current directory to path so we can import our ML modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from question_recommender import SimpleQuestionRecommender
+from seen_questions import SeenQuestionStore
+from techstack_matcher import get_default_matcher, DEFAULT_CATEGORY
+
+# Candidate pool size (x amount) gathered for diverse and topic-balanced selection
+DIVERSE_POOL_FACTOR = 3
+
+# Relevance lost from the first to the last candidate of the diverse pool
+DIVERSE_RELEVANCE_DECAY = 0.1
+
+# Categories blended first in mixed interviews
+MIXED_PREFERRED_CATEGORIES = ['Behavioral', 'System Design', 'Algorithms', 'Back-end', 'Front-end', 'Security', 'DevOps']
+
+# Related categories used as fallback when the chosen category runs short
+RELATED_CATEGORIES = {
+    'Languages and Frameworks': ['General Programming', 'Back-end', 'Front-end'],
+    'Back-end': ['Languages and Frameworks', 'Database and SQL', 'System Design'],
+    'Front-end': ['Languages and Frameworks', 'Web Development', 'General Programming'],
+    'Database and SQL': ['Back-end', 'System Design', 'General Programming'],
+    'DevOps': ['System Design', 'Back-end', 'Security'],
+    'Machine Learning': ['Data Engineering', 'Algorithms', 'General Programming'],
+    'Data Engineering': ['Machine Learning', 'Database and SQL', 'Algorithms'],
+    'Security': ['System Design', 'Back-end', 'General Programming'],
+    'Software Testing': ['General Programming', 'Back-end', 'Front-end'],
+    'System Design': ['Back-end', 'DevOps', 'Security']
+}
 
 def clean_question_text(question):
     """Clean question text to be voice assistant friendly"""
@@ -25,188 +50,163 @@ def clean_question_text(question):
 
 def map_techstack_to_category(techstack, role=None):
     """Map tech stack to question categories based on available dataset categories"""
-    techstack_lower = techstack.lower()
+    return get_default_matcher().map_to_category(techstack, role)
+
+def map_techstack_to_category_weights(techstack, role=None):
+    """Map a (multi-technology) tech stack to a weighted category distribution"""
+    return get_default_matcher().match_categories(techstack, role)
+
+def map_level_to_difficulty(level):
+    """Map experience level to difficulty"""
+    level_lower = level.lower()
+    
+    if 'junior' in level_lower or 'entry' in level_lower:
+        return 'Easy'
+    elif 'senior' in level_lower or 'lead' in level_lower:
+        return 'Hard'
+    else:
+        return 'Medium'
+
+def plan_question_buckets(category, difficulty, type_focus, all_categories, all_difficulties, amount,
+                          category_weights=None):
+    """Turn the request into an ordered list of buckets to draw questions from
     
-    # Role-specific priority mapping
-    if role and 'machine learning' in role.lower():
-        if 'python' in techstack_lower or 'machine learning' in techstack_lower or 'deep learning' in techstack_lower:
-            return 'Machine Learning'
+    Each step names a (category, difficulty) bucket (None means any) and how
+    many questions to take from it, in the priority order of the fallback
+    strategies:
+      1. chosen category and difficulty (up to 2x amount), split across
+         category_weights when the tech stack matched several categories
+      2. same category, other difficulties
+         (mixed interviews: 2 questions from each category, blended)
+      3. related categories, same difficulty
+      4. all other categories, same difficulty
+      5. anything
+    'fill' steps only take what is still missing and are skipped once
+    amount questions have been drawn.
+    """
+    plan = []
     
-    if role and 'data scientist' in role.lower():
-        if 'python' in techstack_lower or 'machine learning' in techstack_lower or 'data analysis' in techstack_lower:
-            return 'Machine Learning'
+    # Strategy 1: chosen category (or weighted categories) and difficulty
+    if category and difficulty and category != 'Mixed':
+        weights = category_weights or {category: 1.0}
+        plan.append({
+            'kind': 'weighted',
+            'buckets': [(cat, difficulty, weight) for cat, weight in weights.items()],
+            'limit': amount * 2
+        })
     
-    if role and 'data engineer' in role.lower():
-        if 'python' in techstack_lower or 'data' in techstack_lower or 'apache spark' in techstack_lower:
-            return 'Data Engineering'
+    # Strategy 2: same category, different difficulties
+    if category:
+        for diff in all_difficulties:
+            if diff != difficulty:
+                plan.append({'kind': 'fill', 'category': category, 'difficulty': diff})
     
-    if role and 'devops' in role.lower():
-        if 'docker' in techstack_lower or 'kubernetes' in techstack_lower or 'aws' in techstack_lower:
-            return 'DevOps'
+    # Mixed interview: blend multiple categories
+    if type_focus and 'mixed' in type_focus.lower():
+        mix_categories = MIXED_PREFERRED_CATEGORIES + [c for c in all_categories if c not in MIXED_PREFERRED_CATEGORIES]
+        plan.append({'kind': 'mixed', 'categories': mix_categories, 'per_category': 2, 'pool_limit': amount * 3})
     
-    if role and 'security' in role.lower():
-        if 'security' in techstack_lower or 'oauth' in techstack_lower or 'jwt' in techstack_lower:
-            return 'Security'
+    # Strategy 3: related categories based on tech stack
+    related = RELATED_CATEGORIES.get(category, [])
+    for related_cat in related:
+        plan.append({'kind': 'fill', 'category': related_cat, 'difficulty': difficulty})
     
-    if role and 'qa' in role.lower() or 'testing' in role.lower():
-        if 'testing' in techstack_lower or 'jest' in techstack_lower or 'cypress' in techstack_lower:
-            return 'Software Testing'
+    # Strategy 4: different categories, same difficulty
+    if difficulty:
+        for cat in all_categories:
+            if cat != category and cat not in related:
+                plan.append({'kind': 'fill', 'category': cat, 'difficulty': difficulty})
     
-    if role and 'database' in role.lower():
-        if 'sql' in techstack_lower or 'mysql' in techstack_lower or 'postgresql' in techstack_lower:
-            return 'Database and SQL'
+    # Strategy 5: any category/difficulty
+    plan.append({'kind': 'fill', 'category': None, 'difficulty': None})
     
-    category_mapping = {
-        # Frontend technologies
-        'javascript': 'Front-end',
-        'js': 'Front-end',
-        'react': 'Front-end',
-        'vue': 'Front-end',
-        'angular': 'Front-end',
-        'html': 'Front-end',
-        'css': 'Front-end',
-        'typescript': 'Front-end',
-        'ts': 'Front-end',
-        'jquery': 'Front-end',
-        'bootstrap': 'Front-end',
-        'tailwind': 'Front-end',
-        'sass': 'Front-end',
-        'scss': 'Front-end',
-        
-        # Backend technologies
-        'node': 'Back-end',
-        'express': 'Back-end',
-        'python': 'Languages and Frameworks',
-        'django': 'Back-end',
-        'flask': 'Back-end',
-        'fastapi': 'Back-end',
-        'java': 'Back-end',
-        'spring': 'Back-end',
-        'php': 'Back-end',
-        'laravel': 'Back-end',
-        'ruby': 'Back-end',
-        'rails': 'Back-end',
-        'go': 'Back-end',
-        'rust': 'Back-end',
-        'c#': 'Back-end',
-        '.net': 'Back-end',
-        
-        # Database technologies
-        'sql': 'Database and SQL',
-        'mysql': 'Database and SQL',
-        'postgresql': 'Database and SQL',
-        'mongodb': 'Database and SQL',
-        'redis': 'Database and SQL',
-        'sqlite': 'Database and SQL',
-        
-        # DevOps technologies
-        'docker': 'DevOps',
-        'kubernetes': 'DevOps',
-        'aws': 'DevOps',
-        'azure': 'DevOps',
-        'gcp': 'DevOps',
-        'jenkins': 'DevOps',
-        'git': 'Version Control',
-        'github': 'Version Control',
-        'gitlab': 'Version Control',
-        
-        # Data structures and algorithms
-        'data': 'Data Structures',
-        'algorithm': 'Algorithms',
-        'dsa': 'Data Structures',
-        'algorithms': 'Algorithms',
-        'machine learning': 'Machine Learning',
-        'deep learning': 'Machine Learning',
-        'tensorflow': 'Machine Learning',
-        'pytorch': 'Machine Learning',
-        'scikit-learn': 'Machine Learning',
-        'data analysis': 'Data Engineering',
-        'statistics': 'Data Engineering',
-        'jupyter': 'Data Engineering',
-        'apache spark': 'Data Engineering',
-        'react native': 'Front-end',
-        'flutter': 'Front-end',
-        'swift': 'Front-end',
-        'kotlin': 'Front-end',
-        'ios': 'Front-end',
-        'android': 'Front-end',
-        'figma': 'Front-end',
-        'sketch': 'Front-end',
-        'adobe xd': 'Front-end',
-        'prototyping': 'Front-end',
-        'user research': 'Front-end',
-        'wireframing': 'Front-end',
-        'design systems': 'Front-end',
-        'agile': 'Software Testing',
-        'scrum': 'Software Testing',
-        'team management': 'Software Testing',
-        'project management': 'Software Testing',
-        'api testing': 'Software Testing',
-        'automation': 'Software Testing',
-        'manual testing': 'Software Testing',
-        'linux': 'DevOps',
-        'windows': 'DevOps',
-        'shell scripting': 'DevOps',
-        'ci/cd': 'DevOps',
-        'terraform': 'DevOps',
-        'infrastructure as code': 'DevOps',
-        'networking': 'Networking',
-        'network security': 'Security',
-        'application security': 'Security',
-        'penetration testing': 'Security',
-        'oracle': 'Database and SQL',
-        'database design': 'Database and SQL',
-        'performance tuning': 'Database and SQL',
-        'backup and recovery': 'Database and SQL',
-        'analytics': 'Data Engineering',
-        
-        # Security
-        'security': 'Security',
-        'oauth': 'Security',
-        'jwt': 'Security',
-        
-        # Testing
-        'testing': 'Software Testing',
-        'jest': 'Software Testing',
-        'cypress': 'Software Testing',
-        'selenium': 'Software Testing',
+    for priority, step in enumerate(plan):
+        step['priority'] = priority
+    
+    return plan
+
+def draw_planned_questions(recommender, plan, amount, rng):
+    """Draw question rows for a plan in a single pass over precomputed buckets
+    
+    Every bucket draw is a partial shuffle costing O(questions taken), so
+    the whole set costs O(amount) plus the number of plan steps. Draws skip
+    rows whose near-duplicate cluster was already drawn, so every row
+    counts toward amount and the result has one row per cluster.
+    """
+    rows = []
+    taken_clusters = set()
+    
+    for step in plan:
+        if step['kind'] == 'weighted':
+            rows.extend(recommender.sample_weighted_bucket_rows(step['buckets'], step['limit'], rng, taken_clusters))
         
-        # System Design
-        'system': 'System Design',
-        'architecture': 'System Design',
-        'microservices': 'System Design',
-        'api': 'System Design',
+        elif step['kind'] == 'fill':
+            if len(rows) < amount:
+                rows.extend(recommender.sample_bucket_rows(
+                    step['category'], step['difficulty'], amount - len(rows), rng, taken_clusters
+                ))
         
-        # Web Development (general)
-        'web': 'Web Development',
-        'http': 'Web Development',
-        'https': 'Web Development',
-        'rest': 'Web Development',
-        'api': 'Web Development'
-    }
-    
-    # Find matching category
-    for tech, category in category_mapping.items():
-        if tech in techstack_lower:
-            return category
+        elif step['kind'] == 'mixed':
+            if len(rows) < amount:
+                mix_pool = []
+                for cat in step['categories']:
+                    mix_pool.extend(recommender.sample_bucket_rows(cat, None, step['per_category'], rng, taken_clusters))
+                    if len(mix_pool) >= step['pool_limit']:
+                        break
+                rng.shuffle(mix_pool)
+                keep = max(0, amount - len(rows))
+                # Rows shuffled out of the blend leave their clusters to later steps
+                for row in mix_pool[keep:]:
+                    taken_clusters.discard(recommender.duplicate_key(row))
+                rows.extend(mix_pool[:keep])
     
-    # Default category
-    return 'General Programming'
+    return np.asarray(rows, dtype=np.int64)
 
-def map_level_to_difficulty(level):
-    """Map experience level to difficulty"""
-    level_lower = level.lower()
+def exclude_seen_questions(recommender, seen_store, user_id, amount):
+    """Exclude the questions a user has already been asked from the draw
     
-    if 'junior' in level_lower or 'entry' in level_lower:
-        return 'Easy'
-    elif 'senior' in level_lower or 'lead' in level_lower:
-        return 'Hard'
+    Once fewer than amount questions are left unseen the user's history is
+    reset, so they cycle through the bank again instead of being shown
+    repeats from then on.
+    """
+    seen_mask = seen_store.get_mask(user_id, len(recommender.questions_df),
+                                    recommender.get_question_row_hashes())
+    if len(seen_mask) - int(seen_mask.sum()) >= amount:
+        recommender.set_exclude_mask(seen_mask)
     else:
-        return 'Medium'
+        seen_store.reset(user_id)
+        recommender.set_exclude_mask(None)
+
+def select_diverse_questions(recommender, candidate_rows, amount):
+    """Pick amount question rows from an ordered candidate pool using MMR
+    
+    Earlier candidates (from higher-priority strategies) are slightly more
+    relevant; the MMR step trades that off against similarity to the
+    questions already picked.
+    """
+    candidate_rows = np.asarray(candidate_rows, dtype=np.int64)
+    if len(candidate_rows) <= amount:
+        return candidate_rows
+    
+    # Relevance decays with the strategy order of the pool, gently enough
+    # that similarity to the picks still decides within it
+    relevance = 1.0 - DIVERSE_RELEVANCE_DECAY * np.arange(len(candidate_rows)) / len(candidate_rows)
+    return recommender.select_diverse_rows(candidate_rows, amount, relevance=relevance)
 
-def generate_questions(role, level, techstack, type_focus, amount):
-    """Generate interview questions using ML models"""
+def generate_questions(role, level, techstack, type_focus, amount, user_id=None, seen_store=None,
+                       selection_mode='random', seed=None):
+    """Generate interview questions using ML models
+    
+    selection_mode 'random' keeps the strategies' own random picks; 'diverse'
+    gathers a larger candidate pool and picks a set of questions that are
+    as dissimilar to each other as possible (maximal marginal relevance);
+    'topic' gathers the same pool and takes questions round-robin across
+    the bank's topic clusters.
+    Passing a seed makes the selection reproducible.
+    """
     try:
+        rng = np.random.default_rng(seed)
+        
         # Initialize question recommender
         recommender = SimpleQuestionRecommender()
         
@@ -217,15 +217,22 @@ def generate_questions(role, level, techstack, type_focus, amount):
         
         recommender.load_model(model_path)
         
+        # Skip questions this user has already been asked
+        if user_id:
+            seen_store = seen_store or SeenQuestionStore()
+            exclude_seen_questions(recommender, seen_store, user_id, amount)
+        
         # Map inputs to ML model parameters
-        category = map_techstack_to_category(techstack, role)
+        category_weights = map_techstack_to_category_weights(techstack, role)
+        category = next(iter(category_weights), DEFAULT_CATEGORY)
         difficulty = map_level_to_difficulty(level)
         
         # Get all available categories and difficulties for better variety
         all_categories = recommender.get_all_categories()
         all_difficulties = recommender.get_all_difficulties()
         
-        questions = []
+        # Diverse and topic-balanced selection need a larger pool to choose from
+        pool_amount = amount * DIVERSE_POOL_FACTOR if selection_mode in ('diverse', 'topic') else amount
         
         # If user explicitly chose an interview type, honor it
         explicit_category = None
@@ -247,99 +254,25 @@ def generate_questions(role, level, techstack, type_focus, amount):
         # If explicit category provided, override base category (except Mixed)
         if explicit_category and explicit_category != 'Mixed':
             category = explicit_category
-
-        # Strategy 1: Get questions from the chosen category and difficulty
-        if category and difficulty and category != 'Mixed':
-            category_questions = recommender.get_questions_by_filters(
-                category=category,
-                difficulty=difficulty,
-                limit=amount * 2  # Get more to allow for random selection
-            )
-            if len(category_questions) > 0:
-                questions.extend(category_questions['Question'].tolist())
-        
-        # Strategy 2: If we don't have enough, get questions from the same category but different difficulties
-        if len(questions) < amount and category:
-            for diff in all_difficulties:
-                if diff != difficulty:
-                    more_questions = recommender.get_questions_by_filters(
-                        category=category,
-                        difficulty=diff,
-                        limit=amount - len(questions)
-                    )
-                    if len(more_questions) > 0:
-                        questions.extend(more_questions['Question'].tolist())
-                        if len(questions) >= amount:
-                            break
         
-        # Mixed interview: blend multiple categories
-        if (type_focus and 'mixed' in type_focus.lower()) and len(questions) < amount:
-            mix_pool = []
-            preferred = ['Behavioral', 'System Design', 'Algorithms', 'Back-end', 'Front-end', 'Security', 'DevOps']
-            for cat in preferred + [c for c in all_categories if c not in preferred]:
-                more = recommender.get_questions_by_filters(category=cat, limit=2)
-                if len(more) > 0:
-                    mix_pool.extend(more['Question'].tolist())
-                if len(mix_pool) >= amount * 3:
-                    break
-            random.shuffle(mix_pool)
-            questions.extend(mix_pool[:max(0, amount - len(questions))])
+        # The first strategy is spread across every matched category unless
+        # the interview type pins a single one
+        if category not in category_weights:
+            category_weights = {category: 1.0}
 
-        # Strategy 3: If still not enough, prioritize related categories based on tech stack
-        if len(questions) < amount:
-            # Define related categories for better fallback
-            related_categories = {
-                'Languages and Frameworks': ['General Programming', 'Back-end', 'Front-end'],
-                'Back-end': ['Languages and Frameworks', 'Database and SQL', 'System Design'],
-                'Front-end': ['Languages and Frameworks', 'Web Development', 'General Programming'],
-                'Database and SQL': ['Back-end', 'System Design', 'General Programming'],
-                'DevOps': ['System Design', 'Back-end', 'Security'],
-                'Machine Learning': ['Data Engineering', 'Algorithms', 'General Programming'],
-                'Data Engineering': ['Machine Learning', 'Database and SQL', 'Algorithms'],
-                'Security': ['System Design', 'Back-end', 'General Programming'],
-                'Software Testing': ['General Programming', 'Back-end', 'Front-end'],
-                'System Design': ['Back-end', 'DevOps', 'Security']
-            }
-            
-            # Try related categories first
-            if category in related_categories:
-                for related_cat in related_categories[category]:
-                    if len(questions) >= amount:
-                        break
-                    more_questions = recommender.get_questions_by_filters(
-                        category=related_cat,
-                        difficulty=difficulty,
-                        limit=amount - len(questions)
-                    )
-                    if len(more_questions) > 0:
-                        questions.extend(more_questions['Question'].tolist())
-        
-        # Strategy 4: If still not enough, get questions from different categories but same difficulty
-        if len(questions) < amount and difficulty:
-            for cat in all_categories:
-                if cat != category and cat not in (related_categories.get(category, []) if category in related_categories else []):
-                    more_questions = recommender.get_questions_by_filters(
-                        category=cat,
-                        difficulty=difficulty,
-                        limit=amount - len(questions)
-                    )
-                    if len(more_questions) > 0:
-                        questions.extend(more_questions['Question'].tolist())
-                        if len(questions) >= amount:
-                            break
-        
-        # Strategy 5: If still not enough, get random questions from any category/difficulty
-        if len(questions) < amount:
-            all_questions = recommender.get_questions_by_filters(limit=amount * 3)
-            if len(all_questions) > 0:
-                all_question_list = all_questions['Question'].tolist()
-                # Randomly sample to avoid always getting the same questions
-                random.shuffle(all_question_list)
-                questions.extend(all_question_list[:amount - len(questions)])
-        
-        # Remove duplicates and limit to requested amount
-        unique_questions = list(dict.fromkeys(questions))  # Preserves order while removing duplicates
-        questions = unique_questions[:amount]
+        # Plan the (category, difficulty) buckets in fallback priority order,
+        # then draw the whole question set from them in one pass, taking
+        # one question per near-duplicate cluster
+        plan = plan_question_buckets(category, difficulty, type_focus, all_categories,
+                                     all_difficulties, pool_amount, category_weights)
+        rows = draw_planned_questions(recommender, plan, pool_amount, rng)
+        if selection_mode == 'diverse':
+            rows = select_diverse_questions(recommender, rows, amount)
+        elif selection_mode == 'topic':
+            rows = recommender.select_topic_balanced_rows(rows, amount)
+        else:
+            rows = rows[:amount]
+        questions = recommender.questions_df['Question'].iloc[rows].tolist()
         
         # If we still don't have enough questions, use fallback questions
         if len(questions) < amount:
@@ -357,6 +290,11 @@ def generate_questions(role, level, techstack, type_focus, amount):
             ]
             questions.extend(fallback_questions[:amount - len(questions)])
         
+        # Remember what this user was asked for their next session
+        if user_id:
+            seen_store.mark_seen(user_id, recommender.get_row_ids_for_questions(questions))
+            seen_store.merge(user_id)
+        
         # Clean questions for voice assistant
         cleaned_questions = [clean_question_text(q) for q in questions]
         
@@ -381,7 +319,7 @@ def main():
     try:
         # Read input from command line arguments
         if len(sys.argv) < 6:
-            raise ValueError("Insufficient arguments. Expected: role level techstack type amount")
+            raise ValueError("Insufficient arguments. Expected: role level techstack type amount [user_id] [selection_mode] [seed]")
         
         # Extract parameters from command line arguments
         role = sys.argv[1]
@@ -389,9 +327,13 @@ def main():
         techstack = sys.argv[3]
         type_focus = sys.argv[4]
         amount = int(sys.argv[5])
+        user_id = sys.argv[6] if len(sys.argv) > 6 and sys.argv[6] else None
+        selection_mode = sys.argv[7] if len(sys.argv) > 7 and sys.argv[7] else 'random'
+        seed = int(sys.argv[8]) if len(sys.argv) > 8 and sys.argv[8] else None
         
         # Generate questions using ML
-        result = generate_questions(role, level, techstack, type_focus, amount)
+        result = generate_questions(role, level, techstack, type_focus, amount, user_id,
+                                    selection_mode=selection_mode, seed=seed)
         
         # Output to stdout (Next.js will read this)
         print(json.dumps(result))
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Interview Outcome Log for ML Pipeline
+Append-only SQLite log of observed interview outcomes, used for incremental retraining
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+import pandas as pd
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# Add current directory to path so we can import our ML modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from interview_predictor import SimpleInterviewPredictor, build_feature_vector
+
+DEFAULT_OUTCOMES_PATH = os.environ.get('INTERVIEW_OUTCOMES_DB') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'user_data', 'interview_outcomes.sqlite'
+)
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trained_models', 'interview_predictor.pkl')
+
+
+class OutcomeLog:
+    """Completed interviews with their features and observed outcome
+
+    Rows are only ever appended. Ids increase monotonically, so a trained
+    predictor remembers the last id it has seen and a retrain reads only
+    the rows after it. Features are stored as JSON keyed by feature name,
+    so rows stay readable if the model's feature set changes.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or DEFAULT_OUTCOMES_PATH
+        os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS outcomes ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT,'
+            ' interview_id TEXT,'
+            ' recorded_at REAL NOT NULL,'
+            ' features TEXT NOT NULL,'
+            ' outcome INTEGER NOT NULL)'
+        )
+        self._conn.commit()
+
+    def record(self, features: Dict[str, float], outcome: bool, interview_id: Optional[str] = None) -> int:
+        """Append one outcome and return its id"""
+        return self.record_many([(features, outcome, interview_id)])[-1]
+
+    def record_many(self, rows: Iterable[Tuple[Dict[str, float], bool, Optional[str]]]) -> list:
+        """Append (features, outcome, interview_id) rows in one transaction"""
+        ids = []
+        with self._conn:
+            for features, outcome, interview_id in rows:
+                cursor = self._conn.execute(
+                    'INSERT INTO outcomes (interview_id, recorded_at, features, outcome) VALUES (?, ?, ?, ?)',
+                    (interview_id, time.time(), json.dumps({k: float(v) for k, v in features.items()}), int(bool(outcome)))
+                )
+                ids.append(cursor.lastrowid)
+        return ids
+
+    def count(self, since_id: int = 0) -> int:
+        """Number of outcomes recorded after since_id"""
+        return self._conn.execute('SELECT COUNT(*) FROM outcomes WHERE id > ?', (since_id,)).fetchone()[0]
+
+    def last_id(self) -> int:
+        return self._conn.execute('SELECT COALESCE(MAX(id), 0) FROM outcomes').fetchone()[0]
+
+    def fetch(self, since_id: int = 0, feature_names: Optional[list] = None) -> Tuple[int, pd.DataFrame, pd.Series]:
+        """Outcomes after since_id as (last id, features, outcomes)
+
+        Features are ordered as feature_names; names missing from a row are 0.
+        """
+        rows = self._conn.execute(
+            'SELECT id, features, outcome FROM outcomes WHERE id > ? ORDER BY id', (since_id,)
+        ).fetchall()
+        records = [json.loads(features) for _, features, _ in rows]
+        X = pd.DataFrame.from_records(records, columns=feature_names) if records else pd.DataFrame(columns=feature_names)
+        X = X.fillna(0).astype(float)
+        y = pd.Series([outcome for _, _, outcome in rows], name='Interview Verdict', dtype=int)
+        return (rows[-1][0] if rows else since_id), X, y
+
+    def get_stats(self) -> Dict[str, Any]:
+        total, positive = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(outcome), 0) FROM outcomes').fetchone()
+        return {'outcomes': total, 'positive': positive, 'last_id': self.last_id(), 'path': self.db_path}
+
+    def close(self):
+        self._conn.close()
+
+
+def record_interview_outcome(log: OutcomeLog, payload: Dict) -> int:
+    """Append a completed interview (same profile/speech fields as a prediction request)"""
+    if 'outcome' not in payload:
+        raise ValueError("'outcome' (true if the candidate passed) is required")
+    features_df = build_feature_vector(
+        payload.get('profileData', {}), payload.get('speechAnalysis', {}), payload.get('interviewData', {})
+    )
+    return log.record(features_df.iloc[0].to_dict(), payload['outcome'], payload.get('interviewId'))
+
+
+def retrain_from_outcomes(log: OutcomeLog, model_path: str = MODEL_PATH, new_trees: int = 20) -> Dict[str, Any]:
+    """Warm-start the saved predictor on the outcomes it has not seen yet
+
+    The updated predictor (pickle and compiled export) is saved only when
+    the retrain ran; its outcome watermark moves past the rows it used.
+    """
+    predictor = SimpleInterviewPredictor()
+    predictor.load_model(model_path)
+
+    last_id, X_new, y_new = log.fetch(predictor.trained_through_outcome_id, predictor.feature_names)
+    start = time.perf_counter()
+    result = predictor.retrain_incremental(X_new, y_new, new_trees=new_trees)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+
+    if result['retrained']:
+        predictor.trained_through_outcome_id = last_id
+        predictor.save_model(model_path)
+    result['trained_through_outcome_id'] = predictor.trained_through_outcome_id
+    return result
+
+
+def main():
+    """Outcome log CLI
+
+    record:  reads {"interviewId", "outcome", "profileData", "speechAnalysis", "interviewData"} from stdin
+    retrain: python interview_outcomes.py retrain [new_trees]
+    stats:   python interview_outcomes.py stats
+    """
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    log = OutcomeLog()
+    try:
+        if command == 'record':
+            outcome_id = record_interview_outcome(log, json.loads(sys.stdin.read()))
+            result = {'success': True, 'outcome_id': outcome_id}
+        elif command == 'retrain':
+            new_trees = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+            result = {'success': True, **retrain_from_outcomes(log, new_trees=new_trees)}
+        elif command == 'stats':
+            result = {'success': True, 'stats': log.get_stats()}
+        else:
+            result = {'success': False, 'error': f"Unknown command '{command}'. Expected record, retrain or stats"}
+    except json.JSONDecodeError as e:
+        result = {'success': False, 'error': f'Invalid JSON input: {str(e)}'}
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    finally:
+        log.close()
+
+    print(json.dumps(result, default=float))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,15 +10,25 @@ import pickle
 import os
 import sys
 import json
+import time
+import contextlib
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, classification_report
-from sklearn.preprocessing import StandardScaler
+from compiled_predictor import CompiledInterviewPredictor, compiled_model_path, export_compiled_predictor, is_compilable
 import warnings
 warnings.filterwarnings('ignore')
 
+
+def _pickle_size_and_load_ms(model) -> Tuple[int, float]:
+    """Pickled size of a model and the time to unpickle it"""
+    payload = pickle.dumps(model)
+    start = time.perf_counter()
+    pickle.loads(payload)
+    return len(payload), (time.perf_counter() - start) * 1000
+
+
 class SimpleInterviewPredictor:
     """Simple ML models for interview success prediction"""
     
@@ -26,12 +36,51 @@ class SimpleInterviewPredictor:
         self.models = {}
         self.best_model = None
         self.best_model_name = None
-        self.scaler = StandardScaler()
+        # Created when training; sklearn is only imported on the training path
+        self.scaler = None
         self.feature_names = None
         self.model_performance = {}
+        # Per model: feature -> importance, highest first (computed once at train time)
+        self.feature_importance = {}
+        self.permutation_importance = {}
+        # Incremental retraining: last outcome log id folded in, and one report per retrain
+        self.trained_through_outcome_id = 0
+        self.retrain_history = []
+        # Per forest: trees/accuracy/size before and after pruning at train time
+        self.compaction = {}
+        
+    def train_models(self, X: pd.DataFrame, y: pd.Series, permutation_importance: bool = False,
+                     n_jobs: int = -1, search: bool = False, search_method: str = 'random',
+                     cv_folds: int = 5, n_iter: int = 20, time_budget_s: float = 300.0,
+                     max_accuracy_drop: float = 0.0, compact: bool = True,
+                     accuracy_tolerance: float = 0.005, validation_fraction: float = 0.2) -> Dict[str, Any]:
+        """Train simple ML models
+        
+        Feature importances are computed once here and stored with the model.
+        With permutation_importance=True, each model's held-out permutation
+        importance is computed as well, spread over n_jobs processes.
+        
+        With search=True the fixed models are replaced by a stratified
+        k-fold hyperparameter search (see model_search.search_models) over
+        RF/LR and XGBoost/LightGBM when installed, run on n_jobs processes
+        within time_budget_s. The best model is then the fastest one (single
+        row latency) whose held-out accuracy is within max_accuracy_drop of
+        the most accurate one.
+        
+        With compact=True forests are pruned to the fewest trees whose
+        accuracy stays within accuracy_tolerance of the full forest (see
+        compact_forests) before the best model is picked. Pruning is judged
+        on a validation_fraction of the training rows, using copies of the
+        forests fitted without them; a pruned copy replaces its forest. All
+        other models, and forests that could not be pruned, keep their fit
+        on the full training split. The test split only scores and selects
+        models.
+        """
+        from sklearn.base import clone
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.inspection import permutation_importance as compute_permutation_importance
         
-    def train_models(self, X: pd.DataFrame, y: pd.Series) -> Dict[str, Any]:
-        """Train simple ML models"""
         print("🚀 Training Simple Interview Prediction Models...")
         
         # Store feature names
@@ -43,9 +92,82 @@ class SimpleInterviewPredictor:
         )
         
         # Scale features
+        self.scaler = StandardScaler()
         X_train_scaled = self.scaler.fit_transform(X_train)
         X_test_scaled = self.scaler.transform(X_test)
         
+        if search:
+            from model_search import measure_latency, search_models, select_model
+            
+            print(f"🔎 Searching hyperparameters ({search_method}, {cv_folds}-fold CV, budget {time_budget_s:.0f}s)...")
+            results = search_models(
+                X_train_scaled, y_train, X_test_scaled, y_test, method=search_method,
+                cv_folds=cv_folds, n_iter=n_iter, time_budget_s=time_budget_s, n_jobs=n_jobs
+            )
+            self.models = {name: result.pop('model') for name, result in results.items()}
+        else:
+            results = self._train_fixed_models(X_train_scaled, X_test_scaled, y_train, y_test)
+        
+        if compact:
+            from sklearn.metrics import accuracy_score, roc_auc_score
+            
+            # Validation rows for pruning, kept out of the pruning candidates' fit and of the test split
+            X_fit_scaled, X_val_scaled, y_fit, y_val = train_test_split(
+                X_train_scaled, y_train, test_size=validation_fraction, random_state=42
+            )
+            fitted_models = self.models
+            self.models = {
+                name: clone(model).fit(X_fit_scaled, y_fit)
+                for name, model in fitted_models.items() if hasattr(model, 'estimators_')
+            }
+            self.compaction = self.compact_forests(X_val_scaled, y_val, accuracy_tolerance)
+            self.models = {
+                name: self.models[name] if name in self.compaction else model
+                for name, model in fitted_models.items()
+            }
+            # Re-score the pruned forests on the test split
+            for name in self.compaction:
+                model = self.models[name]
+                y_pred = model.predict(X_test_scaled)
+                results[name]['accuracy'] = accuracy_score(y_test, y_pred)
+                results[name]['predictions'] = y_pred
+                if results[name].get('auc') is not None:
+                    results[name]['auc'] = roc_auc_score(y_test, model.predict_proba(X_test_scaled)[:, 1])
+                if search:
+                    # Pruned forests serve faster than the latencies measured during the search
+                    results[name].update(measure_latency(model, X_test_scaled))
+        
+        if search:
+            best_model_name = select_model(results, max_accuracy_drop)
+        else:
+            # Find best model
+            best_model_name = max(results.keys(), key=lambda k: results[k]['accuracy'])
+        
+        for name, model in self.models.items():
+            self.feature_importance[name] = self._model_feature_importance(model)
+            if permutation_importance:
+                permuted = compute_permutation_importance(
+                    model, X_test_scaled, y_test, n_repeats=10, random_state=42, n_jobs=n_jobs
+                )
+                self.permutation_importance[name] = self._sorted_importance(permuted.importances_mean)
+        
+        self.best_model = self.models[best_model_name]
+        self.best_model_name = best_model_name
+        
+        print(f"\n🏆 Best Model: {best_model_name} (Accuracy: {results[best_model_name]['accuracy']:.2%})")
+        
+        # Store performance metrics
+        self.model_performance = results
+        
+        return results
+    
+    def _train_fixed_models(self, X_train_scaled: np.ndarray, X_test_scaled: np.ndarray,
+                            y_train: pd.Series, y_test: pd.Series) -> Dict[str, Any]:
+        """Train the default RF/LR models and score them on the held-out split"""
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.metrics import accuracy_score
+        
         # Define simple models with basic parameters
         models = {
             'Random Forest': RandomForestClassifier(
@@ -83,17 +205,161 @@ class SimpleInterviewPredictor:
             
             print(f"   ✅ {name}: Accuracy={accuracy:.2%}")
         
-        # Find best model
-        best_model_name = max(results.keys(), key=lambda k: results[k]['accuracy'])
-        self.best_model = self.models[best_model_name]
-        self.best_model_name = best_model_name
+        return results
+    
+    def compact_forests(self, X_val_scaled: np.ndarray, y_val: pd.Series,
+                        accuracy_tolerance: float = 0.005, max_probability_shift: float = 0.05,
+                        min_trees: int = 10) -> Dict[str, Any]:
+        """Prune forest trees that barely change the validation predictions
+        
+        Trees are removed greedily, each time the one whose removal moves the
+        validation probabilities least (mean shift from the full forest),
+        while validation accuracy stays within accuracy_tolerance of the full
+        forest, no validation probability moves by more than
+        max_probability_shift and at least min_trees remain. The validation
+        rows must not be used for fitting or for the reported accuracy.
+        Pruned models are updated in place. Returns a before/after report
+        (trees, validation accuracy, pickled size and load time) per pruned
+        forest.
+        """
+        from sklearn.metrics import accuracy_score
+        
+        y_true = np.asarray(y_val)
+        report = {}
+        for name, model in self.models.items():
+            if not hasattr(model, 'estimators_') or not hasattr(model, 'n_classes_'):
+                continue
+            
+            # (trees, rows, classes) probabilities; the forest averages them
+            tree_proba = np.stack([tree.predict_proba(X_val_scaled) for tree in model.estimators_])
+            full_proba = tree_proba.mean(axis=0)
+            full_accuracy = accuracy_score(y_true, model.classes_[full_proba.argmax(axis=1)])
+            kept = list(range(len(tree_proba)))
+            kept_sum = tree_proba.sum(axis=0)
+            accuracy = full_accuracy
+            
+            while len(kept) > min_trees:
+                # Forest probabilities with each remaining tree left out
+                without = (kept_sum[None] - tree_proba[kept]) / (len(kept) - 1)
+                candidate_accuracy = (model.classes_[without.argmax(axis=2)] == y_true).mean(axis=1)
+                shift = np.abs(without - full_proba[None])
+                allowed = (candidate_accuracy >= full_accuracy - accuracy_tolerance) & (shift.max(axis=(1, 2)) <= max_probability_shift)
+                if not allowed.any():
+                    break
+                choice = int(np.argmin(np.where(allowed, shift.mean(axis=(1, 2)), np.inf)))
+                kept_sum = kept_sum - tree_proba[kept[choice]]
+                accuracy = float(candidate_accuracy[choice])
+                del kept[choice]
+            
+            if len(kept) == len(tree_proba):
+                continue
+            
+            before_bytes, before_load_ms = _pickle_size_and_load_ms(model)
+            model.estimators_ = [model.estimators_[i] for i in kept]
+            model.n_estimators = len(kept)
+            after_bytes, after_load_ms = _pickle_size_and_load_ms(model)
+            pruned_proba = kept_sum / len(kept)
+            
+            report[name] = {
+                'trees_before': len(tree_proba),
+                'trees_after': len(kept),
+                'accuracy_before': full_accuracy,
+                'accuracy_after': accuracy,
+                'max_probability_shift': float(np.abs(pruned_proba - full_proba).max()),
+                'pickle_bytes_before': before_bytes,
+                'pickle_bytes_after': after_bytes,
+                'load_ms_before': before_load_ms,
+                'load_ms_after': after_load_ms
+            }
+            print(f"✂️ {name}: {len(tree_proba)} -> {len(kept)} trees, validation accuracy {full_accuracy:.2%} -> {accuracy:.2%}, "
+                  f"{before_bytes / 1024:.0f}KB -> {after_bytes / 1024:.0f}KB, "
+                  f"load {before_load_ms:.1f}ms -> {after_load_ms:.1f}ms")
         
-        print(f"\n🏆 Best Model: {best_model_name} (Accuracy: {results[best_model_name]['accuracy']:.2%})")
+        return report
+    
+    def retrain_incremental(self, X_new: pd.DataFrame, y_new: pd.Series, new_trees: int = 20,
+                            holdout_fraction: float = 0.3, min_rows: int = 20) -> Dict[str, Any]:
+        """Warm-start the trained models on newly observed outcomes only
+        
+        The scaler is kept as is. Forests grow new_trees extra trees fitted on
+        the new rows, and logistic regression is refit on the new rows starting
+        from its current coefficients, so the cost depends on the new rows
+        only. Each updated model is compared with the current one on a
+        holdout of the new rows and replaces it only if it is at least as
+        accurate; the best model is then re-picked on that holdout.
+        """
+        from copy import deepcopy
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import accuracy_score, roc_auc_score
+        
+        if not self.models:
+            raise ValueError("No trained models to update - run train_models first")
+        
+        class_counts = y_new.value_counts()
+        if len(X_new) < min_rows or len(class_counts) < 2 or class_counts.min() < 2:
+            print(f"⚠️ Not enough new outcomes to retrain ({len(X_new)} rows, classes {class_counts.to_dict()})")
+            return {'retrained': False, 'rows': len(X_new)}
+        
+        print(f"🔁 Incremental retrain on {len(X_new)} new outcomes...")
+        X_train, X_holdout, y_train, y_holdout = train_test_split(
+            X_new[self.feature_names], y_new, test_size=holdout_fraction, random_state=42, stratify=y_new
+        )
+        X_train_scaled = self.scaler.transform(X_train)
+        X_holdout_scaled = self.scaler.transform(X_holdout)
         
-        # Store performance metrics
-        self.model_performance = results
+        def holdout_scores(model) -> Dict[str, float]:
+            return {
+                'accuracy': accuracy_score(y_holdout, model.predict(X_holdout_scaled)),
+                'auc': roc_auc_score(y_holdout, model.predict_proba(X_holdout_scaled)[:, 1])
+            }
         
-        return results
+        report = {}
+        for name, model in list(self.models.items()):
+            current = holdout_scores(model)
+            candidate = deepcopy(model)
+            if hasattr(candidate, 'estimators_') and 'warm_start' in candidate.get_params():
+                candidate.set_params(warm_start=True, n_estimators=len(candidate.estimators_) + new_trees)
+            elif hasattr(candidate, 'coef_') and 'warm_start' in candidate.get_params():
+                candidate.set_params(warm_start=True)
+            else:
+                print(f"   ⚠️ {name}: no warm start for {type(model).__name__}, keeping the current model")
+                report[name] = {'current': current, 'promoted': False}
+                continue
+            
+            start = time.perf_counter()
+            candidate.fit(X_train_scaled, y_train)
+            fit_s = time.perf_counter() - start
+            updated = holdout_scores(candidate)
+            
+            promoted = updated['accuracy'] >= current['accuracy']
+            if promoted:
+                self.models[name] = candidate
+                self.feature_importance[name] = self._model_feature_importance(candidate)
+                # Permutation importance of the old model no longer applies
+                self.permutation_importance.pop(name, None)
+            report[name] = {'current': current, 'updated': updated, 'fit_time_s': fit_s, 'promoted': promoted}
+            print(f"   {'✅' if promoted else '↩️'} {name}: holdout accuracy {current['accuracy']:.2%} -> "
+                  f"{updated['accuracy']:.2%} ({fit_s:.2f}s, {'promoted' if promoted else 'kept current'})")
+        
+        # Re-pick the best model on the holdout (ties keep the current best)
+        holdout_accuracy = {
+            name: (result['updated'] if result['promoted'] and 'updated' in result else result['current'])['accuracy']
+            for name, result in report.items()
+        }
+        best_model_name = max(holdout_accuracy, key=lambda k: (holdout_accuracy[k], k == self.best_model_name))
+        self.best_model_name = best_model_name
+        self.best_model = self.models[best_model_name]
+        print(f"🏆 Best Model: {best_model_name} (holdout accuracy: {holdout_accuracy[best_model_name]:.2%})")
+        
+        result = {
+            'retrained': True,
+            'rows': len(X_new),
+            'holdout_rows': len(X_holdout),
+            'best_model': best_model_name,
+            'models': report
+        }
+        self.retrain_history.append(result)
+        return result
     
     def predict(self, X: pd.DataFrame, model_name: str = None) -> Tuple[np.ndarray, np.ndarray]:
         """Make predictions using specified or best model"""
@@ -103,8 +369,8 @@ class SimpleInterviewPredictor:
         if model_name not in self.models:
             raise ValueError(f"Model '{model_name}' not found")
         
-        # Scale features
-        X_scaled = self.scaler.transform(X)
+        # Scale features in float64 like the compiled export (float32 rows would be scaled in float32)
+        X_scaled = self.scaler.transform(X.astype(np.float64) if isinstance(X, pd.DataFrame) else np.asarray(X, dtype=np.float64))
         
         # Make predictions
         model = self.models[model_name]
@@ -120,34 +386,41 @@ class SimpleInterviewPredictor:
         
         return predictions, probabilities
     
-    def get_feature_importance(self, model_name: str = None) -> Dict[str, float]:
-        """Get feature importance for specified model"""
-        if model_name is None:
-            model_name = self.best_model_name
-        
-        if model_name not in self.models:
-            return {}
-        
-        model = self.models[model_name]
-        
-        # Get feature importance if available
-        if hasattr(model, 'feature_importances_'):
-            feature_importance = dict(zip(self.feature_names, model.feature_importances_))
-        elif hasattr(model, 'coef_'):
-            # For Logistic Regression, use absolute coefficients
-            feature_importance = dict(zip(self.feature_names, np.abs(model.coef_[0])))
-        else:
-            return {}
-        
-        # Sort by importance
+    def _sorted_importance(self, values) -> Dict[str, float]:
+        """Feature -> importance, highest first"""
         sorted_features = sorted(
-            feature_importance.items(),
+            zip(self.feature_names, (float(v) for v in values)),
             key=lambda x: x[1],
             reverse=True
         )
-        
         return dict(sorted_features)
     
+    def _model_feature_importance(self, model) -> Dict[str, float]:
+        """Built-in importance of a fitted model"""
+        if hasattr(model, 'feature_importances_'):
+            return self._sorted_importance(model.feature_importances_)
+        if hasattr(model, 'coef_'):
+            # For Logistic Regression, use absolute coefficients
+            return self._sorted_importance(np.abs(model.coef_[0]))
+        return {}
+    
+    def get_feature_importance(self, model_name: str = None, kind: str = 'model') -> Dict[str, float]:
+        """Precomputed feature importance for specified model
+        
+        kind='model' gives the model's own importance (forest impurity
+        decrease, absolute logistic coefficients); kind='permutation' the
+        held-out permutation importance, if it was computed at train time.
+        Returns a copy, the stored values are not modified.
+        """
+        if model_name is None:
+            model_name = self.best_model_name
+        
+        if kind not in ('model', 'permutation'):
+            raise ValueError(f"Unknown importance kind '{kind}'. Expected 'model' or 'permutation'")
+        
+        stored = self.feature_importance if kind == 'model' else self.permutation_importance
+        return dict(stored.get(model_name, {}))
+    
     def save_model(self, file_path: str):
         """Save trained models using pickle"""
         model_state = {
@@ -155,13 +428,26 @@ class SimpleInterviewPredictor:
             'best_model_name': self.best_model_name,
             'scaler': self.scaler,
             'feature_names': self.feature_names,
-            'model_performance': self.model_performance
+            'model_performance': self.model_performance,
+            'feature_importance': self.feature_importance,
+            'permutation_importance': self.permutation_importance,
+            'trained_through_outcome_id': self.trained_through_outcome_id,
+            'retrain_history': self.retrain_history,
+            'compaction': self.compaction
         }
         
         with open(file_path, 'wb') as f:
             pickle.dump(model_state, f)
         
         print(f"💾 Saved interview predictor to {file_path}")
+        
+        # Flat NumPy export used for serving (no sklearn or unpickling per request).
+        # Boosted models have no compiled form; they are served from the pickle.
+        compiled_path = compiled_model_path(file_path)
+        if self.models and is_compilable(self.models[self.best_model_name]):
+            export_compiled_predictor(self, compiled_path)
+        elif os.path.exists(compiled_path):
+            os.remove(compiled_path)
     
     def load_model(self, file_path: str):
         """Load trained models using pickle"""
@@ -173,6 +459,15 @@ class SimpleInterviewPredictor:
         self.scaler = model_state['scaler']
         self.feature_names = model_state['feature_names']
         self.model_performance = model_state['model_performance']
+        self.permutation_importance = model_state.get('permutation_importance', {})
+        self.trained_through_outcome_id = model_state.get('trained_through_outcome_id', 0)
+        self.retrain_history = model_state.get('retrain_history', [])
+        self.compaction = model_state.get('compaction', {})
+        
+        # Older artifacts did not store importances; compute them once on load
+        self.feature_importance = model_state.get('feature_importance') or {
+            name: self._model_feature_importance(model) for name, model in self.models.items()
+        }
         
         # Set best model
         if self.best_model_name:
@@ -196,20 +491,53 @@ class SimpleInterviewPredictor:
 # CLI Interface for Interview Prediction
 # ============================================================================
 
+# Education string -> numeric code matching training data
+EDUCATION_CODES = {
+    'B.E / B-Tech': 0,
+    'BSc or MSc': 1,
+    'BA/MA': 2,
+    'B.com (Bachelor of commerce)': 3,
+    'M.E / M-Tech': 4,
+    'Masters in data science': 5,
+    'MED': 6,
+    'B.ed(Teaching)': 7,
+    'M.com': 8,
+}
+
+# Speech structure quality -> base structured-thinking score
+STRUCTURE_SCORES = {'excellent': 5, 'fair': 3, 'poor': 1}
+
+# Model feature name -> derived field it is filled from (shared by the
+# single-request and the batch feature builders)
+FEATURE_SOURCES = {
+    'Age': 'age',
+    'Gender': 'gender',
+    'Type of Graduation/Post Graduation': 'education',
+    'Mode of interview given by candidate?': 'online_interview',  # Always online/voice
+    'Pre Interview Check': 'pre_interview_check',  # They got to interview
+    'Confidence based on Introduction (English).1': 'confidence_1_to_5',
+    'Confidence based on the topic given  .1': 'confidence_1_to_5',
+    'Confidence based on the sales scenario.1': 'confidence_1_to_5',
+    'Structured Thinking (In regional only).1': 'structured_thinking',
+    'Structured Thinking( Call pitch).1': 'structured_thinking',
+    'Regional fluency based on the topic given  .1': 'fluency_1_to_5',
+    'Regional fluency Based on the PPT Question.1': 'fluency_1_to_5',
+    'Regional fluency based on the  sales scenario.1': 'fluency_1_to_5',
+    'Does the candidate has mother tongue influence while speaking english.': 'has_mti',
+    'Has acquaintance in Company and has spoken to him/her before applying?': 'has_acquaintance',
+    'Currently Employed': 'currently_employed',
+    'Experienced candidate - (Experience in months)': 'experience_months',
+    'Role acceptance': 'role_acceptance',  # They're doing the interview
+    'Candidate is willing to relocate': 'willing_to_relocate'
+}
+
+# Rows per chunk and output columns of `score-file`
+SCORE_FILE_CHUNK_ROWS = 50000
+SCORE_FILE_OUTPUT_COLUMNS = ['success_probability', 'predicted_success', 'overall_score']
+
 def map_education_to_code(education: str) -> int:
     """Map education string to numeric code matching training data"""
-    education_map = {
-        'B.E / B-Tech': 0,
-        'BSc or MSc': 1,
-        'BA/MA': 2,
-        'B.com (Bachelor of commerce)': 3,
-        'M.E / M-Tech': 4,
-        'Masters in data science': 5,
-        'MED': 6,
-        'B.ed(Teaching)': 7,
-        'M.com': 8,
-    }
-    return education_map.get(education, 0)  # Default to 0 if not found
+    return EDUCATION_CODES.get(education, 0)  # Default to 0 if not found
 
 def derive_speech_metrics(speech_analysis: Dict) -> Dict[str, Any]:
     """Derive confidence, fluency, and structured thinking from speech analysis"""
@@ -228,8 +556,7 @@ def derive_speech_metrics(speech_analysis: Dict) -> Dict[str, Any]:
     fluency_1_to_5 = max(1, min(5, round(fluency_score)))
     
     # Convert to structured thinking (1-5 scale)
-    structure_map = {'excellent': 5, 'fair': 3, 'poor': 1}
-    base_structure = structure_map.get(structure_quality, 3)
+    base_structure = STRUCTURE_SCORES.get(structure_quality, 3)
     variety_boost = (variety_score / 95) * 2  # 0-2 boost
     structured_thinking = max(1, min(5, round(base_structure + variety_boost)))
     
@@ -243,6 +570,79 @@ def derive_speech_metrics(speech_analysis: Dict) -> Dict[str, Any]:
         'has_mti': has_mti
     }
 
+def derive_request_fields(profile_data: Dict, speech_analysis: Dict) -> Dict[str, Any]:
+    """Derived fields (FEATURE_SOURCES values) of a single request"""
+    
+    # Profile data (required fields)
+    age = profile_data.get('age', 25)
+    gender = 1 if profile_data.get('gender') == 'Male' else 0
+    education = map_education_to_code(profile_data.get('education', 'B.E / B-Tech'))
+    currently_employed = 1 if profile_data.get('currentlyEmployed', False) else 0
+    experience_months = profile_data.get('experienceMonths', 0)
+    willing_to_relocate = 1 if profile_data.get('willingToRelocate', False) else 0
+    has_acquaintance = 1 if profile_data.get('hasAcquaintance', False) else 0
+    
+    # Derive speech metrics
+    speech_metrics = derive_speech_metrics(speech_analysis)
+    
+    return {
+        'age': age,
+        'gender': gender,
+        'education': education,
+        'online_interview': 1,
+        'pre_interview_check': 1,
+        'has_acquaintance': has_acquaintance,
+        'currently_employed': currently_employed,
+        'experience_months': experience_months,
+        'role_acceptance': 1,
+        'willing_to_relocate': willing_to_relocate,
+        **speech_metrics
+    }
+
+class FeatureLayout:
+    """Column positions of a model's features, derived once per feature list
+    
+    Derived fields are written straight into a preallocated row or matrix
+    in the model's column order. Expected features this builder does not
+    know stay 0.
+    """
+    
+    def __init__(self, feature_names: List[str]):
+        self.feature_names = list(feature_names)
+        self.n_features = len(self.feature_names)
+        # (column, derived field) for every feature the builder can fill
+        self.columns = [
+            (j, FEATURE_SOURCES[name]) for j, name in enumerate(self.feature_names) if name in FEATURE_SOURCES
+        ]
+    
+    def row(self, fields: Dict[str, Any], dtype=np.float32) -> np.ndarray:
+        """(1, n_features) row from the fields of a single request"""
+        X = np.zeros((1, self.n_features), dtype=dtype)
+        out = X[0]
+        for j, source in self.columns:
+            out[j] = fields[source]
+        return X
+    
+    def matrix(self, fields: Dict[str, np.ndarray], n_rows: int, dtype=np.float32) -> np.ndarray:
+        """(n_rows, n_features) matrix from per-field column arrays"""
+        X = np.zeros((n_rows, self.n_features), dtype=dtype)
+        for j, source in self.columns:
+            X[:, j] = fields[source]
+        return X
+
+@lru_cache(maxsize=8)
+def _cached_layout(feature_names: Tuple[str, ...]) -> FeatureLayout:
+    return FeatureLayout(list(feature_names))
+
+def feature_layout(expected_feature_names: list = None) -> FeatureLayout:
+    """Cached layout for a model's feature names (all known features if None)"""
+    return _cached_layout(tuple(expected_feature_names or FEATURE_SOURCES))
+
+def build_feature_row(profile_data: Dict, speech_analysis: Dict, interview_data: Dict,
+                      expected_feature_names: list = None) -> np.ndarray:
+    """Float32 (1, n_features) row in the model's column order, without pandas"""
+    return feature_layout(expected_feature_names).row(derive_request_fields(profile_data, speech_analysis))
+
 def build_feature_vector(profile_data: Dict, speech_analysis: Dict, interview_data: Dict, expected_feature_names: list = None) -> pd.DataFrame:
     """Build feature vector matching training data structure exactly
     
@@ -254,101 +654,261 @@ def build_feature_vector(profile_data: Dict, speech_analysis: Dict, interview_da
     
     Returns:
         DataFrame with features matching the model's expected structure
+        (all known features if expected_feature_names is not given).
+        The predict path uses build_feature_row instead.
     """
+    layout = feature_layout(expected_feature_names)
+    fields = derive_request_fields(profile_data, speech_analysis)
+    return pd.DataFrame(layout.row(fields, dtype=np.float64), columns=layout.feature_names)
+
+def _column(frame: pd.DataFrame, name: str, default) -> pd.Series:
+    """Column of a batch frame with missing columns/cells set to the single-request default"""
+    if name not in frame.columns:
+        return pd.Series(default, index=frame.index)
+    return frame[name].where(frame[name].notna(), default)
+
+def _truthy(values: pd.Series) -> np.ndarray:
+    """0/1 flags from CSV booleans (true/yes/y/1, case-insensitive)"""
+    return values.astype(str).str.strip().str.lower().isin(['true', 'yes', 'y', '1', '1.0']).to_numpy(dtype=np.int64)
+
+def derive_batch_fields(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Vectorized build_feature_vector/derive_speech_metrics over a frame of flat rows
     
-    # Profile data (required fields)
-    age = profile_data.get('age', 25)
-    gender = 1 if profile_data.get('gender') == 'Male' else 0
-    education = map_education_to_code(profile_data.get('education', 'B.E / B-Tech'))
-    currently_employed = 1 if profile_data.get('currentlyEmployed', False) else 0
-    experience_months = profile_data.get('experienceMonths', 0)
-    willing_to_relocate = 1 if profile_data.get('willingToRelocate', False) else 0
-    has_acquaintance = 1 if profile_data.get('hasAcquaintance', False) else 0
-    
-    # Derive speech metrics
-    speech_metrics = derive_speech_metrics(speech_analysis)
+    Expected columns (all optional, same defaults as a single request):
+    age, gender, education, currentlyEmployed, experienceMonths,
+    willingToRelocate, hasAcquaintance, confidence_score, quality_score,
+    vocabulary_diversity, structure_quality, variety_score
+    """
+    n_rows = len(frame)
+    confidence_score = pd.to_numeric(_column(frame, 'confidence_score', 50), errors='coerce').fillna(50).to_numpy(dtype=np.float64)
+    quality_score = pd.to_numeric(_column(frame, 'quality_score', 50), errors='coerce').fillna(50).to_numpy(dtype=np.float64)
+    vocab_diversity = pd.to_numeric(_column(frame, 'vocabulary_diversity', 0.5), errors='coerce').fillna(0.5).to_numpy(dtype=np.float64)
+    variety_score = pd.to_numeric(_column(frame, 'variety_score', 50), errors='coerce').fillna(50).to_numpy(dtype=np.float64)
+    base_structure = _column(frame, 'structure_quality', 'fair').map(STRUCTURE_SCORES).fillna(3).to_numpy(dtype=np.float64)
     
-    # Build all possible features (mapping from feature name to value)
-    all_features = {
-        'Age': age,
-        'Gender': gender,
-        'Type of Graduation/Post Graduation': education,
-        'Mode of interview given by candidate?': 1,  # Always online/voice
-        'Pre Interview Check': 1,  # They got to interview
-        'Confidence based on Introduction (English).1': speech_metrics['confidence_1_to_5'],
-        'Confidence based on the topic given  .1': speech_metrics['confidence_1_to_5'],
-        'Confidence based on the sales scenario.1': speech_metrics['confidence_1_to_5'],
-        'Structured Thinking (In regional only).1': speech_metrics['structured_thinking'],
-        'Structured Thinking( Call pitch).1': speech_metrics['structured_thinking'],
-        'Regional fluency based on the topic given  .1': speech_metrics['fluency_1_to_5'],
-        'Regional fluency Based on the PPT Question.1': speech_metrics['fluency_1_to_5'],
-        'Regional fluency based on the  sales scenario.1': speech_metrics['fluency_1_to_5'],
-        'Does the candidate has mother tongue influence while speaking english.': speech_metrics['has_mti'],
-        'Has acquaintance in Company and has spoken to him/her before applying?': has_acquaintance,
-        'Currently Employed': currently_employed,
-        'Experienced candidate - (Experience in months)': experience_months,
-        'Role acceptance': 1,  # They're doing the interview
-        'Candidate is willing to relocate': willing_to_relocate
+    fluency_score = (vocab_diversity * 100 * 0.4 + quality_score * 0.6) / 20
+    return {
+        'age': pd.to_numeric(_column(frame, 'age', 25), errors='coerce').fillna(25).to_numpy(dtype=np.float64),
+        'gender': (_column(frame, 'gender', '') == 'Male').to_numpy(dtype=np.int64),
+        'education': _column(frame, 'education', 'B.E / B-Tech').map(EDUCATION_CODES).fillna(0).to_numpy(dtype=np.int64),
+        'online_interview': np.ones(n_rows, dtype=np.int64),
+        'pre_interview_check': np.ones(n_rows, dtype=np.int64),
+        'has_acquaintance': _truthy(_column(frame, 'hasAcquaintance', False)),
+        'currently_employed': _truthy(_column(frame, 'currentlyEmployed', False)),
+        'experience_months': pd.to_numeric(_column(frame, 'experienceMonths', 0), errors='coerce').fillna(0).to_numpy(dtype=np.float64),
+        'role_acceptance': np.ones(n_rows, dtype=np.int64),
+        'willing_to_relocate': _truthy(_column(frame, 'willingToRelocate', False)),
+        'confidence_1_to_5': np.clip(np.round(confidence_score / 95 * 5), 1, 5),
+        'fluency_1_to_5': np.clip(np.round(fluency_score), 1, 5),
+        'structured_thinking': np.clip(np.round(base_structure + variety_score / 95 * 2), 1, 5),
+        'has_mti': (quality_score < 60).astype(np.int64)
     }
+
+def build_feature_matrix(frame: pd.DataFrame, expected_feature_names: list) -> np.ndarray:
+    """Float32 feature matrix (rows x expected_feature_names) for a batch, 0 for unknown features"""
+    return feature_layout(expected_feature_names).matrix(derive_batch_fields(frame), len(frame))
+
+def overall_score_from_probability(success_probability):
+    """Overall score (0-95, more generous scoring) for one or many success probabilities
+    
+    Scale more generously: 0.5 probability = 70, 0.7 = 85, 0.9 = 95
+    """
+    return np.minimum(95, np.where(
+        success_probability < 0.5,
+        50 + (success_probability * 40),  # 0.0 -> 50, 0.5 -> 70
+        70 + ((success_probability - 0.5) * 50)  # 0.5 -> 70, 1.0 -> 95
+    ))
+
+def load_serving_predictor(model_path: str = None):
+    """Predictor used for serving, preferring the compiled NumPy export over the pickle"""
+    model_path = model_path or os.path.join(os.path.dirname(__file__), 'trained_models', 'interview_predictor.pkl')
+    compiled_path = compiled_model_path(model_path)
+    if os.path.exists(compiled_path):
+        return CompiledInterviewPredictor.load(compiled_path)
+    if os.path.exists(model_path):
+        predictor = SimpleInterviewPredictor()
+        predictor.load_model(model_path)
+        return predictor
+    raise FileNotFoundError(f"Model file not found: {model_path}")
+
+def load_batch_predictor(model_path: str = None):
+    """Predictor for large batches (score_file)
+    
+    The compiled export wins for single rows and small batches, but on
+    batches of thousands of rows sklearn's compiled tree traversal beats
+    the NumPy one, so a forest is served from the pickle when there is one.
+    Linear models keep the compiled path, which is faster at any size.
+    """
+    model_path = model_path or os.path.join(os.path.dirname(__file__), 'trained_models', 'interview_predictor.pkl')
+    # Keep stdout for the caller's result
+    with contextlib.redirect_stdout(sys.stderr):
+        if os.path.exists(model_path):
+            predictor = SimpleInterviewPredictor()
+            predictor.load_model(model_path)
+            if hasattr(predictor.best_model, 'estimators_') or not os.path.exists(compiled_model_path(model_path)):
+                return predictor
+        return load_serving_predictor(model_path)
+
+# Predictor of a score-file worker process, loaded once by _init_scoring_worker
+_scoring_predictor = None
+
+def _init_scoring_worker(model_path: str):
+    global _scoring_predictor
+    _scoring_predictor = load_batch_predictor(model_path)
+
+def _score_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """Input rows of one chunk with the prediction columns appended"""
+    X = build_feature_matrix(chunk, _scoring_predictor.feature_names)
+    if isinstance(_scoring_predictor, SimpleInterviewPredictor):
+        X = pd.DataFrame(X, columns=_scoring_predictor.feature_names)
+    predictions, probabilities = _scoring_predictor.predict(X)
+    
+    chunk = chunk.copy()
+    chunk['success_probability'] = probabilities
+    chunk['predicted_success'] = np.asarray(predictions).astype(bool)
+    chunk['overall_score'] = np.round(overall_score_from_probability(probabilities), 2)
+    return chunk
+
+def score_file(input_path: str, output_path: str, chunk_size: int = SCORE_FILE_CHUNK_ROWS,
+               workers: int = None, model_path: str = None) -> Dict[str, Any]:
+    """Score every row of a CSV and write the input columns plus the predictions
+    
+    The input is read in chunks of chunk_size rows and the chunks are scored
+    by a pool of worker processes, each loading the predictor once (see
+    load_batch_predictor). At most two chunks per worker are in flight and
+    results are appended to the output in input order as they complete, so
+    memory stays bounded by the chunk size regardless of the file size.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    n_rows = 0
+    n_chunks = 0
+    
+    def write(scored: pd.DataFrame):
+        nonlocal n_rows, n_chunks
+        scored.to_csv(output_path, mode='w' if n_chunks == 0 else 'a', header=n_chunks == 0, index=False)
+        n_rows += len(scored)
+        n_chunks += 1
+        elapsed = time.perf_counter() - start
+        print(f"📊 Scored {n_rows:,} rows ({n_rows / elapsed:,.0f} rows/s)", file=sys.stderr, flush=True)
     
-    # If expected feature names are provided, only include those features
-    # This ensures we match exactly what the model was trained with
-    if expected_feature_names:
-        features = {name: all_features.get(name, 0) for name in expected_feature_names}
-        # Reorder to match expected order
-        features_ordered = {name: features[name] for name in expected_feature_names if name in features}
-        return pd.DataFrame([features_ordered])
+    reader = pd.read_csv(input_path, chunksize=chunk_size)
+    if workers == 1:
+        _init_scoring_worker(model_path)
+        for chunk in reader:
+            write(_score_chunk(chunk))
     else:
-        # Fallback: return all features (for backward compatibility)
-        return pd.DataFrame([all_features])
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_scoring_worker,
+                                 initargs=(model_path,)) as pool:
+            pending = deque()
+            for chunk in reader:
+                pending.append(pool.submit(_score_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    write(pending.popleft().result())
+            while pending:
+                write(pending.popleft().result())
+    
+    if n_chunks == 0:
+        # Empty input: still produce a header so downstream readers see the columns
+        pd.DataFrame(columns=SCORE_FILE_OUTPUT_COLUMNS).to_csv(output_path, index=False)
+    
+    elapsed = time.perf_counter() - start
+    return {
+        'success': True,
+        'input': input_path,
+        'output': output_path,
+        'rows': n_rows,
+        'chunks': n_chunks,
+        'workers': workers,
+        'seconds': round(elapsed, 3),
+        'rows_per_second': round(n_rows / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+def explain_prediction(predictor, features: np.ndarray, top_n: int = 5) -> Dict[str, Any]:
+    """Why the candidate got their score
+    
+    contributions: the candidate's top features by absolute contribution
+    (TreeSHAP for forests in probability space, coefficient x scaled value
+    for logistic regression in log-odds space), when the serving model has
+    a compiled form. top_features: the model's most important features
+    overall (precomputed permutation importance when available, otherwise
+    the model's own importance) with the candidate's values for them.
+    features is the candidate's (1, n_features) row in the model's order.
+    """
+    kind = 'permutation'
+    importance = predictor.get_feature_importance(kind=kind)
+    if not importance:
+        kind = 'model'
+        importance = predictor.get_feature_importance(kind=kind)
+    
+    values = dict(zip(predictor.feature_names, np.asarray(features, dtype=np.float64)[0].tolist()))
+    explanation = {
+        'importance_kind': kind,
+        'top_features': [
+            {
+                'feature': name,
+                'importance': float(value),
+                'candidate_value': values.get(name)
+            }
+            for name, value in list(importance.items())[:top_n]
+        ]
+    }
+    
+    compiled = predictor
+    if isinstance(predictor, SimpleInterviewPredictor):
+        compiled = CompiledInterviewPredictor.from_predictor(predictor) if is_compilable(predictor.best_model) else None
+    if compiled is not None:
+        result = compiled.explain(features)
+        contributions = result['contributions'][0]
+        order = np.argsort(-np.abs(contributions), kind='stable')[:top_n]
+        explanation['contributions'] = {
+            'output': result['output'],
+            'base_value': result['base_value'],
+            'features': [
+                {
+                    'feature': compiled.feature_names[i],
+                    'candidate_value': values[compiled.feature_names[i]],
+                    'contribution': float(contributions[i])
+                }
+                for i in order
+            ]
+        }
+    
+    return explanation
 
 def predict_interview_success(transcript_text: str, profile_data: Dict, 
-                              speech_analysis: Dict, interview_data: Dict) -> Dict:
-    """Predict interview success using trained model"""
+                              speech_analysis: Dict, interview_data: Dict,
+                              explain: bool = False) -> Dict:
+    """Predict interview success using trained model
+    
+    With explain=True the prediction also carries the top features by
+    precomputed importance (see explain_prediction).
+    """
     try:
-        # Load predictor
-        predictor = SimpleInterviewPredictor()
-        model_path = os.path.join(os.path.dirname(__file__), 'trained_models', 'interview_predictor.pkl')
-        
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Model file not found: {model_path}")
+        # Load predictor, preferring the compiled NumPy export
+        predictor = load_serving_predictor()
         
-        predictor.load_model(model_path)
-        
-        # Build feature vector using only features the model expects
-        # This ensures we match exactly what the model was trained with
+        # Build feature row in the model's column order (layout cached per feature list)
         expected_features = predictor.feature_names if predictor.feature_names else None
         if expected_features:
             print(f"📋 Model expects {len(expected_features)} features: {expected_features[:5]}...")
         
-        features_df = build_feature_vector(profile_data, speech_analysis, interview_data, expected_features)
-        
-        # Verify feature names match
-        if expected_features and list(features_df.columns) != expected_features:
-            print(f"⚠️ Feature name mismatch!")
-            print(f"   Expected: {expected_features}")
-            print(f"   Got: {list(features_df.columns)}")
-            # Reorder columns to match expected order
-            features_df = features_df[expected_features]
+        features = build_feature_row(profile_data, speech_analysis, interview_data, expected_features)
         
-        # Make prediction
-        predictions, probabilities = predictor.predict(features_df)
-        
-        # Get feature importance (optional, for debugging)
-        feature_importance = predictor.get_feature_importance()
+        # Make prediction (the sklearn fallback expects named columns)
+        model_input = features
+        if isinstance(predictor, SimpleInterviewPredictor):
+            model_input = pd.DataFrame(features, columns=feature_layout(expected_features).feature_names)
+        predictions, probabilities = predictor.predict(model_input)
         
         # Format response
         success_probability = float(probabilities[0]) if len(probabilities) > 0 else 0.5
         predicted_success = bool(predictions[0]) if len(predictions) > 0 else False
         
         # Calculate overall score (0-95, more generous scoring)
-        # Scale more generously: 0.5 probability = 70, 0.7 = 85, 0.9 = 95
-        if success_probability < 0.5:
-            overall_score = min(95, 50 + (success_probability * 40))  # 0.0 -> 50, 0.5 -> 70
-        else:
-            overall_score = min(95, 70 + ((success_probability - 0.5) * 50))  # 0.5 -> 70, 1.0 -> 95
+        overall_score = float(overall_score_from_probability(success_probability))
         
-        return {
+        result = {
             'success': True,
             'prediction': {
                 'success_probability': success_probability,
@@ -362,6 +922,12 @@ def predict_interview_success(transcript_text: str, profile_data: Dict,
                 }
             }
         }
+        
+        # Opt-in: which features drive the model, with this candidate's values
+        if explain:
+            result['prediction']['explanation'] = explain_prediction(predictor, features)
+        
+        return result
     except Exception as e:
         import traceback
         error_trace = traceback.format_exc()
@@ -372,8 +938,31 @@ def predict_interview_success(transcript_text: str, profile_data: Dict,
             'prediction': {}
         }
 
+def score_file_main(argv: List[str]):
+    """Batch scoring: python interview_predictor.py score-file in.csv out.csv [--chunk-size N] [--workers N]"""
+    import argparse
+    parser = argparse.ArgumentParser(prog='interview_predictor.py score-file')
+    parser.add_argument('input')
+    parser.add_argument('output')
+    parser.add_argument('--chunk-size', type=int, default=SCORE_FILE_CHUNK_ROWS)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--model', default=None, help='Pickled predictor (its _compiled.npz is preferred)')
+    args = parser.parse_args(argv)
+    
+    try:
+        result = score_file(args.input, args.output, args.chunk_size, args.workers, args.model)
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}
+    print(json.dumps(result))
+    if not result['success']:
+        sys.exit(1)
+
 def main():
     """Main function - reads input from stdin and outputs to stdout"""
+    if sys.argv[1:2] == ['score-file']:
+        score_file_main(sys.argv[2:])
+        return
+    
     try:
         input_data = sys.stdin.read()
         data = json.loads(input_data)
@@ -400,7 +989,8 @@ def main():
                 transcript_text,
                 profile_data,
                 speech_analysis,
-                interview_data
+                interview_data,
+                explain=bool(data.get('explain', False))
             )
         
         print(json.dumps(result))
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Model Search for the Interview Predictor
+Cross-validated hyperparameter search over RF/LR (and XGBoost/LightGBM if installed)
+under a time budget, with selection that can trade accuracy for serving speed
+"""
+
+import os
+import time
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+
+SEARCH_METHODS = ['random', 'halving']
+
+
+def candidate_spaces(seed: int = 42) -> Dict[str, Tuple[Any, Dict[str, Any]]]:
+    """Model families to search: name -> (base estimator, parameter distributions)
+
+    Ordered from cheapest to most expensive to fit, so a tight time budget
+    still covers the fast families. XGBoost and LightGBM are included only
+    when they are installed.
+    """
+    from scipy.stats import loguniform, randint, uniform
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+
+    spaces = {
+        'Logistic Regression': (
+            LogisticRegression(random_state=seed, max_iter=1000),
+            {'C': loguniform(1e-3, 1e2)}
+        ),
+        'Random Forest': (
+            RandomForestClassifier(random_state=seed, n_jobs=1),
+            {
+                'n_estimators': randint(50, 400),
+                'max_depth': [4, 6, 8, 10, 14, None],
+                'min_samples_leaf': randint(1, 10),
+                'max_features': ['sqrt', 'log2', 0.5]
+            }
+        )
+    }
+
+    try:
+        from lightgbm import LGBMClassifier
+        spaces['LightGBM'] = (
+            LGBMClassifier(random_state=seed, n_jobs=1, verbose=-1),
+            {
+                'n_estimators': randint(50, 400),
+                'num_leaves': randint(8, 64),
+                'learning_rate': loguniform(0.01, 0.3),
+                'subsample': uniform(0.6, 0.4),
+                'subsample_freq': [1],
+                'colsample_bytree': uniform(0.6, 0.4)
+            }
+        )
+    except ImportError:
+        print("⚠️ lightgbm not installed - skipping LightGBM in the search")
+
+    try:
+        from xgboost import XGBClassifier
+        spaces['XGBoost'] = (
+            XGBClassifier(random_state=seed, n_jobs=1, eval_metric='logloss'),
+            {
+                'n_estimators': randint(50, 400),
+                'max_depth': randint(2, 8),
+                'learning_rate': loguniform(0.01, 0.3),
+                'subsample': uniform(0.6, 0.4),
+                'colsample_bytree': uniform(0.6, 0.4)
+            }
+        )
+    except ImportError:
+        print("⚠️ xgboost not installed - skipping XGBoost in the search")
+
+    return spaces
+
+
+def _effective_jobs(n_jobs: int) -> int:
+    """Number of processes joblib will use for n_jobs"""
+    cores = os.cpu_count() or 1
+    return cores if n_jobs is None or n_jobs < 0 else max(1, min(n_jobs, cores))
+
+
+def measure_latency(model, X: np.ndarray, repeats: int = 20) -> Dict[str, float]:
+    """Median predict_proba latency for one row and per row of a full batch (ms)"""
+    single = []
+    for i in range(repeats):
+        row = X[i % len(X)][None, :]
+        start = time.perf_counter()
+        model.predict_proba(row)
+        single.append(time.perf_counter() - start)
+
+    batch = []
+    for _ in range(3):
+        start = time.perf_counter()
+        model.predict_proba(X)
+        batch.append(time.perf_counter() - start)
+
+    return {
+        'single_row_latency_ms': float(np.median(single) * 1000),
+        'batch_latency_ms_per_row': float(np.median(batch) * 1000 / len(X))
+    }
+
+
+def _candidate_rows(search, method: str) -> List[Dict[str, Any]]:
+    """Per-candidate CV results (params, accuracy, AUC, fit time)"""
+    cv = search.cv_results_
+    rows = []
+    for i, params in enumerate(cv['params']):
+        rows.append({
+            'params': {key: (value.item() if isinstance(value, np.generic) else value) for key, value in params.items()},
+            'cv_accuracy': float(cv['mean_test_accuracy' if method == 'random' else 'mean_test_score'][i]),
+            'cv_auc': float(cv['mean_test_roc_auc'][i]) if method == 'random' else None,
+            'fit_time_s': float(cv['mean_fit_time'][i]),
+            'n_samples': int(cv['n_resources'][i]) if 'n_resources' in cv else None
+        })
+    return rows
+
+
+def _random_search(estimator, distributions, X_train, y_train, cv, n_iter: int, deadline: float,
+                   workers: int, n_jobs: int, seed: int) -> List[Dict[str, Any]]:
+    """Randomized search evaluated in rounds of `workers` candidates
+
+    The clock is checked between rounds, so the search stops within one
+    round of the deadline (at least one round always runs).
+    """
+    from sklearn.model_selection import GridSearchCV, ParameterSampler
+
+    sampled = list(ParameterSampler(distributions, n_iter=n_iter, random_state=seed))
+    rows = []
+    for start in range(0, len(sampled), workers):
+        if rows and time.perf_counter() >= deadline:
+            break
+        # One single-point grid per sampled candidate
+        grid = [{key: [value] for key, value in params.items()} for params in sampled[start:start + workers]]
+        search = GridSearchCV(
+            estimator, grid, cv=cv, scoring={'accuracy': 'accuracy', 'roc_auc': 'roc_auc'},
+            refit=False, n_jobs=n_jobs
+        )
+        search.fit(X_train, y_train)
+        rows.extend(_candidate_rows(search, 'random'))
+    return rows
+
+
+def _halving_search(estimator, distributions, X_train, y_train, cv, n_iter: int, share_s: float,
+                    workers: int, n_jobs: int, seed: int) -> List[Dict[str, Any]]:
+    """Successive-halving search sized from a probe fit to fit in share_s
+
+    Halving runs as one call, so the budget is enforced by estimate: the
+    probe fit time bounds how many candidates x folds full-size fits the
+    share allows (the early, subsampled rounds are cheaper than that).
+    """
+    from sklearn.base import clone
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingRandomSearchCV
+
+    start = time.perf_counter()
+    clone(estimator).fit(X_train, y_train)
+    probe_s = time.perf_counter() - start
+    affordable = int(share_s * workers / max(probe_s * cv.get_n_splits(), 1e-6))
+
+    search = HalvingRandomSearchCV(
+        estimator, distributions, n_candidates=max(3, min(n_iter, affordable)), cv=cv,
+        scoring='accuracy', factor=3, refit=False, n_jobs=n_jobs, random_state=seed
+    )
+    search.fit(X_train, y_train)
+    # Only candidates that reached the last (full-size) round compete for best
+    final_round = search.cv_results_['iter'] == search.cv_results_['iter'].max()
+    rows = _candidate_rows(search, 'halving')
+    return [dict(row, final_round=bool(final)) for row, final in zip(rows, final_round)]
+
+
+def search_models(X_train: np.ndarray, y_train, X_test: np.ndarray, y_test,
+                  method: str = 'random', cv_folds: int = 5, n_iter: int = 20,
+                  time_budget_s: float = 300.0, n_jobs: int = -1, seed: int = 42) -> Dict[str, Dict[str, Any]]:
+    """Cross-validated search per model family on already scaled features
+
+    Each family gets an equal share of the time that is left when its turn
+    comes (time a family does not use carries over to the next ones), and
+    families are skipped once the budget is spent. Candidates are scored
+    with stratified k-fold CV on n_jobs processes; the best one per family
+    (by CV accuracy) is refit on the whole training split and evaluated on
+    the held-out split.
+
+    Returns, per family: the refit model, held-out accuracy/AUC, refit time,
+    serving latency, best parameters and all CV candidates.
+    """
+    from sklearn.base import clone
+    from sklearn.metrics import accuracy_score, roc_auc_score
+    from sklearn.model_selection import StratifiedKFold
+
+    if method not in SEARCH_METHODS:
+        raise ValueError(f"Unknown search method '{method}'. Expected one of: {', '.join(SEARCH_METHODS)}")
+
+    spaces = candidate_spaces(seed)
+    workers = _effective_jobs(n_jobs)
+    cv = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=seed)
+    deadline = time.perf_counter() + time_budget_s
+    results = {}
+
+    for position, (name, (estimator, distributions)) in enumerate(spaces.items()):
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            print(f"⏱️ Time budget spent - skipping {name}")
+            continue
+        share = remaining / (len(spaces) - position)
+
+        print(f"🔎 Searching {name} ({method}, up to {n_iter} candidates x {cv_folds} folds, "
+              f"{share:.0f}s, {workers} workers)")
+        start = time.perf_counter()
+        if method == 'random':
+            candidates = _random_search(estimator, distributions, X_train, y_train, cv, n_iter,
+                                        start + share, workers, n_jobs, seed)
+            contenders = candidates
+        else:
+            candidates = _halving_search(estimator, distributions, X_train, y_train, cv, n_iter,
+                                         share, workers, n_jobs, seed)
+            contenders = [row for row in candidates if row['final_round']]
+        search_s = time.perf_counter() - start
+        best = max(contenders, key=lambda row: row['cv_accuracy'])
+
+        model = clone(estimator).set_params(**best['params'])
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_s = time.perf_counter() - start
+
+        y_pred = model.predict(X_test)
+        y_proba = model.predict_proba(X_test)[:, 1]
+        accuracy = accuracy_score(y_test, y_pred)
+        auc = roc_auc_score(y_test, y_proba) if len(np.unique(y_test)) > 1 else None
+
+        results[name] = {
+            'model': model,
+            'accuracy': accuracy,
+            'auc': auc,
+            'predictions': y_pred,
+            'best_params': best['params'],
+            'fit_time_s': fit_s,
+            'search_time_s': search_s,
+            **measure_latency(model, X_test),
+            'cv_candidates': candidates
+        }
+        auc_text = f"{auc:.3f}" if auc is not None else 'n/a'
+        print(f"   ✅ {name}: Accuracy={accuracy:.2%} AUC={auc_text} fit={fit_s:.2f}s "
+              f"latency={results[name]['single_row_latency_ms']:.2f}ms/row "
+              f"({len(candidates)} candidates in {search_s:.1f}s)")
+
+    return results
+
+
+def select_model(results: Dict[str, Dict[str, Any]], max_accuracy_drop: float = 0.0,
+                 latency_key: str = 'single_row_latency_ms') -> Optional[str]:
+    """Fastest model whose held-out accuracy is within max_accuracy_drop of the best
+
+    max_accuracy_drop=0 selects on accuracy alone (ties go to the faster model).
+    """
+    if not results:
+        return None
+    best_accuracy = max(result['accuracy'] for result in results.values())
+    eligible = [name for name, result in results.items() if result['accuracy'] >= best_accuracy - max_accuracy_drop]
+    return min(eligible, key=lambda name: (results[name][latency_key], -results[name]['accuracy']))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Detection for ML Pipeline
+MinHash signatures and LSH banding to cluster reworded questions
+"""
+
+import zlib
+import numpy as np
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from typing import List
+
+# Mersenne prime for the universal hash family (a * x + b) mod p
+MERSENNE_PRIME = (1 << 31) - 1
+
+
+def content_text(cleaned_text: str) -> str:
+    """Drop stop words so shared phrasing ("what is the ...") does not look like overlap"""
+    return ' '.join(word for word in cleaned_text.split() if word not in ENGLISH_STOP_WORDS)
+
+
+def shingle_hashes(text: str, k: int = 4) -> np.ndarray:
+    """Deterministic 32-bit hashes of the character k-shingles of a cleaned text"""
+    if len(text) <= k:
+        shingles = [text] if text else []
+    else:
+        shingles = [text[i:i + k] for i in range(len(text) - k + 1)]
+    return np.unique(np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.int64))
+
+
+def minhash_signatures(texts: List[str], num_perm: int = 64, k: int = 4, seed: int = 42,
+                       max_chunk_shingles: int = 1 << 20) -> np.ndarray:
+    """MinHash signature matrix (len(texts) x num_perm) of the texts' shingle sets
+
+    Shingles of a chunk of documents are hashed by all permutations at once
+    and reduced per document with np.minimum.reduceat, so the cost is linear
+    in the total number of shingles. Texts without shingles get a signature
+    of MERSENNE_PRIME in every slot.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.int64)
+    b = rng.integers(0, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.int64)
+
+    signatures = np.full((len(texts), num_perm), MERSENNE_PRIME, dtype=np.int64)
+    shingles = [shingle_hashes(text, k) % MERSENNE_PRIME for text in texts]
+
+    start = 0
+    while start < len(texts):
+        # Grow the chunk until it holds max_chunk_shingles shingles (at least one document)
+        end, total = start, 0
+        while end < len(texts) and (end == start or total + len(shingles[end]) <= max_chunk_shingles):
+            total += len(shingles[end])
+            end += 1
+
+        lengths = np.array([len(s) for s in shingles[start:end]])
+        docs = np.flatnonzero(lengths) + start
+        if len(docs):
+            values = np.concatenate([shingles[d] for d in docs])
+            hashed = (a * values[None, :] + b) % MERSENNE_PRIME
+            bounds = np.concatenate([[0], np.cumsum(lengths[lengths > 0])[:-1]])
+            signatures[docs] = np.minimum.reduceat(hashed, bounds, axis=1).T
+        start = end
+
+    return signatures
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    """Union-find root with path halving"""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def lsh_clusters(signatures: np.ndarray, bands: int = 16, threshold: float = 0.5) -> np.ndarray:
+    """Cluster ids from LSH banding over MinHash signatures
+
+    Rows that share all values of at least one band are candidates; each
+    candidate is checked against the first row of its bucket with the
+    signature agreement (estimated Jaccard similarity) before the two are
+    merged. Every row is touched once per band, so clustering is linear in
+    the number of rows. Returns contiguous int32 ids in order of first
+    appearance; rows with empty signatures stay singletons.
+    """
+    n_rows, num_perm = signatures.shape
+    rows_per_band = max(1, num_perm // bands)
+    parent = np.arange(n_rows)
+    has_shingles = (signatures != MERSENNE_PRIME).any(axis=1)
+
+    for start in range(0, rows_per_band * bands, rows_per_band):
+        band = np.ascontiguousarray(signatures[:, start:start + rows_per_band])
+        _, bucket, counts = np.unique(band, axis=0, return_inverse=True, return_counts=True)
+        bucket = bucket.ravel()
+
+        # Candidate pairs: every row of a shared bucket against the bucket's first row
+        candidates = np.flatnonzero((counts[bucket] > 1) & has_shingles)
+        if len(candidates) == 0:
+            continue
+        first_in_bucket = np.full(len(counts), -1)
+        first_in_bucket[bucket[candidates[::-1]]] = candidates[::-1]
+        heads = first_in_bucket[bucket[candidates]]
+
+        keep = heads != candidates
+        candidates, heads = candidates[keep], heads[keep]
+        agreement = (signatures[candidates] == signatures[heads]).mean(axis=1)
+        for row, head in zip(candidates[agreement >= threshold].tolist(), heads[agreement >= threshold].tolist()):
+            root_row, root_head = _find(parent, row), _find(parent, head)
+            if root_row != root_head:
+                parent[max(root_row, root_head)] = min(root_row, root_head)
+
+    # Roots are the smallest row of each cluster, so numbering them in row
+    # order gives ids in order of first appearance
+    roots = np.array([_find(parent, i) for i in range(n_rows)], dtype=np.int64)
+    order = np.full(n_rows, -1, dtype=np.int64)
+    first_rows = np.flatnonzero(roots == np.arange(n_rows))
+    order[roots[first_rows]] = np.arange(len(first_rows))
+    return order[roots].astype(np.int32)
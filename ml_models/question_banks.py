@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Question Banks for ML Pipeline
+Per-company recommender indexes, loaded on first use and kept in a memory-bounded LRU
+"""
+
+import os
+import re
+import sys
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+# Add current directory to path so we can import our ML modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from question_recommender import SimpleQuestionRecommender
+
+MODELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trained_models')
+GLOBAL_MODEL_PATH = os.path.join(MODELS_DIR, 'question_recommender.pkl')
+BANKS_DIR = os.path.join(MODELS_DIR, 'banks')
+
+# Total budget for resident company banks (the global bank is not counted)
+DEFAULT_MEMORY_BUDGET_MB = int(os.environ.get('QUESTION_BANK_MEMORY_MB', '512'))
+
+
+def normalize_bank_name(company: Optional[str]) -> Optional[str]:
+    """Filesystem-safe bank name for a company or tenant (None for the global bank)"""
+    if not company:
+        return None
+    name = re.sub(r'[^a-z0-9_-]+', '_', str(company).strip().lower()).strip('_')
+    return name or None
+
+
+def bank_model_path(company: str, banks_dir: str = BANKS_DIR) -> str:
+    """Artifact path of a company bank"""
+    return os.path.join(banks_dir, f"{normalize_bank_name(company)}.pkl")
+
+
+class QuestionBankRegistry:
+    """Company question banks behind one LRU with a memory budget
+
+    The global bank is loaded once and pinned; it answers requests without
+    a company and for companies that have no bank of their own. Company
+    banks are loaded on first request, and the least recently used ones are
+    evicted whenever the resident banks exceed the memory budget.
+    """
+
+    def __init__(self, global_model_path: str = GLOBAL_MODEL_PATH, banks_dir: str = BANKS_DIR,
+                 memory_budget_mb: float = DEFAULT_MEMORY_BUDGET_MB):
+        self.global_model_path = global_model_path
+        self.banks_dir = banks_dir
+        self.memory_budget_bytes = int(memory_budget_mb * 1024 * 1024)
+        self._global_bank = None
+        self._banks = OrderedDict()
+        self._bank_sizes = {}
+        self._lock = threading.RLock()
+        self.stats = {
+            'hits': 0,
+            'loads': 0,
+            'evictions': 0,
+            'fallbacks': 0,
+            'load_ms_total': 0.0,
+            'last_load_ms': 0.0
+        }
+
+    def _load(self, model_path: str) -> SimpleQuestionRecommender:
+        """Load one recommender artifact and record the load latency"""
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+
+        start = time.perf_counter()
+        recommender = SimpleQuestionRecommender()
+        recommender.load_model(model_path)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.stats['loads'] += 1
+        self.stats['load_ms_total'] += elapsed_ms
+        self.stats['last_load_ms'] = elapsed_ms
+        return recommender
+
+    def get_global(self) -> SimpleQuestionRecommender:
+        """The pinned global bank"""
+        with self._lock:
+            if self._global_bank is None:
+                self._global_bank = self._load(self.global_model_path)
+            return self._global_bank
+
+    def has_bank(self, company: Optional[str]) -> bool:
+        """Whether a company has its own bank on disk"""
+        name = normalize_bank_name(company)
+        return name is not None and os.path.exists(bank_model_path(name, self.banks_dir))
+
+    def get(self, company: Optional[str] = None) -> SimpleQuestionRecommender:
+        """Recommender for a company, falling back to the global bank"""
+        name = normalize_bank_name(company)
+        if name is None:
+            return self.get_global()
+
+        with self._lock:
+            if name in self._banks:
+                self._banks.move_to_end(name)
+                self.stats['hits'] += 1
+                return self._banks[name]
+
+            if not self.has_bank(name):
+                self.stats['fallbacks'] += 1
+                return self.get_global()
+
+            recommender = self._load(bank_model_path(name, self.banks_dir))
+            self._banks[name] = recommender
+            self._bank_sizes[name] = recommender.estimate_memory_bytes()
+            self._evict(keep=name)
+            return recommender
+
+    def _evict(self, keep: str):
+        """Drop least recently used banks until the resident ones fit the budget"""
+        while self.resident_bytes() > self.memory_budget_bytes and len(self._banks) > 1:
+            name = next(iter(self._banks))
+            if name == keep:
+                break
+            self._banks.pop(name)
+            self._bank_sizes.pop(name)
+            self.stats['evictions'] += 1
+
+    def resident_bytes(self) -> int:
+        """Estimated memory held by the resident company banks"""
+        return sum(self._bank_sizes.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Load/evict counters, load latency and residency"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['avg_load_ms'] = stats['load_ms_total'] / stats['loads'] if stats['loads'] else 0.0
+            stats['resident_banks'] = list(self._banks)
+            stats['resident_bytes'] = self.resident_bytes()
+            stats['memory_budget_bytes'] = self.memory_budget_bytes
+            return stats
+
+
+def build_company_bank(company: str, questions_path: str, banks_dir: str = BANKS_DIR) -> str:
+    """Train a company bank from a questions CSV (same columns as the global bank)"""
+    recommender = SimpleQuestionRecommender()
+    if not recommender.load_and_preprocess_questions(questions_path):
+        raise ValueError(f"Could not load questions from {questions_path}")
+
+    recommender.train_tfidf_model()
+    recommender.train_semantic_index()
+    recommender.train_answer_index()
+    recommender.build_duplicate_clusters()
+    recommender.build_topic_clusters()
+    recommender.build_question_pools(seed=42)
+
+    os.makedirs(banks_dir, exist_ok=True)
+    model_path = bank_model_path(company, banks_dir)
+    recommender.save_model(model_path)
+    return model_path
+
+
+def main():
+    """Build a company bank: python question_banks.py <company> <questions.csv>"""
+    if len(sys.argv) < 3:
+        print("Usage: python question_banks.py <company> <questions.csv>")
+        return
+
+    model_path = build_company_bank(sys.argv[1], sys.argv[2])
+    print(f"Company bank ready: {model_path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -7,13 +7,19 @@ Basic NLP-based question recommendation system
 import pandas as pd
 import numpy as np
 import pickle
+import os
 import re
-import random
+import threading
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.decomposition import TruncatedSVD
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse as sp
+from answer_store import AnswerStore
+from near_duplicates import content_text, minhash_signatures, lsh_clusters
 import warnings
 from typing import Dict, List, Tuple, Any, Optional
 warnings.filterwarnings('ignore')
@@ -28,23 +34,109 @@ except:
 class SimpleQuestionRecommender:
     """Simple question recommendation system with basic NLP"""
     
+    # Refit TF-IDF in the background once this fraction of rows was added since the last fit
+    REFIT_FRACTION = 0.2
+    
+    # Profile scoring: target difficulty per skill level and weight by distance from it
+    SKILL_LEVEL_DIFFICULTY = {'Beginner': 'Easy', 'Intermediate': 'Medium', 'Medium': 'Medium', 'Advanced': 'Hard'}
+    DIFFICULTY_ORDER = {'Easy': 0, 'Medium': 1, 'Hard': 2}
+    DIFFICULTY_FIT_WEIGHTS = [1.0, 0.5, 0.2]
+    BASE_PROFILE_SCORE = 0.1
+    
+    # Serving representation of the questions table
+    CATEGORICAL_COLUMNS = ['Category', 'Difficulty']
+    SERVING_TEXT_COLUMNS = ['Question', 'Answer']
+    TRAINING_ONLY_COLUMNS = ['cleaned_question', 'cleaned_answer', 'combined_text']
+    
     def __init__(self):
-        self.questions_df = None
+        self._questions_df = None
+        self._question_vectors = None
+        # Reference answers kept out of the table in a lazily read compressed file
+        self.answer_store = None
+        self._appended_answers = []
+        # Reference-answer TF-IDF rows and their inverted term index, for answer scoring
+        self.answer_vectors = None
+        self.answer_term_index = None
         self.tfidf_vectorizer = None
-        self.question_vectors = None
+        # Latent semantic (LSA) index: SVD projection and row-normalized embeddings
+        self.lsa_svd = None
+        self.semantic_embeddings = None
+        # Per-category TF-IDF centroids for profile scoring
+        self.category_centroids = None
+        self.centroid_index = {}
+        # Near-duplicate cluster id per question row (MinHash/LSH, built with the model)
+        self.duplicate_cluster_ids = None
+        # Topic id per question row and the topic centroids (MiniBatchKMeans over TF-IDF)
+        self.topic_ids = None
+        self.topic_centroids = None
+        # Rows added through add_questions, appended to the index on next access
+        self._pending_rows = []
+        self._pending_vectors = []
+        self._rows_since_fit = 0
+        self._next_question_number = None
+        # Pre-permuted row ids per (category, difficulty) bucket, built with the model
+        self.question_pools = None
+        self._refit_thread = None
+        self._lock = threading.RLock()
+        # Boolean mask over question rows to skip (e.g. questions a user has already seen)
+        self.exclude_mask = None
+        # Normalized question text -> first row, built on first text lookup
+        self._question_key_index = None
+        # Hash of each row's question text, built on first use
+        self._question_row_hashes = None
         # Load stopwords if available; fall back gracefully without network
         try:
             self.stop_words = set(stopwords.words('english'))
         except Exception:
             self.stop_words = set()
         
+    @property
+    def questions_df(self) -> Optional[pd.DataFrame]:
+        """Questions table, including any rows added since the last access"""
+        if self._pending_rows:
+            self._flush_pending()
+        return self._questions_df
+    
+    @questions_df.setter
+    def questions_df(self, value: Optional[pd.DataFrame]):
+        self._questions_df = value
+        self._next_question_number = None
+        self.question_pools = None
+        self.answer_store = None
+        self._appended_answers = []
+        self.answer_vectors = None
+        self.answer_term_index = None
+        self.duplicate_cluster_ids = None
+        self.topic_ids = None
+        self.topic_centroids = None
+        self._question_key_index = None
+        self._question_row_hashes = None
+    
+    @property
+    def question_vectors(self):
+        """TF-IDF matrix, including any rows added since the last access"""
+        if self._pending_vectors:
+            self._flush_pending()
+        return self._question_vectors
+    
+    @question_vectors.setter
+    def question_vectors(self, value):
+        self._question_vectors = value
+    
     def load_and_preprocess_questions(self, questions_path: str) -> bool:
-        """Load and preprocess questions dataset"""
+        """Load and preprocess questions dataset
+        
+        Accepts the questions CSV or the Parquet file written by
+        EnhancedDataPreprocessor.stream_questions_data.
+        """
         try:
             print("Loading and preprocessing questions...")
             
             # Load questions
-            self.questions_df = pd.read_csv(questions_path, encoding='latin-1')
+            if questions_path.endswith('.parquet'):
+                self.questions_df = self._read_questions_parquet(questions_path)
+            else:
+                self.questions_df = pd.read_csv(questions_path, encoding='latin-1')
             print(f"Loaded {len(self.questions_df)} questions")
             
             # Clean and validate data
@@ -52,15 +144,16 @@ class SimpleQuestionRecommender:
             self.questions_df['Question'] = self.questions_df['Question'].astype(str)
             self.questions_df['Answer'] = self.questions_df['Answer'].astype(str)
             
-            # Simple text preprocessing
-            self.questions_df['cleaned_question'] = self.questions_df['Question'].apply(self._simple_text_cleaning)
-            self.questions_df['cleaned_answer'] = self.questions_df['Answer'].apply(self._simple_text_cleaning)
-            
-            # Create combined text for vectorization
-            self.questions_df['combined_text'] = (
-                self.questions_df['cleaned_question'] + ' ' + 
-                self.questions_df['cleaned_answer']
-            )
+            # Simple text preprocessing (streamed Parquet files carry it already)
+            if not set(self.TRAINING_ONLY_COLUMNS).issubset(self.questions_df.columns):
+                self.questions_df['cleaned_question'] = self.questions_df['Question'].apply(self._simple_text_cleaning)
+                self.questions_df['cleaned_answer'] = self.questions_df['Answer'].apply(self._simple_text_cleaning)
+                
+                # Create combined text for vectorization
+                self.questions_df['combined_text'] = (
+                    self.questions_df['cleaned_question'] + ' ' + 
+                    self.questions_df['cleaned_answer']
+                )
             
             print(f"Preprocessed {len(self.questions_df)} questions")
             print(f"Categories: {list(self.questions_df['Category'].unique())}")
@@ -72,6 +165,25 @@ class SimpleQuestionRecommender:
             print(f"Error loading questions: {e}")
             return False
     
+    @classmethod
+    def _read_questions_parquet(cls, questions_path: str) -> pd.DataFrame:
+        """Question columns of a streamed Parquet file, with its cleaned text columns when present
+        
+        Only the columns the recommender uses are read (column projection);
+        files without the cleaned columns get them rebuilt by the caller.
+        """
+        import pyarrow.parquet as pq
+        
+        available = set(pq.read_schema(questions_path).names)
+        columns = ['Question Number', 'Question', 'Answer', 'Category', 'Difficulty']
+        columns += [col for col in cls.TRAINING_ONLY_COLUMNS if col in available]
+        df = pq.read_table(questions_path, columns=columns).to_pandas()
+        # The streamed file keeps every column as text; numbers match what read_csv infers
+        numbers = pd.to_numeric(df['Question Number'], errors='coerce')
+        if numbers.notna().all():
+            df['Question Number'] = numbers.astype(np.int64)
+        return df
+    
     def _simple_text_cleaning(self, text: str) -> str:
         """Simple text cleaning and preprocessing"""
         if pd.isna(text):
@@ -92,37 +204,824 @@ class SimpleQuestionRecommender:
         """Train simple TF-IDF vectorization model"""
         print("Training Simple TF-IDF Model...")
         
+        self.tfidf_vectorizer = self._build_tfidf_vectorizer()
+        
+        # Fit on combined text
+        self.question_vectors = self.tfidf_vectorizer.fit_transform(
+            self.questions_df['combined_text']
+        )
+        self._rows_since_fit = 0
+        self._compute_category_centroids()
+        
+        print(f"TF-IDF trained with {self.question_vectors.shape[1]} features")
+    
+    def _build_tfidf_vectorizer(self) -> TfidfVectorizer:
+        """Create an unfitted TF-IDF vectorizer with the model's parameters"""
         # Basic TF-IDF with simple parameters
-        self.tfidf_vectorizer = TfidfVectorizer(
+        return TfidfVectorizer(
             max_features=1000,        # Limit to 1000 features
             stop_words='english',     # Remove common English words
             ngram_range=(1, 2),      # Use single words and pairs
             min_df=1,                 # Include all words
             max_df=0.9                # Exclude very common words
         )
+    
+    def add_questions(self, rows: List[Dict[str, Any]]) -> int:
+        """Add new questions to the index without refitting TF-IDF
         
-        # Fit on combined text
-        self.question_vectors = self.tfidf_vectorizer.fit_transform(
-            self.questions_df['combined_text']
+        New rows are vectorized with the frozen vocabulary of the current
+        vectorizer and buffered, so the cost is proportional to the new rows.
+        The buffer is appended to the table and matrix on next access. Once
+        enough rows have accumulated the vectorizer is refit in the background.
+        
+        Args:
+            rows: Dicts with 'Question', 'Answer', 'Category', 'Difficulty'
+                  and optionally 'Question Number'
+        
+        Returns:
+            Number of questions added
+        """
+        if self.tfidf_vectorizer is None:
+            raise ValueError("TF-IDF model not trained. Please train or load the model first.")
+        
+        new_df = pd.DataFrame(rows)
+        missing = [col for col in ['Question', 'Answer', 'Category', 'Difficulty'] if col not in new_df.columns]
+        if missing:
+            raise ValueError(f"Missing required fields: {missing}")
+        
+        new_df = new_df.dropna(subset=['Question', 'Answer', 'Category', 'Difficulty'])
+        if len(new_df) == 0:
+            return 0
+        
+        new_df['Question'] = new_df['Question'].astype(str)
+        new_df['Answer'] = new_df['Answer'].astype(str)
+        new_df['cleaned_question'] = new_df['Question'].apply(self._simple_text_cleaning)
+        new_df['cleaned_answer'] = new_df['Answer'].apply(self._simple_text_cleaning)
+        new_df['combined_text'] = new_df['cleaned_question'] + ' ' + new_df['cleaned_answer']
+        
+        with self._lock:
+            # Number new questions after the highest existing one
+            if self._next_question_number is None:
+                numbers = pd.to_numeric(self._questions_df['Question Number'], errors='coerce')
+                self._next_question_number = int(numbers.max()) + 1 if numbers.notna().any() else 1
+            if 'Question Number' not in new_df.columns:
+                new_df['Question Number'] = np.nan
+            numbers = pd.to_numeric(new_df['Question Number'], errors='coerce')
+            unnumbered = numbers.isna().to_numpy()
+            numbers[unnumbered] = np.arange(
+                self._next_question_number, self._next_question_number + int(unnumbered.sum())
+            )
+            new_df['Question Number'] = numbers.astype(np.int64)
+            self._next_question_number = max(self._next_question_number, int(numbers.max()) + 1)
+            
+            new_vectors = self.tfidf_vectorizer.transform(new_df['combined_text'])
+            keep = [col for col in new_df.columns if col in self._questions_df.columns or col == 'Answer']
+            self._pending_rows.append(new_df[keep])
+            self._pending_vectors.append(new_vectors)
+            self._rows_since_fit += len(new_df)
+            
+            total_rows = len(self._questions_df) + sum(len(df) for df in self._pending_rows)
+            refit_running = self._refit_thread is not None and self._refit_thread.is_alive()
+            if self._rows_since_fit >= self.REFIT_FRACTION * total_rows and not refit_running:
+                self.refit_tfidf_model(background=True)
+        
+        return len(new_df)
+    
+    def _flush_pending(self):
+        """Append buffered rows and vectors to the questions table and matrix"""
+        with self._lock:
+            if not self._pending_rows:
+                return
+            offset = len(self._questions_df)
+            new_rows = pd.concat(self._pending_rows, ignore_index=True)
+            if 'Answer' not in self._questions_df.columns:
+                # Answers of rows added after loading stay in memory next to the store
+                self._appended_answers.extend(new_rows.pop('Answer').tolist())
+            new_rows = self._align_new_rows(new_rows)
+            self._questions_df = pd.concat([self._questions_df, new_rows], ignore_index=True)
+            if self.question_pools is not None:
+                self._extend_question_pools(new_rows, offset)
+            if self.duplicate_cluster_ids is not None:
+                # New rows start as their own clusters until the next build
+                next_id = int(self.duplicate_cluster_ids.max()) + 1 if len(self.duplicate_cluster_ids) else 0
+                self.duplicate_cluster_ids = np.concatenate([
+                    self.duplicate_cluster_ids,
+                    np.arange(next_id, next_id + len(new_rows), dtype=np.int32)
+                ])
+            if self.topic_ids is not None and self.topic_centroids is not None:
+                self.topic_ids = np.concatenate([
+                    self.topic_ids, self._assign_topics(sp.vstack(self._pending_vectors).tocsr())
+                ])
+            self._question_vectors = sp.vstack([self._question_vectors] + self._pending_vectors).tocsr()
+            self._pending_rows = []
+            self._pending_vectors = []
+            self._question_key_index = None
+            self._question_row_hashes = None
+    
+    def _align_new_rows(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """Give new rows the table's column dtypes so appending keeps them compact"""
+        base = self._questions_df
+        for col in self.CATEGORICAL_COLUMNS:
+            if isinstance(base[col].dtype, pd.CategoricalDtype):
+                unseen = pd.Index(new_rows[col].unique()).difference(base[col].cat.categories)
+                if len(unseen):
+                    base[col] = base[col].cat.add_categories(unseen)
+                new_rows[col] = pd.Categorical(new_rows[col], categories=base[col].cat.categories)
+        for col in self.SERVING_TEXT_COLUMNS:
+            if col in base.columns:
+                new_rows[col] = new_rows[col].astype(base[col].dtype)
+        return new_rows
+    
+    @classmethod
+    def _compact_questions_frame(cls, questions_df: pd.DataFrame) -> pd.DataFrame:
+        """Serving representation of the questions table
+        
+        Category and Difficulty become categoricals (small integer codes, so
+        filters compare integers), training-only text columns are dropped and
+        Question/Answer are stored as Arrow strings, i.e. one contiguous
+        buffer plus offsets per column instead of a Python object per row.
+        """
+        df = questions_df.drop(columns=[c for c in cls.TRAINING_ONLY_COLUMNS if c in questions_df.columns])
+        df = df.reset_index(drop=True)
+        
+        for col in cls.CATEGORICAL_COLUMNS:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        
+        try:
+            string_dtype = pd.StringDtype('pyarrow')
+        except ImportError:
+            # Without pyarrow keep plain object strings
+            string_dtype = object
+        for col in cls.SERVING_TEXT_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype(string_dtype)
+        
+        return df
+    
+    def _combined_texts(self, questions_df: pd.DataFrame) -> List[str]:
+        """TF-IDF input text per row, rebuilt when the served table dropped it"""
+        if 'combined_text' in questions_df.columns and questions_df['combined_text'].notna().all():
+            return questions_df['combined_text'].tolist()
+        if 'Answer' in questions_df.columns:
+            answers = questions_df['Answer'].tolist()
+        else:
+            answers = self.get_answers(questions_df.index.to_numpy())
+        return [
+            self._simple_text_cleaning(question) + ' ' + self._simple_text_cleaning(answer)
+            for question, answer in zip(questions_df['Question'].tolist(), answers)
+        ]
+    
+    def get_answers(self, rows) -> List[str]:
+        """Reference answers for the given row positions
+        
+        Reads the Answer column when the table has one, otherwise the
+        compressed answer store (plus answers of rows added since loading).
+        """
+        questions_df = self.questions_df
+        if 'Answer' in questions_df.columns:
+            return questions_df['Answer'].iloc[rows].tolist()
+        
+        rows = np.asarray(rows, dtype=np.int64)
+        n_stored = len(self.answer_store)
+        stored = rows < n_stored
+        answers = [None] * len(rows)
+        stored_positions = np.flatnonzero(stored)
+        for i, answer in zip(stored_positions.tolist(), self.answer_store.get_many(rows[stored])):
+            answers[i] = answer
+        for i in np.flatnonzero(~stored).tolist():
+            answers[i] = self._appended_answers[int(rows[i]) - n_stored]
+        return answers
+    
+    def refit_tfidf_model(self, background: bool = False):
+        """Refit TF-IDF over the whole bank, optionally in a background thread
+        
+        Serving continues with the current vectorizer while the refit runs;
+        rows added in the meantime are re-vectorized before the swap.
+        """
+        if background:
+            self._refit_thread = threading.Thread(target=self._refit, daemon=True)
+            self._refit_thread.start()
+        else:
+            self._refit()
+    
+    def wait_for_refit(self):
+        """Block until a running background refit has finished"""
+        if self._refit_thread is not None:
+            self._refit_thread.join()
+    
+    def _refit(self):
+        """Fit a new vectorizer on a snapshot of the bank and swap it in
+        
+        The vectorizer, and the semantic index and topics tied to its
+        vocabulary, are built without holding the lock, so serving and
+        add_questions keep going; the lock is only taken to take the
+        snapshot and to swap the results in. Nothing is printed, so a
+        background refit never writes into a caller's stdout.
+        """
+        with self._lock:
+            snapshot = self.questions_df
+            lsa_components = self.lsa_svd.n_components if self.lsa_svd is not None else None
+            lsa_dtype = self.semantic_embeddings.dtype if self.semantic_embeddings is not None else np.float16
+            n_topics = len(self.topic_centroids) if self.topic_centroids is not None else None
+        texts = self._combined_texts(snapshot)
+        
+        vectorizer = self._build_tfidf_vectorizer()
+        vectors = vectorizer.fit_transform(texts)
+        # The SVD basis and topic centroids are tied to the old vocabulary, so rebuild them as well
+        semantic_index = self._fit_semantic_index(vectors, lsa_components, lsa_dtype) if lsa_components else None
+        topics = self._fit_topic_clusters(vectors, n_topics) if n_topics else None
+        
+        with self._lock:
+            # Accessing questions_df flushes rows added during the refit
+            questions_df = self.questions_df
+            extra_vectors = None
+            if len(questions_df) > len(texts):
+                extra_vectors = vectorizer.transform(self._combined_texts(questions_df.iloc[len(texts):]))
+                vectors = sp.vstack([vectors, extra_vectors]).tocsr()
+            self.tfidf_vectorizer = vectorizer
+            self.question_vectors = vectors
+            self._rows_since_fit = len(questions_df) - len(texts)
+            self._compute_category_centroids()
+            
+            # Answer vectors use the old vocabulary too; rebuilt on the next scoring call
+            self.answer_vectors = None
+            self.answer_term_index = None
+            
+            # Rows added during the refit are projected at query time (semantic
+            # index) or assigned to the nearest new centroid (topics)
+            if semantic_index is not None:
+                self.lsa_svd, self.semantic_embeddings = semantic_index
+            if topics is not None:
+                self.topic_ids, self.topic_centroids = topics
+                if extra_vectors is not None:
+                    self.topic_ids = np.concatenate([self.topic_ids, self._assign_topics(extra_vectors)])
+    
+    def train_semantic_index(self, n_components: int = 128, dtype=np.float16):
+        """Train a latent semantic (LSA) index over the TF-IDF matrix
+        
+        TruncatedSVD projects each question into a small dense space where
+        paraphrases with different wording still end up close together.
+        Rows are L2-normalized so a dot product is the cosine similarity.
+        """
+        if self.question_vectors is None:
+            raise ValueError("TF-IDF model not trained. Please train the model first.")
+        
+        print("Training LSA Semantic Index...")
+        
+        self.lsa_svd, self.semantic_embeddings = self._fit_semantic_index(self.question_vectors, n_components, dtype)
+        
+        explained = self.lsa_svd.explained_variance_ratio_.sum()
+        print(f"LSA index trained with {self.lsa_svd.n_components} components ({explained:.1%} variance explained)")
+    
+    def _fit_semantic_index(self, vectors, n_components: int, dtype) -> Tuple[TruncatedSVD, np.ndarray]:
+        """Fit the LSA projection of a TF-IDF matrix and its normalized embeddings"""
+        n_rows, n_features = vectors.shape
+        n_components = max(1, min(n_components, n_features - 1, n_rows - 1))
+        
+        svd = TruncatedSVD(n_components=n_components, random_state=42)
+        embeddings = svd.fit_transform(vectors)
+        return svd, self._normalize_rows(embeddings).astype(dtype)
+    
+    def train_answer_index(self):
+        """Vectorize the reference answers on their own for answer scoring
+        
+        Answers get their own TF-IDF rows (the question index mixes question
+        and answer text). Rows added since the last build are transformed
+        incrementally with the frozen vocabulary.
+        """
+        if self.tfidf_vectorizer is None:
+            raise ValueError("TF-IDF model not trained. Please train the model first.")
+        
+        with self._lock:
+            n_rows = len(self.questions_df)
+            n_indexed = self.answer_vectors.shape[0] if self.answer_vectors is not None else 0
+            if n_indexed == n_rows and self.answer_term_index is not None:
+                return
+            
+            if n_indexed < n_rows:
+                answers = self.get_answers(np.arange(n_indexed, n_rows))
+                new_vectors = self.tfidf_vectorizer.transform([self._simple_text_cleaning(a) for a in answers])
+                if self.answer_vectors is None:
+                    self.answer_vectors = new_vectors.tocsr()
+                else:
+                    self.answer_vectors = sp.vstack([self.answer_vectors, new_vectors]).tocsr()
+            self._build_answer_term_index()
+    
+    def _build_answer_term_index(self):
+        """Build the inverted term -> answer index as sorted posting keys
+        
+        Each (term, answer row) posting is encoded as term * n_answers + row.
+        Keys come out sorted, so any batch of (term, row) lookups is a single
+        np.searchsorted call.
+        """
+        postings = self.answer_vectors.tocsc()
+        postings.sort_indices()
+        terms = np.repeat(np.arange(postings.shape[1], dtype=np.int64), np.diff(postings.indptr))
+        self.answer_term_index = terms * postings.shape[0] + postings.indices.astype(np.int64)
+    
+    def _resolve_question_rows(self, question_ids) -> np.ndarray:
+        """Row positions for question ids: Question Number (int) or question text (-1 if unknown)"""
+        rows = np.full(len(question_ids), -1, dtype=np.int64)
+        numeric = [i for i, qid in enumerate(question_ids) if isinstance(qid, (int, np.integer))]
+        textual = [i for i, qid in enumerate(question_ids) if isinstance(qid, str)]
+        
+        if numeric:
+            numbers = self.questions_df['Question Number']
+            first_positions = np.flatnonzero(~numbers.duplicated(keep='first').to_numpy())
+            positions = pd.Index(numbers.to_numpy()[first_positions]).get_indexer(
+                [int(question_ids[i]) for i in numeric]
+            )
+            rows[numeric] = np.where(positions >= 0, first_positions[positions], -1)
+        if textual:
+            rows[textual] = self.get_row_ids_for_question_texts([question_ids[i] for i in textual])
+        
+        return rows
+    
+    @staticmethod
+    def _question_key(text: str) -> str:
+        """Lookup key of a question text: its lowercase letters and digits only
+        
+        Spacing and punctuation are ignored, so a served question (where
+        generate_questions' clean_question_text dropped '/', '*' and '\\')
+        and spoken variants like "useMemo / useCallback" share the bank
+        text's key.
+        """
+        return re.sub(r'[^a-z0-9]', '', str(text).lower())
+    
+    def get_question_row_hashes(self) -> np.ndarray:
+        """64-bit hash of each row's question text, in row order
+        
+        Lets row-keyed state (e.g. per-user seen bitsets) detect a retrained
+        or reordered bank; appending rows leaves the earlier hashes as they are.
+        """
+        if self._question_row_hashes is None:
+            self._question_row_hashes = pd.util.hash_pandas_object(
+                self.questions_df['Question'], index=False
+            ).to_numpy()
+        return self._question_row_hashes
+    
+    def get_row_ids_for_question_texts(self, questions: List[str], min_contained_words: int = 3) -> np.ndarray:
+        """Row of the first bank question matching each text (-1 if unknown)
+        
+        Texts match on _question_key. A text without an exact match (e.g. an
+        interviewer message that wraps the question) resolves to the longest
+        bank question of at least min_contained_words words that it contains.
+        """
+        if self._question_key_index is None:
+            index = {}
+            for row, question in enumerate(self.questions_df['Question'].tolist()):
+                index.setdefault(self._question_key(question), (row, len(str(question).split())))
+            self._question_key_index = index
+        
+        rows = np.full(len(questions), -1, dtype=np.int64)
+        for i, question in enumerate(questions):
+            key = self._question_key(question)
+            match = self._question_key_index.get(key)
+            if match is None and key:
+                contained = [
+                    (len(candidate), -row) for candidate, (row, n_words) in self._question_key_index.items()
+                    if n_words >= min_contained_words and candidate and candidate in key
+                ]
+                match = (-max(contained)[1], 0) if contained else None
+            rows[i] = match[0] if match is not None else -1
+        return rows
+    
+    def score_answers(self, pairs, n_missing_keywords: int = 5) -> List[Dict[str, Any]]:
+        """Score candidate answers against the reference answers of the asked questions
+        
+        All transcripts are vectorized in one transform call; cosine
+        similarity to the reference answers is one row-wise sparse product
+        and keyword coverage (share of the reference answer's terms that the
+        transcript mentions) one lookup into the inverted term index.
+        
+        Args:
+            pairs: (question_id, transcript) pairs; question_id is a
+                Question Number or the question text (served or
+                interviewer wording, see get_row_ids_for_question_texts)
+            n_missing_keywords: Number of uncovered reference terms to report
+        """
+        if self.tfidf_vectorizer is None:
+            raise ValueError("TF-IDF model not trained. Please train the model first.")
+        if not pairs:
+            return []
+        
+        self.train_answer_index()
+        question_ids = [question_id for question_id, _ in pairs]
+        rows = self._resolve_question_rows(question_ids)
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+        
+        transcripts = self.tfidf_vectorizer.transform(
+            [self._simple_text_cleaning(transcript or '') for _, transcript in pairs]
+        ).tocsr()
+        references = self.answer_vectors[safe_rows]
+        
+        # Both sides are L2-normalized, so the row-wise dot product is the cosine similarity
+        similarity = np.asarray(references.multiply(transcripts).sum(axis=1)).ravel()
+        
+        # Look every (transcript term, asked answer) pair up in the inverted index at once
+        n_answers = self.answer_vectors.shape[0]
+        pair_of_term = np.repeat(np.arange(len(pairs)), np.diff(transcripts.indptr))
+        keys = transcripts.indices.astype(np.int64) * n_answers + safe_rows[pair_of_term]
+        positions = np.searchsorted(self.answer_term_index, keys)
+        hits = positions < len(self.answer_term_index)
+        hits[hits] = self.answer_term_index[positions[hits]] == keys[hits]
+        matched = np.bincount(pair_of_term[hits], minlength=len(pairs))
+        total = np.diff(self.answer_vectors.indptr)[safe_rows]
+        coverage = matched / np.maximum(total, 1)
+        
+        feature_names = self.tfidf_vectorizer.get_feature_names_out()
+        results = []
+        for i, question_id in enumerate(question_ids):
+            if not known[i]:
+                results.append({
+                    'question_id': question_id,
+                    'question_found': False,
+                    'similarity_score': 0.0,
+                    'keyword_coverage': 0.0,
+                    'matched_keywords': 0,
+                    'total_keywords': 0,
+                    'missing_keywords': []
+                })
+                continue
+            
+            # Uncovered reference terms, heaviest first
+            reference = references.getrow(i)
+            missing = ~np.isin(reference.indices, transcripts.indices[transcripts.indptr[i]:transcripts.indptr[i + 1]])
+            order = np.argsort(-reference.data[missing], kind='stable')[:n_missing_keywords]
+            results.append({
+                'question_id': question_id,
+                'question_found': True,
+                'similarity_score': round(float(similarity[i]), 4),
+                'keyword_coverage': round(float(coverage[i]), 4),
+                'matched_keywords': int(matched[i]),
+                'total_keywords': int(total[i]),
+                'missing_keywords': feature_names[reference.indices[missing][order]].tolist()
+            })
+        
+        return results
+    
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize matrix rows, leaving all-zero rows at zero"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Project cleaned texts into the LSA space as normalized float32 rows"""
+        vectors = self.tfidf_vectorizer.transform(texts)
+        return self._normalize_rows(self.lsa_svd.transform(vectors)).astype(np.float32)
+    
+    def recommend_questions_semantic(self, query_question, n_recommendations=5, block_size=65536):
+        """Recommend questions similar to a query using the LSA index
+        
+        Scores are computed block by block over the (memory-mapped)
+        embedding matrix while keeping a running top-k, so only one block
+        is ever converted to float32 at a time.
+        """
+        if self.lsa_svd is None or self.semantic_embeddings is None:
+            raise ValueError("Semantic index not trained. Please train the semantic index first.")
+        
+        query_vector = self._embed_texts([self._simple_text_cleaning(query_question)])[0]
+        
+        best_indices = np.zeros(0, dtype=np.int64)
+        best_scores = np.zeros(0, dtype=np.float32)
+        n_indexed = len(self.semantic_embeddings)
+        
+        for start in range(0, n_indexed, block_size):
+            block = np.asarray(self.semantic_embeddings[start:start + block_size], dtype=np.float32)
+            best_indices, best_scores = self._merge_top_k(
+                best_indices, best_scores, block @ query_vector, start, n_recommendations
+            )
+        
+        # Questions added since the index was built are projected on the fly
+        n_total = len(self.questions_df)
+        if n_total > n_indexed:
+            extra = self._normalize_rows(
+                self.lsa_svd.transform(self.question_vectors[n_indexed:])
+            ).astype(np.float32)
+            best_indices, best_scores = self._merge_top_k(
+                best_indices, best_scores, extra @ query_vector, n_indexed, n_recommendations
+            )
+        
+        order = np.argsort(-best_scores, kind='stable')
+        return self._build_recommendations(best_indices[order], 'similarity_score', best_scores[order])
+    
+    @staticmethod
+    def _merge_top_k(best_indices, best_scores, block_scores, offset, k):
+        """Merge a block of scores into the running top-k"""
+        if len(block_scores) > k:
+            top = np.argpartition(-block_scores, k - 1)[:k]
+        else:
+            top = np.arange(len(block_scores))
+        indices = np.concatenate([best_indices, top + offset])
+        scores = np.concatenate([best_scores, block_scores[top]])
+        if len(scores) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            indices, scores = indices[keep], scores[keep]
+        return indices, scores
+    
+    def set_exclude_mask(self, exclude_mask: Optional[np.ndarray]):
+        """Set a boolean mask of question rows to skip in filtering (None clears it)"""
+        if exclude_mask is not None:
+            exclude_mask = np.asarray(exclude_mask, dtype=bool)
+            if len(exclude_mask) != len(self.questions_df):
+                raise ValueError(
+                    f"Exclude mask length {len(exclude_mask)} does not match {len(self.questions_df)} questions"
+                )
+        self.exclude_mask = exclude_mask
+    
+    def get_row_ids_for_questions(self, questions: List[str]) -> np.ndarray:
+        """Get row positions of all questions whose text is in the given list"""
+        return np.flatnonzero(self.questions_df['Question'].isin(questions).to_numpy())
+    
+    def build_duplicate_clusters(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16):
+        """Cluster reworded duplicate questions with MinHash signatures and LSH banding
+        
+        Signatures are computed over the content words of each question, so
+        the build is roughly linear in the size of the bank. Rows whose
+        estimated Jaccard similarity reaches the threshold share a cluster id.
+        """
+        if self.questions_df is None:
+            raise ValueError("Questions not loaded. Please load questions first.")
+        
+        print("Clustering Near-Duplicate Questions...")
+        
+        texts = [content_text(self._simple_text_cleaning(q)) for q in self.questions_df['Question'].tolist()]
+        signatures = minhash_signatures(texts, num_perm=num_perm)
+        self.duplicate_cluster_ids = lsh_clusters(signatures, bands=bands, threshold=threshold)
+        
+        n_clusters = int(self.duplicate_cluster_ids.max()) + 1 if len(texts) else 0
+        print(f"Found {n_clusters} distinct questions among {len(texts)} rows")
+    
+    def build_topic_clusters(self, n_topics: Optional[int] = None, batch_size: int = 1024, seed: int = 42):
+        """Group questions into topics with MiniBatchKMeans over the TF-IDF matrix
+        
+        Mini-batches keep the build cost linear in the bank size. By default
+        the number of topics grows with the square root of the bank size.
+        """
+        if self.question_vectors is None:
+            raise ValueError("TF-IDF model not trained. Please train the model first.")
+        
+        print("Clustering Question Topics...")
+        
+        n_rows = self.question_vectors.shape[0]
+        if n_topics is None:
+            n_topics = int(np.clip(np.sqrt(n_rows / 2), 2, 64))
+        self.topic_ids, self.topic_centroids = self._fit_topic_clusters(
+            self.question_vectors, n_topics, batch_size, seed
         )
         
-        print(f"TF-IDF trained with {self.question_vectors.shape[1]} features")
+        print(f"Clustered {n_rows} questions into {len(self.topic_centroids)} topics")
     
-    def get_questions_by_filters(self, category=None, difficulty=None, limit=10):
-        """Get questions filtered by various criteria"""
-        filtered_df = self.questions_df.copy()
+    @staticmethod
+    def _fit_topic_clusters(vectors, n_topics: int, batch_size: int = 1024,
+                            seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+        """Topic id of every TF-IDF row and the topic centroids (MiniBatchKMeans)"""
+        n_topics = max(1, min(n_topics, vectors.shape[0]))
+        kmeans = MiniBatchKMeans(n_clusters=n_topics, batch_size=batch_size, n_init=3, random_state=seed)
+        return kmeans.fit_predict(vectors).astype(np.int32), kmeans.cluster_centers_.astype(np.float32)
+    
+    def _assign_topics(self, vectors) -> np.ndarray:
+        """Nearest topic centroid for each TF-IDF row"""
+        # argmin ||x - c||^2 = argmin ||c||^2 - 2 x.c for a fixed x
+        distances = np.square(self.topic_centroids).sum(axis=1) - 2 * np.asarray(vectors @ self.topic_centroids.T)
+        return distances.argmin(axis=1).astype(np.int32)
+    
+    def get_topic_terms(self, n_terms: int = 3) -> List[List[str]]:
+        """Heaviest TF-IDF terms of each topic centroid, as topic labels"""
+        if self.topic_centroids is None:
+            return []
+        terms = self.tfidf_vectorizer.get_feature_names_out()
+        top = np.argsort(-self.topic_centroids, axis=1)[:, :n_terms]
+        return [terms[row].tolist() for row in top]
+    
+    def select_topic_balanced_rows(self, rows, n: int) -> np.ndarray:
+        """Pick n of the candidate rows round-robin across their topics
+        
+        Round r takes the r-th candidate of every topic, topics in order of
+        their first candidate, so each topic keeps its own candidate order.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if self.topic_ids is None or len(rows) <= n:
+            return rows[:n]
+        
+        topics = self.topic_ids[rows]
+        order = np.argsort(topics, kind='stable')
+        sorted_topics = topics[order]
+        starts = np.flatnonzero(np.r_[True, sorted_topics[1:] != sorted_topics[:-1]])
+        sizes = np.diff(np.r_[starts, len(rows)])
+        
+        # Position within the topic (round) and first candidate of the topic (order in a round)
+        rank = np.empty(len(rows), dtype=np.int64)
+        rank[order] = np.arange(len(rows)) - np.repeat(starts, sizes)
+        first_candidate = np.empty(len(rows), dtype=np.int64)
+        first_candidate[order] = np.repeat(order[starts], sizes)
+        
+        return rows[np.lexsort((first_candidate, rank))[:n]]
+    
+    def get_first_row_ids(self, questions: List[str]) -> np.ndarray:
+        """Get the row position of the first question with each given text (-1 if unknown)"""
+        question_texts = self.questions_df['Question'].to_numpy()
+        first_positions = np.flatnonzero(~self.questions_df['Question'].duplicated(keep='first').to_numpy())
+        positions = pd.Index(question_texts[first_positions]).get_indexer(questions)
+        return np.where(positions >= 0, first_positions[positions], -1)
+    
+    def select_diverse_rows(self, row_ids, n: int, relevance=None, diversity: float = 0.3) -> np.ndarray:
+        """Select n rows by maximal marginal relevance over TF-IDF vectors
+        
+        Keeps a running max-similarity of every candidate to the rows picked
+        so far and updates it with one sparse column product per pick, so
+        each step costs O(candidates) rather than all pairwise similarities.
+        
+        Args:
+            row_ids: Candidate row positions
+            n: Number of rows to select
+            relevance: Optional per-candidate relevance (defaults to 1.0)
+            diversity: 0 keeps relevance order, 1 only maximizes dissimilarity
+        
+        Returns:
+            Selected row positions in pick order
+        """
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        row_ids = row_ids[row_ids >= 0]
+        n = min(n, len(row_ids))
+        if n == 0:
+            return row_ids[:0]
         
-        if category:
-            filtered_df = filtered_df[filtered_df['Category'] == category]
+        relevance = np.ones(len(row_ids)) if relevance is None else np.asarray(relevance, dtype=float)[:len(row_ids)]
+        candidate_vectors = self.question_vectors[row_ids]
+        max_similarity = np.zeros(len(row_ids))
+        available = np.ones(len(row_ids), dtype=bool)
+        picked = []
         
-        if difficulty:
-            filtered_df = filtered_df[filtered_df['Difficulty'] == difficulty]
+        for _ in range(n):
+            mmr = (1 - diversity) * relevance - diversity * max_similarity
+            mmr[~available] = -np.inf
+            best = int(np.argmax(mmr))
+            picked.append(best)
+            available[best] = False
+            
+            similarity = np.asarray((candidate_vectors @ candidate_vectors[best].T).todense()).ravel()
+            np.maximum(max_similarity, similarity, out=max_similarity)
+        
+        return row_ids[picked]
+    
+    def build_question_pools(self, seed: Optional[int] = None):
+        """Materialize one permuted row-id array per (category, difficulty) bucket
         
-        # Shuffle the questions to ensure variety
-        filtered_df = filtered_df.sample(frac=1, random_state=random.randint(1, 1000)).reset_index(drop=True)
+        Pools are also kept per category, per difficulty and for the whole
+        bank (None in a key means any), stored with the model, and let
+        serving draw questions without filtering or shuffling the table.
+        Calling this again reshuffles every pool.
+        """
+        rng = np.random.default_rng(seed)
+        df = self.questions_df
         
-        if limit:
-            filtered_df = filtered_df.head(limit)
+        groups = [((None, None), np.arange(len(df)))]
+        for (category, difficulty), rows in df.groupby(['Category', 'Difficulty'], sort=False, observed=True).indices.items():
+            groups.append(((category, difficulty), rows))
+        for category, rows in df.groupby('Category', sort=False, observed=True).indices.items():
+            groups.append(((category, None), rows))
+        for difficulty, rows in df.groupby('Difficulty', sort=False, observed=True).indices.items():
+            groups.append(((None, difficulty), rows))
+        
+        row_dtype = np.int32 if len(df) < np.iinfo(np.int32).max else np.int64
+        self.question_pools = {key: rng.permutation(rows).astype(row_dtype) for key, rows in groups}
+    
+    def _extend_question_pools(self, new_rows: pd.DataFrame, offset: int):
+        """Add newly ingested rows to the existing pools"""
+        additions = {}
+        rows = zip(
+            range(offset, offset + len(new_rows)),
+            new_rows['Category'].tolist(),
+            new_rows['Difficulty'].tolist()
+        )
+        for row_id, category, difficulty in rows:
+            for key in ((None, None), (category, difficulty), (category, None), (None, difficulty)):
+                additions.setdefault(key, []).append(row_id)
+        
+        # Sampling shuffles on draw, so appending keeps draws uniform
+        for key, row_ids in additions.items():
+            pool = self.question_pools.get(key, np.zeros(0, dtype=np.int64))
+            self.question_pools[key] = np.concatenate([pool, np.asarray(row_ids, dtype=pool.dtype)])
+    
+    def _get_bucket_index(self) -> Dict[Tuple[Optional[str], Optional[str]], np.ndarray]:
+        """Row pools per bucket, built on first use for artifacts saved without them"""
+        if self.question_pools is None:
+            self.build_question_pools()
+        return self.question_pools
+    
+    @staticmethod
+    def _iter_random_permutation(n: int, rng):
+        """Lazily yield a random permutation of range(n) (sparse Fisher-Yates)
+        
+        Only touched positions are stored, so taking k items costs O(k).
+        """
+        swapped = {}
+        for i in range(n):
+            j = int(rng.integers(i, n))
+            value = swapped.get(j, j)
+            swapped[j] = swapped.get(i, i)
+            yield value
+    
+    def duplicate_key(self, row: int):
+        """Near-duplicate cluster of a row (its question text for rows without a cluster)"""
+        if self.duplicate_cluster_ids is not None and row < len(self.duplicate_cluster_ids):
+            return int(self.duplicate_cluster_ids[row])
+        return self.questions_df['Question'].iat[row]
+    
+    def _take_new_clusters(self, rows, limit: int, taken_clusters: set) -> np.ndarray:
+        """First rows (up to limit) whose cluster is not taken yet; their clusters become taken"""
+        picked = []
+        for row in rows:
+            key = self.duplicate_key(row)
+            if key in taken_clusters:
+                continue
+            taken_clusters.add(key)
+            picked.append(row)
+            if len(picked) >= limit:
+                break
+        return np.asarray(picked, dtype=np.int64)
+    
+    def sample_bucket_rows(self, category=None, difficulty=None, limit=10, rng=None,
+                           taken_clusters: Optional[set] = None) -> np.ndarray:
+        """Randomly draw up to limit row positions from a bucket, skipping excluded rows
+        
+        With taken_clusters (a set shared across draws) rows from a
+        near-duplicate cluster already in it are skipped and do not count
+        toward limit; the clusters of drawn rows are added to it.
+        """
+        bucket = self._get_bucket_index().get((category or None, difficulty or None))
+        if bucket is None or limit <= 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        rng = rng if rng is not None else np.random.default_rng()
+        exclude_mask = self.exclude_mask
+        
+        # Taking most of the bucket: a full vectorized shuffle is cheaper
+        if limit >= len(bucket) // 4:
+            rows = rng.permutation(bucket).astype(np.int64)
+            if exclude_mask is not None:
+                in_mask = rows < len(exclude_mask)
+                rows = rows[~(in_mask & exclude_mask[np.where(in_mask, rows, 0)])]
+            if taken_clusters is not None:
+                return self._take_new_clusters(rows, limit, taken_clusters)
+            return rows[:limit]
+        
+        picked = []
+        for position in self._iter_random_permutation(len(bucket), rng):
+            row = bucket[position]
+            if exclude_mask is not None and row < len(exclude_mask) and exclude_mask[row]:
+                continue
+            if taken_clusters is not None:
+                key = self.duplicate_key(row)
+                if key in taken_clusters:
+                    continue
+                taken_clusters.add(key)
+            picked.append(row)
+            if len(picked) >= limit:
+                break
+        
+        return np.asarray(picked, dtype=np.int64)
+    
+    def sample_weighted_bucket_rows(self, buckets, limit: int, rng=None,
+                                    taken_clusters: Optional[set] = None) -> np.ndarray:
+        """Draw up to limit rows spread over weighted (category, difficulty, weight) buckets
+        
+        The limit is apportioned by weight (largest remainder) and the draws
+        are interleaved so any prefix of the result keeps the same mix.
+        taken_clusters is passed on to sample_bucket_rows.
+        """
+        if not buckets or limit <= 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        weights = np.asarray([weight for _, _, weight in buckets], dtype=float)
+        weights = weights / weights.sum() if weights.sum() > 0 else np.full(len(buckets), 1.0 / len(buckets))
+        quotas = np.floor(weights * limit).astype(int)
+        remainder_order = np.argsort(-(weights * limit - quotas), kind='stable')
+        quotas[remainder_order[:limit - quotas.sum()]] += 1
+        
+        drawn = []
+        keys = []
+        for (category, difficulty, _), quota in zip(buckets, quotas):
+            rows = self.sample_bucket_rows(category, difficulty, int(quota), rng, taken_clusters)
+            drawn.append(rows)
+            # Evenly spaced positions per bucket give a proportional interleave
+            keys.append((np.arange(len(rows)) + 0.5) / max(quota, 1))
+        
+        rows = np.concatenate(drawn)
+        return rows[np.argsort(np.concatenate(keys), kind='stable')]
+    
+    def get_questions_by_filters(self, category=None, difficulty=None, limit=10, rng=None):
+        """Get questions filtered by various criteria"""
+        # Draw from the prebuilt pool with a partial shuffle, O(limit)
+        rows = self.sample_bucket_rows(category, difficulty, limit or len(self.questions_df), rng)
+        filtered_df = self.questions_df.iloc[rows].reset_index(drop=True)
+        if 'Answer' not in filtered_df.columns:
+            filtered_df['Answer'] = pd.Series(self.get_answers(rows), dtype=filtered_df['Question'].dtype)
         
         return filtered_df[['Question Number', 'Question', 'Answer', 'Category', 'Difficulty']]
     
@@ -146,7 +1045,7 @@ class SimpleQuestionRecommender:
             recommendations.append({
                 'question_number': self.questions_df.iloc[idx]['Question Number'],
                 'question': self.questions_df.iloc[idx]['Question'],
-                'answer': self.questions_df.iloc[idx]['Answer'],
+                'answer': self.get_answers([idx])[0],
                 'category': self.questions_df.iloc[idx]['Category'],
                 'difficulty': self.questions_df.iloc[idx]['Difficulty'],
                 'similarity_score': similarities[idx]
@@ -154,6 +1053,77 @@ class SimpleQuestionRecommender:
         
         return recommendations
     
+    def recommend_questions_by_similarity_batch(self, queries: List[str], n_recommendations: int = 5,
+                                                chunk_size: int = 256) -> List[List[Dict[str, Any]]]:
+        """Recommend questions similar to each query in a single batched pass
+        
+        All queries are vectorized with one transform call and scored with one
+        sparse matrix product per chunk, so memory stays bounded at
+        chunk_size x total_questions similarity scores.
+        """
+        if self.question_vectors is None:
+            raise ValueError("Questions not loaded. Please load questions first.")
+        
+        if not queries:
+            return []
+        
+        # Clean and vectorize all queries at once
+        cleaned_queries = [self._simple_text_cleaning(q) for q in queries]
+        query_vectors = self.tfidf_vectorizer.transform(cleaned_queries)
+        
+        # TF-IDF rows are L2-normalized, so the dot product is the cosine similarity
+        question_vectors_t = self.question_vectors.T.tocsc()
+        n_questions = self.question_vectors.shape[0]
+        k = max(0, min(n_recommendations, n_questions))
+        
+        results = []
+        for start in range(0, query_vectors.shape[0], chunk_size):
+            chunk = query_vectors[start:start + chunk_size]
+            similarities = (chunk @ question_vectors_t).toarray()
+            
+            if k == 0:
+                results.extend([] for _ in range(similarities.shape[0]))
+                continue
+            
+            # Partial sort per row, then order only the top-k
+            if k < n_questions:
+                top_indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+            else:
+                top_indices = np.tile(np.arange(n_questions), (similarities.shape[0], 1))
+            top_scores = np.take_along_axis(similarities, top_indices, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+            top_indices = np.take_along_axis(top_indices, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+            
+            for row_indices, row_scores in zip(top_indices, top_scores):
+                results.append(self._build_recommendations(row_indices, 'similarity_score', row_scores))
+        
+        return results
+    
+    def _build_recommendations(self, indices, score_key: str, scores) -> List[Dict[str, Any]]:
+        """Build recommendation dicts for the given row positions"""
+        rows = self.questions_df.iloc[indices]
+        columns = zip(
+            rows['Question Number'].tolist(),
+            rows['Question'].tolist(),
+            self.get_answers(indices),
+            rows['Category'].tolist(),
+            rows['Difficulty'].tolist(),
+            np.asarray(scores, dtype=float).tolist()
+        )
+        
+        return [
+            {
+                'question_number': number,
+                'question': question,
+                'answer': answer,
+                'category': category,
+                'difficulty': difficulty,
+                score_key: score
+            }
+            for number, question, answer, category, difficulty, score in columns
+        ]
+    
     def recommend_questions_by_profile(self, candidate_profile, n_questions=10):
         """Recommend questions based on candidate profile"""
         if self.question_vectors is None:
@@ -164,33 +1134,103 @@ class SimpleQuestionRecommender:
         skill_level = candidate_profile.get('skill_level', 'Medium')
         
         # Filter questions based on preferences
-        filtered_df = self.questions_df.copy()
+        mask = np.ones(len(self.questions_df), dtype=bool)
         
         if preferred_category:
-            filtered_df = filtered_df[filtered_df['Category'] == preferred_category]
+            mask &= (self.questions_df['Category'] == preferred_category).to_numpy()
         
-        # Adjust difficulty based on skill level
-        if skill_level == 'Beginner':
-            filtered_df = filtered_df[filtered_df['Difficulty'] == 'Easy']
-        elif skill_level == 'Advanced':
-            filtered_df = filtered_df[filtered_df['Difficulty'] == 'Hard']
+        if self.exclude_mask is not None:
+            # Rows added after the mask was set are never excluded
+            mask[:len(self.exclude_mask)] &= ~self.exclude_mask
         
-        # Select random questions for variety
-        if len(filtered_df) > n_questions:
-            filtered_df = filtered_df.sample(n=n_questions, random_state=42)
+        candidate_rows = np.flatnonzero(mask)
+        if len(candidate_rows) == 0:
+            return []
         
-        recommendations = []
-        for _, row in filtered_df.iterrows():
-            recommendations.append({
-                'question_number': row['Question Number'],
-                'question': row['Question'],
-                'answer': row['Answer'],
-                'category': row['Category'],
-                'difficulty': row['Difficulty'],
-                'recommendation_score': 1.0  # Simple scoring
-            })
+        # Relevance: one sparse product of candidate rows against the profile vector
+        profile_vector = self._build_profile_vector(candidate_profile)
+        relevance = np.asarray(self.question_vectors[candidate_rows] @ profile_vector).ravel()
         
-        return recommendations
+        # Difficulty fit: full weight for the level's difficulty, less the further away
+        target_difficulty = self.SKILL_LEVEL_DIFFICULTY.get(skill_level, 'Medium')
+        distance = np.abs(self._difficulty_ranks(candidate_rows) - self.DIFFICULTY_ORDER[target_difficulty])
+        distance = np.nan_to_num(distance, nan=1).astype(int)
+        difficulty_weight = np.asarray(self.DIFFICULTY_FIT_WEIGHTS)[np.minimum(distance, 2)]
+        
+        # Small seeded jitter keeps ties (e.g. an empty profile) varied but reproducible
+        jitter = np.random.default_rng(42).random(len(candidate_rows)) * 1e-6
+        scores = (self.BASE_PROFILE_SCORE + relevance) * difficulty_weight + jitter
+        
+        k = min(n_questions, len(candidate_rows))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        
+        return self._build_recommendations(candidate_rows[top], 'recommendation_score', np.round(scores[top], 6))
+    
+    def _difficulty_ranks(self, rows: np.ndarray) -> np.ndarray:
+        """Difficulty order (Easy=0 .. Hard=2, NaN if unknown) for the given rows"""
+        difficulty = self.questions_df['Difficulty']
+        if isinstance(difficulty.dtype, pd.CategoricalDtype):
+            # Rank each category once, then look ranks up by integer code (-1 = missing)
+            rank_by_code = np.array(
+                [self.DIFFICULTY_ORDER.get(c, np.nan) for c in difficulty.cat.categories] + [np.nan]
+            )
+            return rank_by_code[difficulty.cat.codes.to_numpy()[rows]]
+        return difficulty.iloc[rows].map(self.DIFFICULTY_ORDER).to_numpy(dtype=float)
+    
+    def _build_profile_vector(self, candidate_profile: Dict[str, Any]) -> np.ndarray:
+        """Build a normalized TF-IDF-space vector describing a candidate
+        
+        Combines free text from skills, tech stack and weak areas with the
+        centroids of the preferred category and of weak areas that name a
+        category. Returns a zero vector when the profile says nothing.
+        """
+        if self.category_centroids is None:
+            self._compute_category_centroids()
+        
+        def as_list(value):
+            if not value:
+                return []
+            if isinstance(value, str):
+                return [part.strip() for part in value.split(',') if part.strip()]
+            return [str(part) for part in value]
+        
+        skills = as_list(candidate_profile.get('skills'))
+        techstack = as_list(candidate_profile.get('techstack', candidate_profile.get('tech_stack')))
+        weak_areas = as_list(candidate_profile.get('weak_areas'))
+        
+        profile_vector = np.zeros(self.question_vectors.shape[1])
+        
+        profile_text = self._simple_text_cleaning(' '.join(skills + techstack + weak_areas))
+        if profile_text:
+            profile_vector += self.tfidf_vectorizer.transform([profile_text]).toarray()[0]
+        
+        preferred_category = candidate_profile.get('preferred_category')
+        if preferred_category in self.centroid_index:
+            profile_vector += self.category_centroids[self.centroid_index[preferred_category]]
+        
+        # Past weak areas get extra weight so practice targets them
+        for area in weak_areas:
+            if area in self.centroid_index:
+                profile_vector += 2.0 * self.category_centroids[self.centroid_index[area]]
+        
+        norm = np.linalg.norm(profile_vector)
+        return profile_vector / norm if norm > 0 else profile_vector
+    
+    def _compute_category_centroids(self):
+        """Precompute the normalized mean TF-IDF vector of every category"""
+        categories = self.questions_df['Category'].astype(str)
+        codes, names = pd.factorize(categories)
+        
+        # Sparse one-hot (category x question) matrix turns all sums into one product
+        membership = sp.csr_matrix(
+            (np.ones(len(codes)), (codes, np.arange(len(codes)))),
+            shape=(len(names), len(codes))
+        )
+        sums = np.asarray((membership @ self.question_vectors).todense())
+        
+        self.category_centroids = self._normalize_rows(sums)
+        self.centroid_index = {name: i for i, name in enumerate(names)}
     
     def get_all_categories(self):
         """Get list of all available categories"""
@@ -206,12 +1246,34 @@ class SimpleQuestionRecommender:
     
     def save_model(self, file_path: str):
         """Save trained models using pickle"""
+        # Answers go to a block-compressed file that is only read when answers are requested
+        answers_path = os.path.splitext(file_path)[0] + '_answers.bin'
+        AnswerStore.write(answers_path, self.get_answers(np.arange(len(self.questions_df))))
+        
         model_state = {
-            'questions_df': self.questions_df,
+            'questions_df': self._compact_questions_frame(self.questions_df.drop(columns=['Answer'], errors='ignore')),
+            'answer_store_file': os.path.basename(answers_path),
             'tfidf_vectorizer': self.tfidf_vectorizer,
-            'question_vectors': self.question_vectors
+            'question_vectors': self.question_vectors,
+            'category_centroids': self.category_centroids,
+            'centroid_index': self.centroid_index,
+            'question_pools': self.question_pools,
+            'answer_vectors': self.answer_vectors,
+            'duplicate_cluster_ids': self.duplicate_cluster_ids,
+            'topic_ids': self.topic_ids,
+            'topic_centroids': self.topic_centroids
         }
         
+        # The dense LSA matrix goes to a separate .npy so it can be memory-mapped on load
+        if self.lsa_svd is not None and self.semantic_embeddings is not None:
+            embeddings_path = os.path.splitext(file_path)[0] + '_lsa.npy'
+            # The loaded matrix may be mapped from this very file, so write a copy and swap it in
+            tmp_path = os.path.splitext(file_path)[0] + '_lsa.tmp.npy'
+            np.save(tmp_path, np.asarray(self.semantic_embeddings))
+            os.replace(tmp_path, embeddings_path)
+            model_state['lsa_svd'] = self.lsa_svd
+            model_state['semantic_embeddings_file'] = os.path.basename(embeddings_path)
+        
         with open(file_path, 'wb') as f:
             pickle.dump(model_state, f)
         
@@ -222,12 +1284,51 @@ class SimpleQuestionRecommender:
         with open(file_path, 'rb') as f:
             model_state = pickle.load(f)
         
-        self.questions_df = model_state['questions_df']
+        self.questions_df = self._compact_questions_frame(model_state['questions_df'])
+        # Older artifacts keep answers in the table
+        if model_state.get('answer_store_file'):
+            self.answer_store = AnswerStore(os.path.join(os.path.dirname(file_path), model_state['answer_store_file']))
         self.tfidf_vectorizer = model_state['tfidf_vectorizer']
         self.question_vectors = model_state['question_vectors']
+        # Older artifacts have no centroids; they are computed on first profile request
+        self.category_centroids = model_state.get('category_centroids')
+        self.centroid_index = model_state.get('centroid_index', {})
+        # Older artifacts have no pools; they are built on first draw
+        self.question_pools = model_state.get('question_pools')
+        # The inverted term index is derived from the answer vectors on load
+        self.answer_vectors = model_state.get('answer_vectors')
+        self.duplicate_cluster_ids = model_state.get('duplicate_cluster_ids')
+        self.topic_ids = model_state.get('topic_ids')
+        self.topic_centroids = model_state.get('topic_centroids')
+        if self.answer_vectors is not None:
+            self._build_answer_term_index()
+        
+        # Memory-map the LSA embeddings so only the pages that are read get loaded
+        self.lsa_svd = model_state.get('lsa_svd')
+        self.semantic_embeddings = None
+        if self.lsa_svd is not None:
+            embeddings_path = os.path.join(os.path.dirname(file_path), model_state['semantic_embeddings_file'])
+            if os.path.exists(embeddings_path):
+                self.semantic_embeddings = np.load(embeddings_path, mmap_mode='r')
         
         # Model loaded successfully
     
+    def estimate_memory_bytes(self) -> int:
+        """Approximate resident size of the loaded index (memory-mapped arrays excluded)"""
+        total = 0
+        if self.questions_df is not None:
+            total += int(self.questions_df.memory_usage(deep=True).sum())
+        for matrix in (self.question_vectors, self.answer_vectors):
+            if matrix is not None:
+                total += matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+        for array in (self.semantic_embeddings, self.category_centroids, self.answer_term_index,
+                      self.duplicate_cluster_ids, self.topic_ids, self.topic_centroids):
+            if array is not None and not isinstance(array, np.memmap):
+                total += array.nbytes
+        if self.question_pools is not None:
+            total += sum(pool.nbytes for pool in self.question_pools.values())
+        return total
+    
     def get_model_summary(self) -> Dict[str, Any]:
         """Get summary of the question recommendation system"""
         if self.questions_df is None:
@@ -237,7 +1338,97 @@ class SimpleQuestionRecommender:
             'total_questions': len(self.questions_df),
             'categories': self.questions_df['Category'].value_counts().to_dict(),
             'difficulties': self.questions_df['Difficulty'].value_counts().to_dict(),
-            'tfidf_features': self.question_vectors.shape[1] if self.question_vectors is not None else 0
+            'tfidf_features': self.question_vectors.shape[1] if self.question_vectors is not None else 0,
+            'table_memory_bytes': int(self.questions_df.memory_usage(deep=True).sum())
         }
+        if self.answer_store is not None:
+            summary['answer_store'] = self.answer_store.get_stats()
         
         return summary
+
+
+# ============================================================================
+# CLI Interface for Question Recommendation
+# ============================================================================
+
+def main():
+    """Main function - reads input from stdin and outputs to stdout
+    
+    Accepts {"query": "...", "n": 5} for a single query,
+    {"queries": ["...", "..."], "n": 5} for a batched similarity search, or
+    {"add_questions": [{"Question": ..., "Answer": ..., "Category": ...,
+    "Difficulty": ...}]} to ingest new questions into the saved model.
+    """
+    import sys
+    import os
+    import json
+    import contextlib
+    
+    try:
+        input_data = sys.stdin.read()
+        data = json.loads(input_data)
+        
+        queries = data.get('queries')
+        query = data.get('query')
+        new_questions = data.get('add_questions')
+        n = int(data.get('n', 5))
+        model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trained_models', 'question_recommender.pkl')
+        
+        if new_questions:
+            recommender = SimpleQuestionRecommender()
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"Model file not found: {model_path}")
+            recommender.load_model(model_path)
+            
+            # Keep stdout clean for the JSON result
+            with contextlib.redirect_stdout(sys.stderr):
+                added = recommender.add_questions(new_questions)
+                recommender.wait_for_refit()
+                recommender.save_model(model_path)
+            
+            result = {
+                'success': True,
+                'added': added,
+                'total_questions': len(recommender.questions_df)
+            }
+        elif not queries and not query:
+            result = {
+                'success': False,
+                'error': 'Query text is required',
+                'recommendations': []
+            }
+        else:
+            recommender = SimpleQuestionRecommender()
+            if not os.path.exists(model_path):
+                raise FileNotFoundError(f"Model file not found: {model_path}")
+            recommender.load_model(model_path)
+            
+            if queries:
+                recommendations = recommender.recommend_questions_by_similarity_batch(queries, n)
+            else:
+                recommendations = recommender.recommend_questions_by_similarity_batch([query], n)[0]
+            
+            result = {
+                'success': True,
+                'recommendations': recommendations
+            }
+        
+        print(json.dumps(result))
+        
+    except json.JSONDecodeError as e:
+        error_result = {
+            'success': False,
+            'error': f'Invalid JSON input: {str(e)}',
+            'recommendations': []
+        }
+        print(json.dumps(error_result))
+    except Exception as e:
+        error_result = {
+            'success': False,
+            'error': f'Unexpected error: {str(e)}',
+            'recommendations': []
+        }
+        print(json.dumps(error_result))
+
+if __name__ == '__main__':
+    main()
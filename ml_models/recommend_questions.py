@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+ML Question Recommendation Service - Entry point for /api/ml/recommend-questions
+Serves similarity, filter and profile recommendations from the global index
+or a company bank ("company" field), loaded on first use
+"""
+
+import sys
+import json
+import os
+
+# Add current directory to path so we can import our ML modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from question_banks import QuestionBankRegistry, normalize_bank_name
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'trained_models', 'question_recommender.pkl')
+
+SUPPORTED_MODES = ['similarity', 'semantic', 'filter', 'profile']
+
+
+def request_company(request):
+    """Company (or tenant) bank a request targets, None for the global bank"""
+    return request.get('company') or request.get('tenant')
+
+
+def frame_to_recommendations(questions_df):
+    """Convert a filtered questions frame into recommendation dicts"""
+    return [
+        {
+            'question_number': row['Question Number'],
+            'question': row['Question'],
+            'answer': row['Answer'],
+            'category': row['Category'],
+            'difficulty': row['Difficulty']
+        }
+        for row in questions_df.to_dict('records')
+    ]
+
+
+def handle_request(recommender, request):
+    """Serve a single recommendation request"""
+    mode = request.get('mode') or ('similarity' if request.get('query') else 'filter')
+    n = int(request.get('n') or 5)
+
+    if mode not in SUPPORTED_MODES:
+        return {
+            'success': False,
+            'error': f"Unknown mode '{mode}'. Expected one of: {', '.join(SUPPORTED_MODES)}",
+            'recommendations': []
+        }
+
+    if mode in ('similarity', 'semantic') and not request.get('query'):
+        return {
+            'success': False,
+            'error': f"Query text is required for {mode} mode",
+            'recommendations': []
+        }
+
+    if mode == 'similarity':
+        recommendations = recommender.recommend_questions_by_similarity_batch([request['query']], n)[0]
+    elif mode == 'semantic':
+        recommendations = recommender.recommend_questions_semantic(request['query'], n)
+    elif mode == 'filter':
+        questions_df = recommender.get_questions_by_filters(
+            category=request.get('category'),
+            difficulty=request.get('difficulty'),
+            limit=n
+        )
+        recommendations = frame_to_recommendations(questions_df)
+    else:
+        # Top-level preferred_category/skill_level fill in for the profile's own
+        profile = dict(request.get('profile') or {})
+        for key in ('preferred_category', 'skill_level'):
+            if request.get(key) and not profile.get(key):
+                profile[key] = request[key]
+        recommendations = recommender.recommend_questions_by_profile(profile, n)
+
+    return {
+        'success': True,
+        'mode': mode,
+        'recommendations': recommendations
+    }
+
+
+def handle_batch(banks, requests):
+    """Serve a list of requests, each against its company's bank
+
+    Similarity requests are grouped by (bank, n) and answered with one
+    batched sparse product per group; the others are served one by one.
+    """
+    results = [None] * len(requests)
+
+    similarity_groups = {}
+    for i, request in enumerate(requests):
+        if not isinstance(request, dict):
+            results[i] = {'success': False, 'error': 'Request must be a JSON object', 'recommendations': []}
+        elif (request.get('mode') or ('similarity' if request.get('query') else 'filter')) == 'similarity' and request.get('query'):
+            key = (normalize_bank_name(request_company(request)), int(request.get('n') or 5))
+            similarity_groups.setdefault(key, []).append(i)
+
+    for (company, n), indices in similarity_groups.items():
+        queries = [requests[i]['query'] for i in indices]
+        try:
+            batch = banks.get(company).recommend_questions_by_similarity_batch(queries, n)
+        except Exception as e:
+            for i in indices:
+                results[i] = {'success': False, 'error': str(e), 'recommendations': []}
+            continue
+        for i, recommendations in zip(indices, batch):
+            results[i] = {'success': True, 'mode': 'similarity', 'recommendations': recommendations}
+
+    for i, request in enumerate(requests):
+        if results[i] is None:
+            try:
+                results[i] = handle_request(banks.get(request_company(request)), request)
+            except Exception as e:
+                results[i] = {'success': False, 'error': str(e), 'recommendations': []}
+
+    return results
+
+
+def handle_payload(banks, payload):
+    """Serve a single request, a {"requests": [...]} batch or a {"stats": true} query"""
+    if isinstance(payload, list):
+        payload = {'requests': payload}
+
+    if payload.get('stats'):
+        return {
+            'success': True,
+            'stats': banks.get_stats()
+        }
+
+    if 'requests' in payload:
+        return {
+            'success': True,
+            'results': handle_batch(banks, payload['requests'] or [])
+        }
+
+    return handle_request(banks.get(request_company(payload)), payload)
+
+
+def run_worker(banks):
+    """Resident worker: one JSON payload per stdin line, one JSON result per stdout line
+
+    Company banks are loaded on first use and evicted by the registry's LRU,
+    so new banks become available without restarting the worker.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            result = handle_payload(banks, json.loads(line))
+        except json.JSONDecodeError as e:
+            result = {'success': False, 'error': f'Invalid JSON input: {str(e)}', 'recommendations': []}
+        except Exception as e:
+            result = {'success': False, 'error': f'Unexpected error: {str(e)}', 'recommendations': []}
+        print(json.dumps(result), flush=True)
+
+
+def main():
+    """Main function - reads input from stdin and outputs to stdout
+
+    One-shot (default): reads one JSON payload from stdin.
+    Worker (--worker): keeps loaded banks resident and serves JSON lines until EOF.
+    """
+    try:
+        if '--worker' in sys.argv[1:]:
+            run_worker(QuestionBankRegistry(MODEL_PATH))
+            return
+
+        input_data = sys.stdin.read()
+        payload = json.loads(input_data)
+
+        result = handle_payload(QuestionBankRegistry(MODEL_PATH), payload)
+
+        # Output to stdout (Next.js will read this)
+        print(json.dumps(result))
+
+    except json.JSONDecodeError as e:
+        error_result = {
+            'success': False,
+            'error': f'Invalid JSON input: {str(e)}',
+            'recommendations': []
+        }
+        print(json.dumps(error_result))
+
+    except Exception as e:
+        error_result = {
+            'success': False,
+            'error': f'Unexpected error: {str(e)}',
+            'recommendations': []
+        }
+        print(json.dumps(error_result))
+
+if __name__ == '__main__':
+    main()
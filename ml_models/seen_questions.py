@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Seen Question Store for ML Pipeline
+Tracks which questions each user has already been asked using packed bitsets
+"""
+
+import hashlib
+import os
+import re
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'user_data', 'seen_questions')
+
+
+class SeenQuestionStore:
+    """Per-user "seen" bitsets over question row ids
+
+    Each user is stored as one packed uint8 array (1 bit per question row),
+    so a bank of 1M questions costs ~125KB per user on disk and in memory.
+    Bits are row positions, so each bitset also records which bank it was
+    built against: (row count, digest of the rows' question hashes). A bank
+    whose first rows no longer match (retrained or reordered) resets the
+    bitset, while a bank that only gained rows keeps it.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None):
+        self.store_dir = Path(store_dir or DEFAULT_STORE_DIR)
+        self._bitsets: Dict[str, np.ndarray] = {}
+        self._banks: Dict[str, Optional[Tuple[int, str]]] = {}
+
+    def _user_path(self, user_id: str) -> Path:
+        """File path for a user's bitset (user id sanitized for the filesystem)"""
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', str(user_id))
+        return self.store_dir / f"{safe_id}.npz"
+
+    @staticmethod
+    def bank_digest(row_hashes: np.ndarray) -> str:
+        """Digest of per-row question hashes (see SimpleQuestionRecommender.get_question_row_hashes)"""
+        return hashlib.blake2b(np.ascontiguousarray(row_hashes, dtype=np.uint64).tobytes(), digest_size=16).hexdigest()
+
+    def _read_bitset(self, user_id: str) -> Tuple[np.ndarray, Optional[Tuple[int, str]]]:
+        """Read the persisted packed bitset for a user and its bank (empty, None if none)
+
+        Bitsets saved before banks were recorded (.npy) have no bank and are
+        taken to match the current one.
+        """
+        path = self._user_path(user_id)
+        try:
+            if path.exists():
+                with np.load(path) as data:
+                    bank = (int(data['bank_rows']), str(data['bank'])) if str(data['bank']) else None
+                    return data['bits'].astype(np.uint8, copy=False), bank
+            legacy_path = path.with_suffix('.npy')
+            if legacy_path.exists():
+                return np.load(legacy_path).astype(np.uint8, copy=False), None
+        except Exception:
+            pass
+        return np.zeros(0, dtype=np.uint8), None
+
+    @staticmethod
+    def _or_packed(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Bitwise OR of two packed bitsets of possibly different lengths"""
+        if len(left) < len(right):
+            left, right = right, left
+        merged = left.copy()
+        merged[:len(right)] |= right
+        return merged
+
+    def load(self, user_id: str) -> np.ndarray:
+        """Load a user's packed bitset into memory"""
+        if user_id not in self._bitsets:
+            self._bitsets[user_id], self._banks[user_id] = self._read_bitset(user_id)
+        return self._bitsets[user_id]
+
+    def _matches_bank(self, bank: Optional[Tuple[int, str]], row_hashes: np.ndarray) -> bool:
+        """Whether a recorded bank is a prefix of the bank with these row hashes"""
+        if bank is None:
+            return True
+        n_rows, digest = bank
+        return n_rows <= len(row_hashes) and self.bank_digest(row_hashes[:n_rows]) == digest
+
+    def use_bank(self, user_id: str, row_hashes: np.ndarray):
+        """Tie a user's bitset to the bank with these row hashes
+
+        A bitset recorded against a different bank is cleared, since its
+        bits point at other questions now.
+        """
+        self.load(user_id)
+        if not self._matches_bank(self._banks[user_id], row_hashes):
+            self._bitsets[user_id] = np.zeros(0, dtype=np.uint8)
+        self._banks[user_id] = (len(row_hashes), self.bank_digest(row_hashes))
+
+    def get_mask(self, user_id: str, n_questions: int, row_hashes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Get a boolean mask of length n_questions, True where already seen
+
+        With the bank's row hashes, bits recorded against another bank are
+        dropped first (see use_bank).
+        """
+        if row_hashes is not None:
+            self.use_bank(user_id, row_hashes)
+        packed = self.load(user_id)
+        mask = np.unpackbits(packed, count=min(len(packed) * 8, n_questions)).astype(bool)
+        if len(mask) < n_questions:
+            mask = np.concatenate([mask, np.zeros(n_questions - len(mask), dtype=bool)])
+        return mask
+
+    def mark_seen(self, user_id: str, row_ids: Iterable[int]):
+        """Mark question row ids as seen in memory (call save or merge to persist)"""
+        row_ids = np.asarray(list(row_ids), dtype=np.int64)
+        if len(row_ids) == 0:
+            return
+
+        packed = self.load(user_id)
+        needed_bytes = int(row_ids.max()) // 8 + 1
+        if len(packed) < needed_bytes:
+            packed = np.concatenate([packed, np.zeros(needed_bytes - len(packed), dtype=np.uint8)])
+
+        # Set bits MSB-first to match np.packbits/np.unpackbits ordering
+        np.bitwise_or.at(packed, row_ids // 8, (0x80 >> (row_ids % 8)).astype(np.uint8))
+        self._bitsets[user_id] = packed
+
+    def merge(self, user_id: str):
+        """Merge the in-memory session bitset with the persisted one and save
+
+        Reading the file again before writing keeps questions marked by other
+        sessions of the same user that finished in the meantime (unless they
+        were recorded against a different bank).
+        """
+        packed = self.load(user_id)
+        persisted, persisted_bank = self._read_bitset(user_id)
+        if persisted_bank == self._banks.get(user_id) or persisted_bank is None:
+            packed = self._or_packed(persisted, packed)
+        self._bitsets[user_id] = packed
+        self.save(user_id)
+
+    def save(self, user_id: str):
+        """Persist a user's bitset and its bank atomically"""
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        path = self._user_path(user_id)
+        tmp_path = path.with_suffix('.tmp.npz')
+        bank_rows, bank = self._banks.get(user_id) or (0, '')
+        np.savez(tmp_path, bits=self.load(user_id), bank_rows=np.int64(bank_rows), bank=np.asarray(bank))
+        os.replace(tmp_path, path)
+        path.with_suffix('.npy').unlink(missing_ok=True)
+
+    def reset(self, user_id: str):
+        """Forget everything a user has seen"""
+        self.load(user_id)
+        self._bitsets[user_id] = np.zeros(0, dtype=np.uint8)
+        self.save(user_id)
+
+    def seen_count(self, user_id: str) -> int:
+        """Number of questions a user has seen"""
+        return int(np.unpackbits(self.load(user_id)).sum())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Tech Stack Matcher for ML Pipeline
+Maps free-text tech stacks to weighted question categories
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# Technology term -> question category. Multi-word terms match as phrases,
+# and every term only matches on word boundaries ("go" does not match "mongodb").
+CATEGORY_MAPPING = {
+    # Frontend technologies
+    'javascript': 'Front-end',
+    'js': 'Front-end',
+    'react': 'Front-end',
+    'vue': 'Front-end',
+    'angular': 'Front-end',
+    'html': 'Front-end',
+    'css': 'Front-end',
+    'typescript': 'Front-end',
+    'ts': 'Front-end',
+    'jquery': 'Front-end',
+    'bootstrap': 'Front-end',
+    'tailwind': 'Front-end',
+    'sass': 'Front-end',
+    'scss': 'Front-end',
+    
+    # Backend technologies
+    'node': 'Back-end',
+    'express': 'Back-end',
+    'python': 'Languages and Frameworks',
+    'django': 'Back-end',
+    'flask': 'Back-end',
+    'fastapi': 'Back-end',
+    'java': 'Back-end',
+    'spring': 'Back-end',
+    'php': 'Back-end',
+    'laravel': 'Back-end',
+    'ruby': 'Back-end',
+    'rails': 'Back-end',
+    'go': 'Back-end',
+    'rust': 'Back-end',
+    'c#': 'Back-end',
+    '.net': 'Back-end',
+    
+    # Database technologies
+    'sql': 'Database and SQL',
+    'mysql': 'Database and SQL',
+    'postgresql': 'Database and SQL',
+    'mongodb': 'Database and SQL',
+    'redis': 'Database and SQL',
+    'sqlite': 'Database and SQL',
+    
+    # DevOps technologies
+    'docker': 'DevOps',
+    'kubernetes': 'DevOps',
+    'aws': 'DevOps',
+    'azure': 'DevOps',
+    'gcp': 'DevOps',
+    'jenkins': 'DevOps',
+    'git': 'Version Control',
+    'github': 'Version Control',
+    'gitlab': 'Version Control',
+    
+    # Data structures and algorithms
+    'data': 'Data Structures',
+    'algorithm': 'Algorithms',
+    'dsa': 'Data Structures',
+    'algorithms': 'Algorithms',
+    'machine learning': 'Machine Learning',
+    'deep learning': 'Machine Learning',
+    'tensorflow': 'Machine Learning',
+    'pytorch': 'Machine Learning',
+    'scikit-learn': 'Machine Learning',
+    'data analysis': 'Data Engineering',
+    'statistics': 'Data Engineering',
+    'jupyter': 'Data Engineering',
+    'apache spark': 'Data Engineering',
+    'react native': 'Front-end',
+    'flutter': 'Front-end',
+    'swift': 'Front-end',
+    'kotlin': 'Front-end',
+    'ios': 'Front-end',
+    'android': 'Front-end',
+    'figma': 'Front-end',
+    'sketch': 'Front-end',
+    'adobe xd': 'Front-end',
+    'prototyping': 'Front-end',
+    'user research': 'Front-end',
+    'wireframing': 'Front-end',
+    'design systems': 'Front-end',
+    'agile': 'Software Testing',
+    'scrum': 'Software Testing',
+    'team management': 'Software Testing',
+    'project management': 'Software Testing',
+    'api testing': 'Software Testing',
+    'automation': 'Software Testing',
+    'manual testing': 'Software Testing',
+    'linux': 'DevOps',
+    'windows': 'DevOps',
+    'shell scripting': 'DevOps',
+    'ci/cd': 'DevOps',
+    'terraform': 'DevOps',
+    'infrastructure as code': 'DevOps',
+    'networking': 'Networking',
+    'network security': 'Security',
+    'application security': 'Security',
+    'penetration testing': 'Security',
+    'oracle': 'Database and SQL',
+    'database design': 'Database and SQL',
+    'performance tuning': 'Database and SQL',
+    'backup and recovery': 'Database and SQL',
+    'analytics': 'Data Engineering',
+    
+    # Security
+    'security': 'Security',
+    'oauth': 'Security',
+    'jwt': 'Security',
+    
+    # Testing
+    'testing': 'Software Testing',
+    'jest': 'Software Testing',
+    'cypress': 'Software Testing',
+    'selenium': 'Software Testing',
+    
+    # System Design
+    'system': 'System Design',
+    'architecture': 'System Design',
+    'microservices': 'System Design',
+    
+    # Web Development (general)
+    'web': 'Web Development',
+    'http': 'Web Development',
+    'https': 'Web Development',
+    'rest': 'Web Development',
+    'api': 'Web Development'
+}
+
+
+# Role-specific priority rules: (role keyword, technologies that trigger it, category).
+# When the role and one of the technologies match, that category dominates.
+ROLE_RULES = [
+    ('machine learning', ['python', 'machine learning', 'deep learning'], 'Machine Learning'),
+    ('data scientist', ['python', 'machine learning', 'data analysis'], 'Machine Learning'),
+    ('data engineer', ['python', 'data', 'apache spark'], 'Data Engineering'),
+    ('devops', ['docker', 'kubernetes', 'aws'], 'DevOps'),
+    ('security', ['security', 'oauth', 'jwt'], 'Security'),
+    ('qa', ['testing', 'jest', 'cypress'], 'Software Testing'),
+    ('testing', ['testing', 'jest', 'cypress'], 'Software Testing'),
+    ('database', ['sql', 'mysql', 'postgresql'], 'Database and SQL'),
+]
+
+DEFAULT_CATEGORY = 'General Programming'
+
+# Tokens: words with optional trailing '#'/'+' (c#, c++) or dotted names (.net)
+TOKEN_PATTERN = re.compile(r'\.?[a-z0-9][a-z0-9#+]*')
+
+# Common spellings of a term, applied to input tokens before matching
+TOKEN_ALIASES = {
+    'golang': 'go',
+    'reactjs': 'react',
+    'nodejs': 'node',
+    'apis': 'api',
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase technology tokens"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class TechStackMatcher:
+    """Phrase automaton over technology terms with word-boundary semantics
+
+    Terms are compiled once into a token trie. Matching walks the input
+    tokens left to right and takes the longest term starting at each
+    position, so "react native" wins over "react" and the scan stays
+    linear in the number of tokens.
+    """
+
+    def __init__(self, category_mapping: Dict[str, str] = None, role_rules: List[Tuple] = None,
+                 aliases: Dict[str, str] = None):
+        self.category_mapping = category_mapping or CATEGORY_MAPPING
+        self.role_rules = role_rules if role_rules is not None else ROLE_RULES
+        self.aliases = aliases if aliases is not None else TOKEN_ALIASES
+        self.trie = {}
+        self.max_term_length = 0
+        for term, category in self.category_mapping.items():
+            self._add_term(term, category)
+        # Every token that occurs in some term
+        self.vocabulary = {token for term in self.category_mapping for token in tokenize(term)}
+
+    def normalize_tokens(self, text: str) -> List[str]:
+        """Input tokens with spelling variants mapped onto the term vocabulary
+
+        Tokens that are terms themselves (.net, js, microservices) are kept.
+        Otherwise aliases apply (golang -> go), a leading '.' is dropped
+        (next.js -> next js), a 'js' suffix is split off (vuejs -> vue js)
+        and a plural 's' is dropped when the singular is a term (apis -> api).
+        """
+        tokens = []
+        for token in tokenize(text):
+            if token in self.vocabulary:
+                tokens.append(token)
+                continue
+            token = self.aliases.get(token, token)
+            if token.startswith('.'):
+                token = token[1:]
+            if token.endswith('js') and len(token) > 2 and token not in self.vocabulary:
+                tokens.extend([self.aliases.get(token[:-2], token[:-2]), 'js'])
+            elif token.endswith('s') and token not in self.vocabulary and token[:-1] in self.vocabulary:
+                tokens.append(token[:-1])
+            else:
+                tokens.append(token)
+        return tokens
+
+    def _add_term(self, term: str, category: str):
+        """Insert a term into the token trie"""
+        tokens = tokenize(term)
+        if not tokens:
+            return
+        node = self.trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[None] = (term, category)
+        self.max_term_length = max(self.max_term_length, len(tokens))
+
+    def find_terms(self, text: str) -> List[Tuple[str, str]]:
+        """Find (term, category) matches in order, longest match first"""
+        tokens = self.normalize_tokens(text)
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node = self.trie
+            best = None
+            best_end = i
+            j = i
+            while j < len(tokens) and j - i < self.max_term_length and tokens[j] in node:
+                node = node[tokens[j]]
+                j += 1
+                if None in node:
+                    best = node[None]
+                    best_end = j
+            if best:
+                matches.append(best)
+                i = best_end
+            else:
+                i += 1
+        return matches
+
+    def match_categories(self, techstack: str, role: Optional[str] = None) -> Dict[str, float]:
+        """Weighted category distribution for a tech stack (weights sum to 1)
+
+        Each matched technology adds one vote to its category; categories
+        are ordered by weight, ties by first appearance in the stack. A
+        matching role rule makes its category the top one.
+        """
+        matches = self.find_terms(techstack)
+        votes = {}
+        for term, category in matches:
+            votes[category] = votes.get(category, 0) + 1
+
+        if role:
+            role_lower = role.lower()
+            present = {term for term, _ in matches} | set(self.normalize_tokens(techstack))
+            for role_keyword, triggers, category in self.role_rules:
+                if role_keyword in role_lower and any(t in present for t in triggers):
+                    votes[category] = max(votes.values(), default=0) + 1
+                    break
+
+        if not votes:
+            return {}
+
+        total = sum(votes.values())
+        first_seen = {category: i for i, (_, category) in reversed(list(enumerate(matches)))}
+        ordered = sorted(votes.items(), key=lambda item: (-item[1], first_seen.get(item[0], -1)))
+        return {category: count / total for category, count in ordered}
+
+    def map_to_category(self, techstack: str, role: Optional[str] = None) -> str:
+        """Single most likely category for a tech stack"""
+        distribution = self.match_categories(techstack, role)
+        return next(iter(distribution), DEFAULT_CATEGORY)
+
+
+_default_matcher = None
+
+
+def get_default_matcher() -> TechStackMatcher:
+    """Shared matcher compiled from CATEGORY_MAPPING on first use"""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = TechStackMatcher()
+    return _default_matcher
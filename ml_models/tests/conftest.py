@@ -0,0 +1,49 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# ML modules import each other as top-level modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interview_predictor import build_feature_vector
+from question_recommender import SimpleQuestionRecommender
+
+
+@pytest.fixture
+def make_recommender(tmp_path):
+    """Build a small trained recommender from (question, answer, category, difficulty) tuples"""
+    def build(rows, duplicate_clusters=False):
+        questions_path = tmp_path / 'questions.csv'
+        pd.DataFrame(
+            [(number, *row) for number, row in enumerate(rows, start=1)],
+            columns=['Question Number', 'Question', 'Answer', 'Category', 'Difficulty']
+        ).to_csv(questions_path, index=False)
+
+        recommender = SimpleQuestionRecommender()
+        assert recommender.load_and_preprocess_questions(str(questions_path))
+        recommender.train_tfidf_model()
+        if duplicate_clusters:
+            recommender.build_duplicate_clusters()
+        recommender.build_question_pools(seed=0)
+        return recommender
+
+    return build
+
+
+@pytest.fixture(scope='session')
+def make_outcome_data():
+    """Synthetic survey rows whose interview verdict follows the speech scores"""
+    def build(n_rows=600, seed=0):
+        rng = np.random.default_rng(seed)
+        names = build_feature_vector({}, {}, {}).columns
+        X = pd.DataFrame({name: rng.integers(0, 6, n_rows) for name in names})
+        X['Age'] = rng.integers(20, 40, n_rows)
+        X['Experienced candidate - (Experience in months)'] = rng.integers(0, 60, n_rows)
+        logit = (X.filter(like='Confidence').sum(axis=1) - 7) * 0.4 + 0.02 * X['Experienced candidate - (Experience in months)']
+        y = pd.Series((rng.random(n_rows) < 1 / (1 + np.exp(-logit))).astype(int), name='Interview Verdict')
+        return X, y
+
+    return build
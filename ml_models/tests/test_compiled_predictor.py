@@ -0,0 +1,115 @@
+import contextlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from compiled_predictor import (
+    CompiledInterviewPredictor, check_parity, compiled_paths_path, export_compiled_predictor, sample_feature_rows
+)
+from interview_predictor import SimpleInterviewPredictor
+
+
+@pytest.fixture(scope='module')
+def predictor(make_outcome_data):
+    X, y = make_outcome_data()
+    predictor = SimpleInterviewPredictor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(X, y, n_jobs=1)
+    return predictor
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_compiled_probabilities_match_sklearn(predictor, tmp_path, compact):
+    export_path = str(tmp_path / 'predictor_compiled.npz')
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_compiled_predictor(predictor, export_path, compact=compact)
+    compiled = CompiledInterviewPredictor.load(export_path)
+
+    report = check_parity(predictor, compiled, sample_feature_rows(compiled, n_rows=2000, seed=1))
+
+    assert set(report) == set(predictor.models)
+    for name, result in report.items():
+        assert result['passed'], (name, result['max_abs_diff'])
+
+
+def test_compiled_predict_picks_the_same_class(predictor, tmp_path):
+    export_path = str(tmp_path / 'predictor_compiled.npz')
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_compiled_predictor(predictor, export_path)
+    compiled = CompiledInterviewPredictor.load(export_path)
+    X = sample_feature_rows(compiled, n_rows=500, seed=2)
+
+    for name, model in predictor.models.items():
+        labels, _ = compiled.predict(X, name)
+        np.testing.assert_array_equal(labels, model.predict(predictor.scaler.transform(X)))
+
+
+def test_exported_path_tables_explain_like_a_fresh_build(predictor, tmp_path):
+    export_path = str(tmp_path / 'predictor_compiled.npz')
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_compiled_predictor(predictor, export_path)
+    compiled = CompiledInterviewPredictor.load(export_path)
+    # Exports without a path file build the tables on first use
+    older = CompiledInterviewPredictor(
+        dict(compiled.arrays),
+        {'feature_names': compiled.feature_names, 'best_model_name': compiled.best_model_name,
+         'models': compiled.model_info}
+    )
+    X = sample_feature_rows(compiled, n_rows=20, seed=3)
+
+    explanation, expected = compiled.explain(X, 'Random Forest'), older.explain(X, 'Random Forest')
+
+    assert explanation['base_value'] == expected['base_value']
+    np.testing.assert_array_equal(explanation['contributions'], expected['contributions'])
+    total = explanation['base_value'] + explanation['contributions'].sum(axis=1)
+    np.testing.assert_allclose(total, compiled.predict_proba(X, 'Random Forest')[:, 1], atol=1e-9)
+
+
+def test_load_leaves_the_path_tables_for_the_first_explanation(predictor, tmp_path, monkeypatch):
+    export_path = str(tmp_path / 'predictor_compiled.npz')
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_compiled_predictor(predictor, export_path)
+    opened = []
+    np_load = np.load
+    monkeypatch.setattr(np, 'load', lambda path, *args, **kwargs: opened.append(path) or np_load(path, *args, **kwargs))
+
+    compiled = CompiledInterviewPredictor.load(export_path)
+    compiled.predict(sample_feature_rows(compiled, n_rows=10, seed=4))
+
+    assert opened == [export_path]
+    assert not any('__path_' in name for name in compiled.arrays)
+
+    compiled.explain(sample_feature_rows(compiled, n_rows=1, seed=4), 'Random Forest')
+
+    assert opened == [export_path, compiled_paths_path(export_path)]
+
+
+def test_stale_path_tables_are_rebuilt(predictor, tmp_path):
+    export_path = str(tmp_path / 'predictor_compiled.npz')
+    with contextlib.redirect_stdout(io.StringIO()):
+        export_compiled_predictor(predictor, export_path)
+        # Path file of a differently packed forest, as after a re-export that kept an old file around
+        export_compiled_predictor(predictor, str(tmp_path / 'other_compiled.npz'), compact=False)
+    os.replace(compiled_paths_path(str(tmp_path / 'other_compiled.npz')), compiled_paths_path(export_path))
+    compiled = CompiledInterviewPredictor.load(export_path)
+    X = sample_feature_rows(compiled, n_rows=5, seed=5)
+
+    explanation = compiled.explain(X, 'Random Forest')
+
+    total = explanation['base_value'] + explanation['contributions'].sum(axis=1)
+    np.testing.assert_allclose(total, compiled.predict_proba(X, 'Random Forest')[:, 1], atol=1e-9)
+
+
+def test_float32_rows_score_the_same_on_both_paths(predictor):
+    compiled = CompiledInterviewPredictor.from_predictor(predictor)
+    X = sample_feature_rows(compiled, n_rows=500, seed=6).astype(np.float32)
+    # Fractional values, as the request layout writes them into its float32 rows
+    X[:, 0] += np.float32(0.37)
+
+    for name in predictor.models:
+        _, sklearn_proba = predictor.predict(pd.DataFrame(X, columns=predictor.feature_names), name)
+        _, compiled_proba = compiled.predict(X, name)
+        np.testing.assert_allclose(sklearn_proba, compiled_proba, rtol=0, atol=1e-12)
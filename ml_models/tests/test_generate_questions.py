@@ -0,0 +1,54 @@
+import numpy as np
+
+from generate_questions import draw_planned_questions, select_diverse_questions
+
+NEAR_DUPLICATES = [
+    ('Explain the virtual DOM in React.', 'React keeps a virtual DOM and diffs it against the real DOM.'),
+    ('Explain how the virtual DOM works in React.', 'React diffs a virtual DOM against the real DOM.'),
+    ('What is the virtual DOM in React?', 'A virtual DOM copy that React diffs against the real DOM.'),
+]
+DISTINCT = [
+    ('What is a database index?', 'An index speeds up lookups on a table column.'),
+    ('How does TCP handle packet loss?', 'TCP retransmits segments that are not acknowledged.'),
+    ('What is a mutex?', 'A lock that allows one thread into a critical section.'),
+]
+
+
+def _bank(make_recommender):
+    rows = [(question, answer, 'Front-end', 'Medium') for question, answer in NEAR_DUPLICATES + DISTINCT]
+    return make_recommender(rows)
+
+
+def test_diverse_selection_skips_near_duplicate_candidates(make_recommender):
+    recommender = _bank(make_recommender)
+    candidates = np.arange(6)
+
+    picked = select_diverse_questions(recommender, candidates, 3)
+
+    # Random mode takes the pool prefix: all three rewordings of one question
+    assert list(candidates[:3]) == [0, 1, 2]
+    assert len(set(picked.tolist()) & {0, 1, 2}) == 1
+    assert picked[0] == 0
+    assert sorted(picked.tolist()) != [0, 1, 2]
+
+
+def test_diverse_selection_returns_small_pools_unchanged(make_recommender):
+    recommender = _bank(make_recommender)
+
+    picked = select_diverse_questions(recommender, [4, 1], 3)
+
+    assert picked.tolist() == [4, 1]
+
+
+def test_planned_draw_takes_one_question_per_cluster(make_recommender):
+    rows = [(question, answer, 'Front-end', 'Medium') for question, answer in NEAR_DUPLICATES + DISTINCT]
+    recommender = make_recommender(rows, duplicate_clusters=True)
+    plan = [{'kind': 'fill', 'category': 'Front-end', 'difficulty': 'Medium'}]
+
+    for seed in range(10):
+        picked = draw_planned_questions(recommender, plan, 4, np.random.default_rng(seed))
+
+        # Rewordings are skipped without counting toward the amount
+        assert len(picked) == 4
+        assert len(set(picked.tolist()) & {0, 1, 2}) == 1
+        assert {3, 4, 5} <= set(picked.tolist())
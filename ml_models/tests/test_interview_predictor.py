@@ -0,0 +1,76 @@
+import contextlib
+import io
+
+import numpy as np
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+from interview_predictor import SimpleInterviewPredictor
+
+
+def test_forests_are_pruned_on_validation_rows_and_scored_on_the_test_split(make_outcome_data, monkeypatch):
+    X, y = make_outcome_data()
+    predictor = SimpleInterviewPredictor()
+    pruning_rows = []
+    compact_forests = predictor.compact_forests
+
+    def spy(X_val_scaled, y_val, *args, **kwargs):
+        pruning_rows.append(X_val_scaled)
+        return compact_forests(X_val_scaled, y_val, *args, **kwargs)
+
+    monkeypatch.setattr(predictor, 'compact_forests', spy)
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = predictor.train_models(X, y, n_jobs=1, accuracy_tolerance=0.05)
+
+    # Same splits as train_models: test rows first, then validation rows out of the training rows
+    X_train, X_test, _, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    _, X_val = train_test_split(predictor.scaler.transform(X_train), test_size=0.2, random_state=42)
+    np.testing.assert_array_equal(pruning_rows[0], X_val)
+
+    assert predictor.compaction
+    for name, model in predictor.models.items():
+        y_pred = model.predict(predictor.scaler.transform(X_test))
+        assert results[name]['accuracy'] == accuracy_score(y_test, y_pred)
+        np.testing.assert_array_equal(results[name]['predictions'], y_pred)
+
+
+def test_batch_predictor_scores_forests_with_sklearn_and_linear_models_compiled(make_outcome_data, tmp_path):
+    from compiled_predictor import CompiledInterviewPredictor
+    from interview_predictor import load_batch_predictor
+
+    X, y = make_outcome_data()
+    predictor = SimpleInterviewPredictor()
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(X, y, n_jobs=1, compact=False)
+
+    model_path = str(tmp_path / 'interview_predictor.pkl')
+    expected = {'Random Forest': SimpleInterviewPredictor, 'Logistic Regression': CompiledInterviewPredictor}
+    for name, kind in expected.items():
+        predictor.best_model_name = name
+        predictor.best_model = predictor.models[name]
+        with contextlib.redirect_stdout(io.StringIO()):
+            predictor.save_model(model_path)
+        batch_predictor = load_batch_predictor(model_path)
+        assert isinstance(batch_predictor, kind)
+        assert batch_predictor.best_model_name == name
+
+
+def test_models_are_fitted_on_the_full_training_split_when_compacting(make_outcome_data):
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+
+    X, y = make_outcome_data()
+    predictor = SimpleInterviewPredictor()
+    # A negative tolerance prunes nothing, so the forest keeps its full-split fit too
+    with contextlib.redirect_stdout(io.StringIO()):
+        predictor.train_models(X, y, n_jobs=1, accuracy_tolerance=-1.0)
+
+    X_train, X_test, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train_scaled, X_test_scaled = predictor.scaler.transform(X_train), predictor.scaler.transform(X_test)
+    linear = LogisticRegression(random_state=42, max_iter=1000).fit(X_train_scaled, y_train)
+    forest = RandomForestClassifier(n_estimators=100, max_depth=10, random_state=42).fit(X_train_scaled, y_train)
+
+    assert predictor.compaction == {}
+    np.testing.assert_array_equal(predictor.models['Logistic Regression'].coef_, linear.coef_)
+    np.testing.assert_array_equal(predictor.models['Random Forest'].predict_proba(X_test_scaled),
+                                  forest.predict_proba(X_test_scaled))
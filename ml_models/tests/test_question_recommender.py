@@ -0,0 +1,114 @@
+import contextlib
+import io
+import threading
+
+import pandas as pd
+
+from generate_questions import clean_question_text
+
+BANK = [
+    ('How do you build a deployment pipeline (CI/CD).', 'Automate build, test and deploy stages on every commit.'),
+    ('When would you use useMemo/useCallback?', 'To memoize values and callbacks between renders.'),
+    ('Compare Dijkstra vs A* search.', 'A* adds a heuristic to guide the search toward the goal.'),
+    ('What is REST?', 'An architectural style for stateless resource APIs.'),
+]
+
+
+def _recommender(make_recommender):
+    return make_recommender([(question, answer, 'Back-end', 'Medium') for question, answer in BANK])
+
+
+def test_served_question_text_resolves_to_its_bank_row(make_recommender):
+    recommender = _recommender(make_recommender)
+    served = [clean_question_text(question) for question, _ in BANK]
+
+    # Serving strips '/', '*' and '\', so the texts differ from the bank
+    assert served[0] != BANK[0][0]
+
+    assert recommender.get_row_ids_for_question_texts(served).tolist() == [0, 1, 2, 3]
+
+
+def test_interviewer_wording_resolves_to_the_contained_question(make_recommender):
+    recommender = _recommender(make_recommender)
+
+    rows = recommender.get_row_ids_for_question_texts([
+        'Great, thanks. Next question: when would you use useMemo / useCallback?',
+        'Tell me about your weekend.',
+        'What is it?',
+    ])
+
+    assert rows.tolist() == [1, -1, -1]
+
+
+def test_score_answers_finds_served_questions(make_recommender):
+    recommender = _recommender(make_recommender)
+    pairs = [(clean_question_text(question), answer) for question, answer in BANK]
+
+    scores = recommender.score_answers(pairs)
+
+    assert all(score['question_found'] for score in scores)
+    assert all(score['similarity_score'] > 0.5 for score in scores)
+
+
+def _indexed_recommender(make_recommender, capsys):
+    recommender = _recommender(make_recommender)
+    recommender.train_semantic_index(n_components=2)
+    recommender.build_topic_clusters(n_topics=2)
+    capsys.readouterr()
+    return recommender
+
+
+def test_refit_writes_nothing_to_stdout(make_recommender, capsys):
+    recommender = _indexed_recommender(make_recommender, capsys)
+
+    recommender.add_questions([{'Question': 'What is a mutex?', 'Answer': 'A lock for one thread.',
+                                'Category': 'Back-end', 'Difficulty': 'Medium'}])
+    recommender.wait_for_refit()
+    recommender.refit_tfidf_model()
+
+    assert capsys.readouterr().out == ''
+    assert recommender.semantic_embeddings.shape[0] == 5
+    assert len(recommender.topic_ids) == len(recommender.questions_df) == 5
+
+
+def test_refit_builds_the_new_index_without_holding_the_lock(make_recommender, capsys, monkeypatch):
+    recommender = _indexed_recommender(make_recommender, capsys)
+    fit_semantic_index = recommender._fit_semantic_index
+    lock_free = []
+
+    def fit_while_probing(*args):
+        # Another thread (a reader) must be able to take the lock meanwhile
+        probe = threading.Thread(target=lambda: lock_free.append(recommender._lock.acquire(timeout=1)
+                                                                 and (recommender._lock.release() or True)))
+        probe.start()
+        probe.join()
+        return fit_semantic_index(*args)
+
+    monkeypatch.setattr(recommender, '_fit_semantic_index', fit_while_probing)
+    recommender.refit_tfidf_model()
+
+    assert lock_free == [True]
+
+
+def test_streamed_parquet_is_loaded_with_its_cleaned_text(tmp_path, monkeypatch):
+    from data_preprocessor import EnhancedDataPreprocessor
+    from question_recommender import SimpleQuestionRecommender
+
+    csv_path, parquet_path = tmp_path / 'questions.csv', tmp_path / 'questions.parquet'
+    pd.DataFrame(
+        [(number, question, answer, 'Back-end', 'Medium') for number, (question, answer) in enumerate(BANK, start=1)],
+        columns=['Question Number', 'Question', 'Answer', 'Category', 'Difficulty']
+    ).to_csv(csv_path, index=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        EnhancedDataPreprocessor().stream_questions_data(str(csv_path), str(parquet_path))
+
+    recommender = SimpleQuestionRecommender()
+    expected = [recommender._simple_text_cleaning(question) + ' ' + recommender._simple_text_cleaning(answer)
+                for question, answer in BANK]
+    # The streamed columns are used as they are, without cleaning row by row again
+    monkeypatch.setattr(recommender, '_simple_text_cleaning', None)
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert recommender.load_and_preprocess_questions(str(parquet_path))
+
+    assert recommender.questions_df['combined_text'].tolist() == expected
+    assert recommender.questions_df['Question Number'].tolist() == [1, 2, 3, 4]
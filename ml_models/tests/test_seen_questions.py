@@ -0,0 +1,48 @@
+import numpy as np
+
+from generate_questions import exclude_seen_questions
+from seen_questions import SeenQuestionStore
+
+QUESTIONS = [
+    ('What is a database index?', 'An index speeds up lookups on a table column.'),
+    ('How does TCP handle packet loss?', 'TCP retransmits segments that are not acknowledged.'),
+    ('What is a mutex?', 'A lock that allows one thread into a critical section.'),
+    ('Explain the virtual DOM in React.', 'React diffs a virtual DOM against the real DOM.'),
+    ('What is a closure?', 'A function that keeps the variables of its enclosing scope.'),
+]
+
+
+def _bank(make_recommender, questions=QUESTIONS):
+    return make_recommender([(question, answer, 'General', 'Medium') for question, answer in questions])
+
+
+def test_seen_questions_are_excluded_until_the_bank_is_exhausted(make_recommender, tmp_path):
+    recommender = _bank(make_recommender)
+    store = SeenQuestionStore(str(tmp_path))
+
+    store.mark_seen('user', [0, 1])
+    exclude_seen_questions(recommender, store, 'user', 3)
+    assert recommender.exclude_mask.tolist() == [True, True, False, False, False]
+
+    # Fewer than amount unseen: history starts over and nothing is excluded
+    store.mark_seen('user', [2])
+    exclude_seen_questions(recommender, store, 'user', 3)
+    assert recommender.exclude_mask is None
+    assert store.seen_count('user') == 0
+    assert SeenQuestionStore(str(tmp_path)).seen_count('user') == 0
+
+
+def test_seen_bits_survive_appended_rows_but_not_a_reordered_bank(make_recommender, tmp_path):
+    recommender = _bank(make_recommender)
+    store = SeenQuestionStore(str(tmp_path))
+    store.get_mask('user', len(recommender.questions_df), recommender.get_question_row_hashes())
+    store.mark_seen('user', [3])
+    store.merge('user')
+
+    grown = _bank(make_recommender, QUESTIONS + [('What is a deadlock?', 'Threads waiting on each other forever.')])
+    mask = SeenQuestionStore(str(tmp_path)).get_mask('user', 6, grown.get_question_row_hashes())
+    assert np.flatnonzero(mask).tolist() == [3]
+
+    reordered = _bank(make_recommender, QUESTIONS[::-1])
+    mask = SeenQuestionStore(str(tmp_path)).get_mask('user', 5, reordered.get_question_row_hashes())
+    assert not mask.any()
@@ -0,0 +1,57 @@
+import pytest
+
+from techstack_matcher import DEFAULT_CATEGORY, TechStackMatcher
+
+# Top category the substring-based mapping (before the phrase matcher) returned
+SUBSTRING_MAPPING = {
+    'Next.js': 'Front-end',
+    'ReactJS': 'Front-end',
+    'Golang': 'Back-end',
+    'APIs': 'Web Development',
+    'REST APIs': 'Web Development',
+    'Vue.js': 'Front-end',
+    'AngularJS': 'Front-end',
+    'React, Next.js, Node.js': 'Front-end',
+    'Go, MongoDB': 'Back-end',
+    'C#, .NET': 'Back-end',
+}
+
+
+@pytest.fixture(scope='module')
+def matcher():
+    return TechStackMatcher()
+
+
+@pytest.mark.parametrize('techstack, category', SUBSTRING_MAPPING.items())
+def test_common_spellings_keep_the_substring_mapping(matcher, techstack, category):
+    assert matcher.map_to_category(techstack) == category
+
+
+def test_nodejs_maps_to_back_end(matcher):
+    # The substring scan hit 'js' inside 'nodejs' first and returned Front-end
+    assert matcher.map_to_category('NodeJS') == 'Back-end'
+
+
+@pytest.mark.parametrize('techstack', ['Next.js', 'ReactJS', 'NodeJS', 'Golang', 'APIs'])
+def test_common_spellings_do_not_fall_back_to_default(matcher, techstack):
+    assert matcher.match_categories(techstack)
+    assert matcher.map_to_category(techstack) != DEFAULT_CATEGORY
+
+
+@pytest.mark.parametrize('techstack, tokens', [
+    ('Next.js', ['next', 'js']),
+    ('ReactJS', ['react']),
+    ('NodeJS', ['node']),
+    ('Golang', ['go']),
+    ('APIs', ['api']),
+    ('VueJS', ['vue', 'js']),
+    ('.NET, microservices', ['.net', 'microservices']),
+])
+def test_normalize_tokens(matcher, techstack, tokens):
+    assert matcher.normalize_tokens(techstack) == tokens
+
+
+def test_terms_still_match_on_word_boundaries(matcher):
+    assert matcher.match_categories('MongoDB') == {'Database and SQL': 1.0}
+    assert matcher.map_to_category('React Native') == 'Front-end'
+    assert [term for term, _ in matcher.find_terms('React Native')] == ['react native']
@@ -20,7 +20,9 @@ from speech_analyzer import SimpleSpeechAnalyzer
 class SimpleMLPipelineTrainer:
     """Simple ML Pipeline Trainer for all models"""
     
-    def __init__(self):
+    def __init__(self, search: bool = False):
+        # Cross-validated hyperparameter search instead of the fixed interview models
+        self.search = search
         self.data_preprocessor = EnhancedDataPreprocessor()
         self.interview_predictor = SimpleInterviewPredictor()
         self.question_recommender = SimpleQuestionRecommender()
@@ -30,6 +32,9 @@ class SimpleMLPipelineTrainer:
         self.models_dir = Path("trained_models")
         self.models_dir.mkdir(exist_ok=True)
         
+        # Preprocessed questions, streamed to Parquet chunk by chunk and read by the recommender
+        self.questions_parquet_path = None
+        
         print("Simple ML Pipeline Trainer Initialized")
     
     def train_all_models(self):
@@ -83,11 +88,13 @@ class SimpleMLPipelineTrainer:
         else:
             print(f"Base data file not found: {base_data_path}")
         
-        # Load and preprocess questions data
+        # Stream questions data to Parquet (one chunk in memory at a time)
         questions_data_path = "../dataset/Software Questions.csv"
         if os.path.exists(questions_data_path):
-            print(f"Loading questions data from {questions_data_path}")
-            self.data_preprocessor.questions_data = self.data_preprocessor.load_and_preprocess_questions_data(questions_data_path)
+            print(f"Streaming questions data from {questions_data_path}")
+            parquet_path = "temp_questions.parquet"
+            self.data_preprocessor.stream_questions_data(questions_data_path, parquet_path)
+            self.questions_parquet_path = parquet_path
             print("Questions data preprocessing completed")
         else:
             print(f"Questions data file not found: {questions_data_path}")
@@ -104,8 +111,8 @@ class SimpleMLPipelineTrainer:
                 print(f"Training with {X.shape[0]} samples and {X.shape[1]} features")
                 print(f"Target distribution: {y.value_counts().to_dict()}")
                 
-                # Train models
-                results = self.interview_predictor.train_models(X, y)
+                # Train models (importances, incl. parallel permutation importance, are computed once here)
+                results = self.interview_predictor.train_models(X, y, permutation_importance=True, search=self.search)
                 
                 print(f"Best model: {self.interview_predictor.best_model_name}")
                 print(f"Model performance: {results}")
@@ -119,26 +126,38 @@ class SimpleMLPipelineTrainer:
         print("Training Question Recommendation System...")
         
         # Get preprocessed questions
-        if hasattr(self.data_preprocessor, 'questions_data') and self.data_preprocessor.questions_data is not None:
-            questions_df = self.data_preprocessor.questions_data
-            print(f"Training with {len(questions_df)} questions")
-            
-            # Save questions to temporary file for the recommender to load
-            temp_questions_path = "temp_questions.csv"
-            questions_df.to_csv(temp_questions_path, index=False)
+        if self.questions_parquet_path is not None:
+            questions_info = self.data_preprocessor.preprocessing_info.get('questions_data', {})
+            print(f"Training with {questions_info.get('total_questions', 0)} questions")
             
-            # Load questions using the correct method
-            success = self.question_recommender.load_and_preprocess_questions(temp_questions_path)
+            # Load the streamed Parquet file
+            success = self.question_recommender.load_and_preprocess_questions(self.questions_parquet_path)
             
             if success:
                 # Train TF-IDF model
                 self.question_recommender.train_tfidf_model()
-                print("Question recommendation system trained")
                 
-                # Clean up temporary file
-                os.remove(temp_questions_path)
+                # Train LSA semantic index on top of TF-IDF
+                self.question_recommender.train_semantic_index()
+                
+                # Vectorize reference answers separately for answer scoring
+                self.question_recommender.train_answer_index()
+                
+                # Cluster reworded duplicates so selection can keep one per cluster
+                self.question_recommender.build_duplicate_clusters()
+                
+                # Group questions into topics for topic-balanced sampling
+                self.question_recommender.build_topic_clusters()
+                
+                # Materialize per-bucket question pools for fast sampling
+                self.question_recommender.build_question_pools(seed=42)
+                print("Question recommendation system trained")
             else:
                 print("Failed to load questions into recommender")
+            
+            # Clean up temporary file
+            os.remove(self.questions_parquet_path)
+            self.questions_parquet_path = None
         else:
             print("No questions data available for training")
     
@@ -184,7 +203,7 @@ class SimpleMLPipelineTrainer:
         summary = {
             'data_preprocessor': {
                 'base_data_shape': self.data_preprocessor.base_data.shape if hasattr(self.data_preprocessor, 'base_data') and self.data_preprocessor.base_data is not None else None,
-                'questions_data_shape': self.data_preprocessor.questions_data.shape if hasattr(self.data_preprocessor, 'questions_data') and self.data_preprocessor.questions_data is not None else None
+                'questions_count': self.data_preprocessor.preprocessing_info.get('questions_data', {}).get('total_questions')
             },
             'interview_predictor': {
                 'best_model': self.interview_predictor.best_model_name if hasattr(self.interview_predictor, 'best_model_name') else None,
@@ -204,11 +223,11 @@ class SimpleMLPipelineTrainer:
         return summary
 
 def main():
-    """Main training function"""
+    """Main training function (--search: hyperparameter search for the interview predictor)"""
     print("Starting Simple ML Pipeline Training...")
     
     # Initialize trainer
-    trainer = SimpleMLPipelineTrainer()
+    trainer = SimpleMLPipelineTrainer(search='--search' in sys.argv[1:])
     
     # Train all models
     trainer.train_all_models()